@@ -0,0 +1,203 @@
+"""Batch transform API routes for processing many workbooks at once."""
+
+import asyncio
+import multiprocessing
+import os
+import shutil
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+
+from backend.api.routes_transform import execute_transform
+from backend.core.config import settings
+from backend.core.logging import ETLLogger, logger
+from backend.models.schemas import (
+    BatchJobResult,
+    BatchTransformRequest,
+    BatchTransformResponse,
+    TransformRequest,
+    TransformResponse,
+)
+from backend.services.cancellation import CancelToken, JobCancelled
+from backend.services.storage import DataStorage
+
+router = APIRouter()
+
+
+@router.post("/transform/batch", response_model=BatchTransformResponse)
+async def transform_batch(request: BatchTransformRequest):
+    """
+    Run the ETL transformation for several uploaded workbooks in parallel.
+
+    Each job runs in its own worker process and writes to its own folder under
+    BATCH_OUTPUT_FOLDER/<batch_id>, so a failing job does not affect the others.
+
+    Args:
+        request: Batch request with one transform request per workbook
+
+    Returns:
+        BatchTransformResponse, also written as the batch manifest.json
+    """
+    start_time = time.time()
+
+    # Reject malformed batches before any worker is started
+    for index, job in enumerate(request.jobs):
+        try:
+            uuid.UUID(job.file_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid file ID format in job {index}"
+            )
+
+        if not (settings.upload_folder_path / f"{job.file_id}.xlsx").exists():
+            raise HTTPException(
+                status_code=404, detail=f"File not found for job {index}"
+            )
+
+    batch_id = uuid.uuid4().hex
+    batch_folder = settings.batch_output_folder_path / batch_id
+    workers = min(settings.batch_workers or os.cpu_count() or 1, len(request.jobs))
+
+    logger.info(
+        "Starting batch transformation",
+        batch_id=batch_id,
+        jobs=len(request.jobs),
+        workers=workers,
+    )
+
+    try:
+        output_folders = [
+            batch_folder / f"{index:03d}_{job.file_id}"
+            for index, job in enumerate(request.jobs)
+        ]
+
+        loop = asyncio.get_running_loop()
+        # Spawned, not forked: the server process holds threads and locks
+        # (cache writers, profile refiners) that a forked child would inherit
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            outcomes = await asyncio.gather(
+                *[
+                    loop.run_in_executor(
+                        pool, _run_batch_job, job.model_dump_json(), str(folder)
+                    )
+                    for job, folder in zip(request.jobs, output_folders)
+                ],
+                return_exceptions=True,
+            )
+
+        jobs = []
+        for job, folder, outcome in zip(request.jobs, output_folders, outcomes):
+            if isinstance(outcome, BaseException):
+                # The worker process itself died (e.g. out of memory)
+                outcome = _job_result(job, folder, 0.0, error=str(outcome))
+            jobs.append(outcome)
+
+        consolidated_artifacts = []
+        if request.consolidate:
+            sources = {
+                f"{index:03d}_{job.file_id}": Path(job.output_folder)
+                for index, job in enumerate(jobs)
+                if job.success
+            }
+            if sources:
+                storage = DataStorage(ETLLogger(), batch_folder / "consolidated")
+                # Consolidation reads and rewrites every output; keep it off the
+                # event loop so progress streams and other requests stay live
+                consolidated_artifacts = await loop.run_in_executor(
+                    None, storage.save_consolidated_parquet, sources
+                )
+
+        manifest_path = batch_folder / "manifest.json"
+        response = BatchTransformResponse(
+            batch_id=batch_id,
+            success=all(job.success for job in jobs),
+            jobs=jobs,
+            consolidated_artifacts=consolidated_artifacts,
+            manifest_path=str(manifest_path),
+            processing_time_seconds=round(time.time() - start_time, 2),
+        )
+
+        batch_folder.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(response.model_dump_json(indent=2), encoding="utf-8")
+
+        logger.info(
+            "Batch transformation complete",
+            batch_id=batch_id,
+            succeeded=sum(job.success for job in jobs),
+            failed=sum(not job.success for job in jobs),
+            processing_time=response.processing_time_seconds,
+        )
+
+        return response
+
+    except Exception as e:
+        logger.error("Batch transformation failed", batch_id=batch_id, error=str(e))
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error during batch transformation: {str(e)}",
+        )
+
+
+def _run_batch_job(job_json: str, output_folder: str) -> BatchJobResult:
+    """Worker process entry point: run one transform into its own folder."""
+    start_time = time.time()
+    job = TransformRequest.model_validate_json(job_json)
+
+    # Batch jobs always write outputs, since the manifest points at them
+    job.options.dry_run = False
+
+    etl_logger = ETLLogger()
+    folder = Path(output_folder)
+    upload_path = settings.upload_folder_path / f"{job.file_id}.xlsx"
+
+    # Each worker process applies the per-job time and memory budgets itself
+    cancel_token = CancelToken(
+        folder.name,
+        timeout_seconds=settings.transform_timeout_seconds,
+        memory_limit_bytes=settings.transform_memory_limit_bytes,
+    )
+
+    try:
+        storage = DataStorage(etl_logger, folder)
+        response = execute_transform(
+            job, upload_path, storage, etl_logger, start_time, cancel_token=cancel_token
+        )
+    except JobCancelled as e:
+        shutil.rmtree(folder, ignore_errors=True)
+        return _job_result(job, folder, start_time, error=str(e))
+    except HTTPException as e:
+        return _job_result(job, folder, start_time, error=str(e.detail))
+    except Exception as e:
+        etl_logger.error("Batch job failed", file_id=job.file_id, error=str(e))
+        return _job_result(job, folder, start_time, error=str(e))
+
+    return _job_result(job, folder, start_time, response=response)
+
+
+def _job_result(
+    job: TransformRequest,
+    folder: Path,
+    start_time: float,
+    response: Optional[TransformResponse] = None,
+    error: Optional[str] = None,
+) -> BatchJobResult:
+    """Build the manifest entry of one job."""
+    return BatchJobResult(
+        file_id=job.file_id,
+        master_sheet=job.master_sheet,
+        status_sheet=job.status_sheet,
+        success=response is not None,
+        output_folder=str(folder),
+        artifacts=response.artifacts if response else [],
+        summary=response.summary if response else None,
+        error=error,
+        processing_time_seconds=(
+            round(time.time() - start_time, 2) if start_time else 0.0
+        ),
+    )
@@ -3,21 +3,128 @@
 import uuid
 from pathlib import Path
 
+import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
 
 from backend.core.config import settings
 from backend.core.logging import logger
 from backend.models.schemas import ProfileResponse
 from backend.services.excel_reader import ExcelReader
-from backend.services.profiler import DataProfiler
+from backend.services.profile_cache import profile_cache
+from backend.services.profile_refiner import profile_refiner
+from backend.services.profiler import (
+    SAMPLE_BLOCK_COUNT,
+    SAMPLE_BLOCK_SIZE,
+    SAMPLE_HEAD_ROWS,
+    SAMPLE_TAIL_ROWS,
+    DataProfiler,
+    stratified_positions,
+)
 
 router = APIRouter()
 
 
+def _get_sheet_profile(
+    excel_reader: ExcelReader, upload_path: Path, sheet: str, mode: str
+) -> ProfileResponse:
+    """Return a sheet profile from the cache, profiling and caching it on a miss."""
+    cache_key = profile_cache.make_key(
+        profile_cache.content_hash(upload_path), sheet, mode
+    )
+
+    cached_profile = profile_cache.get(cache_key)
+    if cached_profile is not None:
+        logger.info("Serving cached sheet profile", sheet=sheet, mode=mode)
+        return cached_profile
+
+    # Read the sheet data
+    df = excel_reader.read_sheet(sheet)
+
+    profile_result = _profile_frame(df, sheet, mode)
+    profile_cache.put(cache_key, profile_result)
+
+    return profile_result
+
+
+def _profile_frame(df: pd.DataFrame, sheet: str, mode: str) -> ProfileResponse:
+    """Profile already loaded sheet data in the requested mode."""
+    approximate = mode == "approximate" or (
+        mode == "auto" and len(df) > settings.large_dataset_threshold
+    )
+    profiler = DataProfiler(df, sheet, approximate=approximate)
+    return profiler.profile_sheet()
+
+
+def _get_progressive_profile(
+    excel_reader: ExcelReader, upload_path: Path, sheet: str
+) -> ProfileResponse:
+    """
+    Return the full profile if ready, otherwise a sampled estimate.
+
+    The first request reads and profiles only a stratified sample of the
+    rows, and a background thread reads the full sheet and computes its
+    ("auto") profile into the profile cache. Repeating the request returns the
+    estimate with refinement_status "running" until the full profile is
+    available. If the refinement fails, the next request gets the estimate
+    once with refinement_status "failed", and the request after that starts
+    a new refinement.
+    """
+    cache_key = profile_cache.make_key(
+        profile_cache.content_hash(upload_path), sheet, "auto"
+    )
+
+    # Check refinements first: a successful one has already been cached, a
+    # running or failed one returns the estimate with its status
+    estimate = profile_refiner.get(cache_key)
+    if estimate is not None:
+        return estimate
+
+    cached_profile = profile_cache.get(cache_key)
+    if cached_profile is not None:
+        return cached_profile
+
+    sample_size = SAMPLE_HEAD_ROWS + SAMPLE_TAIL_ROWS
+    sample_size += SAMPLE_BLOCK_COUNT * SAMPLE_BLOCK_SIZE
+    row_count = excel_reader.count_rows(sheet)
+    if row_count is None or row_count <= sample_size:
+        # Small sheets are cheaper to profile fully than to sample
+        profile_result = _profile_frame(excel_reader.read_sheet(sheet), sheet, "auto")
+        profile_cache.put(cache_key, profile_result)
+        return profile_result
+
+    sample, total_rows = excel_reader.read_sheet_rows(
+        sheet, stratified_positions(row_count)
+    )
+    estimate = DataProfiler(sample, sheet).profile_sampled(total_rows=total_rows)
+
+    def refine() -> None:
+        # The request's reader is closed by then; the job opens its own
+        refine_reader = ExcelReader(upload_path)
+        try:
+            df = refine_reader.read_sheet(sheet)
+        finally:
+            refine_reader.close()
+        profile_cache.put(cache_key, _profile_frame(df, sheet, "auto"))
+        logger.info("Background sheet profile ready", sheet=sheet)
+
+    profile_refiner.submit(cache_key, estimate, refine)
+
+    return estimate.model_copy(update={"refinement_status": "running"})
+
+
 @router.get("/profile", response_model=ProfileResponse)
-async def profile_sheet(
+def profile_sheet(
     file_id: str = Query(..., description="File ID from upload"),
     sheet: str = Query(..., description="Sheet name to profile"),
+    mode: str = Query(
+        "exact",
+        pattern="^(auto|exact|approximate|progressive)$",
+        description=(
+            "exact (default), approximate (sketches), auto by sheet size, or "
+            "progressive (sampled estimate first, full profile on a later "
+            "request)"
+        ),
+    ),
 ):
     """
     Profile a sheet for data quality analysis.
@@ -25,6 +132,11 @@ async def profile_sheet(
     Args:
         file_id: ID of the uploaded file
         sheet: Name of the sheet to profile
+        mode: "exact" (the default) counts every value; "approximate" uses
+            HyperLogLog/KLL sketches; "auto" does so only above
+            LARGE_DATASET_THRESHOLD rows; "progressive" answers with a
+            sampled estimate (is_estimate=true) while the "auto" profile is
+            computed in the background, and clients poll until it is returned
 
     Returns:
         ProfileResponse with data quality metrics
@@ -54,15 +166,21 @@ async def profile_sheet(
             if sheet not in available_sheets:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Sheet '{sheet}' not found. Available sheets: {available_sheets}",
+                    detail=(
+                        f"Sheet '{sheet}' not found. "
+                        f"Available sheets: {available_sheets}"
+                    ),
                 )
 
-            # Read the sheet data
-            df = excel_reader.read_sheet(sheet)
-
-            # Create profiler and analyze
-            profiler = DataProfiler(df, sheet)
-            profile_result = profiler.profile_sheet()
+            # Profile the sheet (served from cache when already profiled)
+            if mode == "progressive":
+                profile_result = _get_progressive_profile(
+                    excel_reader, upload_path, sheet
+                )
+            else:
+                profile_result = _get_sheet_profile(
+                    excel_reader, upload_path, sheet, mode
+                )
 
             logger.info(
                 "Sheet profiling completed",
@@ -71,6 +189,8 @@ async def profile_sheet(
                 rows=profile_result.total_rows,
                 cols=profile_result.total_cols,
                 duplicates=profile_result.duplicate_rows,
+                mode=profile_result.profile_mode,
+                estimate=profile_result.is_estimate,
             )
 
             return profile_result
@@ -92,10 +212,17 @@ async def profile_sheet(
 
 
 @router.get("/profile/{file_id}/compare")
-async def compare_sheets(
+def compare_sheets(
     file_id: str,
     sheet1: str = Query(..., description="First sheet to compare"),
     sheet2: str = Query(..., description="Second sheet to compare"),
+    mode: str = Query(
+        "exact",
+        pattern="^(auto|exact|approximate)$",
+        description=(
+            "Profiling mode, shared with /profile so cached profiles are reused"
+        ),
+    ),
 ):
     """
     Compare two sheets for compatibility analysis.
@@ -104,6 +231,7 @@ async def compare_sheets(
         file_id: ID of the uploaded file
         sheet1: Name of the first sheet
         sheet2: Name of the second sheet
+        mode: Profiling mode used for both sheets
 
     Returns:
         Comparison analysis between the two sheets
@@ -136,18 +264,15 @@ async def compare_sheets(
                 if sheet not in available_sheets:
                     raise HTTPException(
                         status_code=400,
-                        detail=f"Sheet '{sheet}' not found. Available sheets: {available_sheets}",
+                        detail=(
+                            f"Sheet '{sheet}' not found. "
+                            f"Available sheets: {available_sheets}"
+                        ),
                     )
 
-            # Profile both sheets
-            df1 = excel_reader.read_sheet(sheet1)
-            df2 = excel_reader.read_sheet(sheet2)
-
-            profiler1 = DataProfiler(df1, sheet1)
-            profiler2 = DataProfiler(df2, sheet2)
-
-            profile1 = profiler1.profile_sheet()
-            profile2 = profiler2.profile_sheet()
+            # Profile both sheets (reusing cached profiles from /profile)
+            profile1 = _get_sheet_profile(excel_reader, upload_path, sheet1, mode)
+            profile2 = _get_sheet_profile(excel_reader, upload_path, sheet2, mode)
 
             # Compare profiles
             comparison = {
@@ -0,0 +1,105 @@
+"""Progress API routes serving transform progress from the in-process event bus."""
+
+import json
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+
+from backend.models.schemas import ProgressEvent
+from backend.services.progress import progress_bus
+
+router = APIRouter()
+
+# Without events for this long the overall status falls back to idle
+IDLE_AFTER = timedelta(minutes=5)
+
+
+@router.get("/progress/status")
+async def get_progress_status(job_id: Optional[str] = None):
+    """
+    Get the current ETL progress status.
+
+    Reads the most recent event of the given job, or of any job, from memory.
+
+    Args:
+        job_id: Job ID or file ID to report on; the latest job when omitted
+
+    Returns:
+        Progress, status, operation, description and last activity
+    """
+    event = progress_bus.latest(job_id)
+
+    if event is None or datetime.now() - event.timestamp > IDLE_AFTER:
+        return {
+            "progress": 0,
+            "status": "idle",
+            "operation": "System Ready",
+            "description": "Waiting for ETL operations...",
+            "last_activity": None,
+            "job_id": None,
+        }
+
+    return {
+        "progress": event.progress,
+        "status": event.status,
+        "operation": event.operation,
+        "description": event.description,
+        "last_activity": event.timestamp.isoformat(),
+        "job_id": event.job_id,
+    }
+
+
+@router.get("/progress/{job_id}", response_model=ProgressEvent)
+async def get_job_progress(job_id: str):
+    """
+    Polling fallback: latest progress event of a job.
+
+    Args:
+        job_id: Job ID, or file ID for the latest job on that file
+
+    Returns:
+        The latest ProgressEvent
+    """
+    event = progress_bus.latest(job_id)
+    if event is None:
+        raise HTTPException(status_code=404, detail="No progress for this job")
+
+    return event
+
+
+@router.get("/progress/{job_id}/events")
+async def stream_job_progress(
+    job_id: str, last_event_id: Optional[int] = Header(default=None)
+):
+    """
+    Stream the progress events of a job as Server-Sent Events.
+
+    Buffered events are replayed first, so a client may subscribe before
+    posting the transform with the same job_id. The stream closes after the
+    complete, error or cancelled event. Reconnecting clients resume after
+    Last-Event-ID.
+
+    Args:
+        job_id: Job ID, or file ID for the jobs run on that file
+        last_event_id: Sequence number of the last event the client received
+
+    Returns:
+        text/event-stream response
+    """
+
+    async def events():
+        async for event in progress_bus.subscribe(job_id, after=last_event_id or 0):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            data = json.dumps(event.model_dump(mode="json"))
+            yield f"id: {event.sequence}\nevent: progress\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
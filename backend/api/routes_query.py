@@ -0,0 +1,89 @@
+"""Query API routes for read-only SQL over processed outputs."""
+
+import pyarrow as pa
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+
+from backend.core.config import settings
+from backend.core.logging import logger
+from backend.models.schemas import QueryRequest, QueryResponse
+from backend.services.query_engine import (
+    QueryEngine,
+    QueryError,
+    QueryTimeoutError,
+    arrow_to_records,
+)
+
+router = APIRouter()
+
+
+@router.get("/query/tables")
+def list_query_tables():
+    """
+    List the processed tables that can be referenced in queries.
+
+    Returns:
+        Table names available as views in /api/query
+    """
+    tables = QueryEngine().list_tables()
+    return {"tables": list(tables.keys()), "count": len(tables)}
+
+
+@router.post("/query", response_model=QueryResponse)
+def run_query(request: QueryRequest):
+    """
+    Run a read-only SQL query over the processed Parquet outputs.
+
+    Args:
+        request: Query request with SQL, row limit, timeout and result format
+
+    Returns:
+        QueryResponse as JSON, or an Arrow IPC stream when format is "arrow"
+    """
+    limit = min(request.limit, settings.query_max_rows)
+    timeout_seconds = min(
+        request.timeout_seconds or settings.query_timeout_seconds,
+        settings.query_timeout_seconds,
+    )
+
+    try:
+        engine = QueryEngine()
+        result, truncated, elapsed_ms = engine.execute(
+            request.sql, limit=limit, timeout_seconds=timeout_seconds
+        )
+
+    except QueryTimeoutError as e:
+        raise HTTPException(status_code=408, detail=str(e))
+
+    except QueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        logger.error("Error during query execution", error=str(e))
+
+        raise HTTPException(
+            status_code=500, detail=f"Internal server error during query: {str(e)}"
+        )
+
+    if request.format == "arrow":
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, result.schema) as writer:
+            writer.write_table(result)
+
+        return Response(
+            content=sink.getvalue().to_pybytes(),
+            media_type="application/vnd.apache.arrow.stream",
+            headers={
+                "X-Row-Count": str(result.num_rows),
+                "X-Truncated": str(truncated).lower(),
+                "X-Elapsed-Ms": f"{elapsed_ms:.2f}",
+            },
+        )
+
+    return QueryResponse(
+        columns=result.column_names,
+        rows=arrow_to_records(result),
+        row_count=result.num_rows,
+        truncated=truncated,
+        elapsed_ms=round(elapsed_ms, 2),
+    )
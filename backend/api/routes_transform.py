@@ -1,9 +1,12 @@
 """Transform API routes for ETL processing."""
 
+import functools
+import json
+import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 import pandas as pd
 from fastapi import APIRouter, HTTPException
@@ -12,26 +15,81 @@ from backend.core.config import settings
 from backend.core.logging import ETLLogger, logger
 from backend.models.schemas import (
     ArtifactInfo,
+    TablePreview,
+    TransformOptions,
     TransformRequest,
     TransformResponse,
     TransformSummary,
 )
 from backend.services.cleaning import create_dim_dates, detect_date_columns
-from backend.services.excel_reader import ExcelReader
+from backend.services.excel_reader import ColumnProjection, ExcelReader
+from backend.services.cancellation import CancelToken, JobCancelled, job_registry
+from backend.services.incremental import MASTERBOM_TABLES, IncrementalTransform
 from backend.services.masterbom_rules import MasterBOMProcessor
+from backend.services.profile_cache import profile_cache
+from backend.services.progress import progress_bus
+from backend.services.stage_pipeline import (
+    CHECKPOINT_INTERVAL,
+    StagePipeline,
+    stage_memo,
+)
 from backend.services.status_processor_v2 import StatusProcessorV2
 from backend.services.storage import DataStorage
+from backend.services.transform_cache import transform_cache
 
 # Pipeline service removed - manual ETL only
 
 router = APIRouter()
 
+# Tables written by the storage stage, in output order
+OUTPUT_TABLES = list(MASTERBOM_TABLES) + [
+    "status_clean",
+    "project_completion_by_plant",
+    "dim_dates",
+    "date_role_bridge",
+]
+
+# Operation and description published for each progress status
+PROGRESS_STEPS = {
+    "queued": ("Queued", "Waiting for the running transformation to finish..."),
+    "reading": ("Reading Sheets", "Loading Excel sheets..."),
+    "masterbom_processing": (
+        "Processing MasterBOM",
+        "Cleaning and transforming master data...",
+    ),
+    "status_processing": ("Processing Status", "Processing status sheet data..."),
+    "date_processing": ("Creating Date Dimension", "Building the date dimension..."),
+    "saving": ("Writing Files", "Saving processed data..."),
+    "complete": ("Complete", "ETL process completed successfully!"),
+    "error": ("Error Occurred", "An error occurred during processing."),
+    "cancelled": ("Cancelled", "The transformation was stopped."),
+}
+
+# Progress status published when each pipeline stage starts
+STAGE_STATUS = {
+    "read_master": "reading",
+    "read_status": "reading",
+    "masterbom": "masterbom_processing",
+    "status": "status_processing",
+    "dim_dates": "date_processing",
+    "storage": "saving",
+    "dictionary": "saving",
+}
+
+# Runs share the processed folder, so only one writes to it at a time
+_processed_folder_lock = threading.Lock()
+
 
 @router.post("/transform", response_model=TransformResponse)
-async def transform_data(request: TransformRequest):
+def transform_data(request: TransformRequest):
     """
     Run ETL transformation on uploaded Excel file.
 
+    Declared without async so FastAPI runs it in its thread pool and progress
+    requests are still served while it works. Progress is published under the
+    job ID (request.job_id or a generated one) and the file ID; the job can be
+    cancelled with DELETE /transform/{job_id}.
+
     Args:
         request: Transform request with file_id, sheet selections, and options
 
@@ -40,6 +98,12 @@ async def transform_data(request: TransformRequest):
     """
     start_time = time.time()
     etl_logger = ETLLogger()
+    job_id = request.job_id or uuid.uuid4().hex
+
+    try:
+        cancel_token = job_registry.start(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
     try:
         # Validate file_id format
@@ -59,225 +123,650 @@ async def transform_data(request: TransformRequest):
             file_id=request.file_id,
             master_sheet=request.master_sheet,
             status_sheet=request.status_sheet,
+            dry_run=request.options.dry_run,
         )
 
-        # Clear previous processed files to ensure fresh ETL run
-        storage = DataStorage(etl_logger)
-        storage.clear_processed_files()
+        # Dry runs write nothing, so they skip the cache and the folder lock
+        if request.options.dry_run:
+            response = execute_transform(
+                request,
+                upload_path,
+                DataStorage(etl_logger),
+                etl_logger,
+                start_time,
+                job_id=job_id,
+                cancel_token=cancel_token,
+            )
+            _publish_progress(job_id, request.file_id, "complete", 100)
+            return response
 
-        # Create Excel reader
-        excel_reader = ExcelReader(upload_path)
+        cache_key = None
+        if settings.transform_cache_enabled:
+            cache_key = transform_cache.make_key(
+                profile_cache.content_hash(upload_path),
+                request.master_sheet,
+                request.status_sheet,
+                request.options,
+            )
 
+        # Queued jobs can be cancelled (or time out) while they wait
+        if not _processed_folder_lock.acquire(blocking=False):
+            _publish_progress(job_id, request.file_id, "queued", 0)
+            while not _processed_folder_lock.acquire(timeout=CHECKPOINT_INTERVAL):
+                cancel_token.check()
+
+        storage = DataStorage(etl_logger)
         try:
-            # Validate sheet names
-            available_sheets = excel_reader.get_sheet_names()
+            # Clear previous processed files to ensure fresh ETL run
+            storage.clear_processed_files()
 
-            if request.master_sheet not in available_sheets:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Master sheet '{request.master_sheet}' not found",
+            # A repeat of an earlier run gets its stored response and artifacts back
+            if cache_key:
+                cached_response = transform_cache.get(
+                    cache_key, storage.processed_folder
                 )
+                if cached_response is not None:
+                    etl_logger.info(
+                        "Returning cached transform result", cache_key=cache_key
+                    )
+                    cached_response.cached = True
+                    cached_response.job_id = job_id
+                    _publish_progress(job_id, request.file_id, "complete", 100)
+                    return cached_response
+
+            response = execute_transform(
+                request,
+                upload_path,
+                storage,
+                etl_logger,
+                start_time,
+                job_id=job_id,
+                cancel_token=cancel_token,
+            )
 
-            if request.status_sheet not in available_sheets:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Status sheet '{request.status_sheet}' not found",
-                )
+            if cache_key:
+                transform_cache.put(cache_key, response, storage.processed_folder)
 
-            # Read sheets
-            etl_logger.info("Reading Excel sheets")
+        except JobCancelled:
+            # Remove whatever the stopped run had already written
+            storage.clear_processed_files()
+            raise
 
-            master_df = excel_reader.read_sheet(request.master_sheet)
-            status_df = excel_reader.read_sheet(request.status_sheet)
+        finally:
+            _processed_folder_lock.release()
 
-            etl_logger.info(
-                "Sheets loaded successfully",
-                master_rows=len(master_df),
-                master_cols=len(master_df.columns),
-                status_rows=len(status_df),
-                status_cols=len(status_df.columns),
-            )
+        _publish_progress(job_id, request.file_id, "complete", 100)
 
-            # Process MasterBOM sheet
-            etl_logger.info("=== STARTING MASTERBOM PROCESSING ===")
-            etl_logger.info(
-                "Processing MasterBOM sheet",
-                input_rows=len(master_df),
-                input_cols=len(master_df.columns),
-                id_col=request.options.id_col,
-                date_cols=request.options.date_cols,
-            )
+        return response
 
-            master_processor = MasterBOMProcessor(master_df, etl_logger)
-            master_results = master_processor.process(
-                id_col=request.options.id_col, date_cols=request.options.date_cols
-            )
+    except HTTPException as e:
+        etl_logger.error("ETL transformation failed with HTTP error")
+        _publish_progress(
+            job_id, request.file_id, "error", 0, description=str(e.detail)
+        )
+        raise
 
-            etl_logger.info(
-                "=== MASTERBOM PROCESSING COMPLETE ===",
-                output_tables=len(master_results),
-                table_names=list(master_results.keys()),
-            )
+    except JobCancelled as e:
+        etl_logger.warning("ETL transformation stopped", reason=e.reason)
+        _publish_progress(job_id, request.file_id, "cancelled", 0, description=str(e))
 
-            # Process Status sheet
-            etl_logger.info("=== STARTING STATUS SHEET PROCESSING ===")
-            etl_logger.info(
-                "Processing Status sheet",
-                input_rows=len(status_df),
-                input_cols=len(status_df.columns),
-            )
+        logger.info(
+            "ETL transformation stopped",
+            file_id=request.file_id,
+            job_id=job_id,
+            reason=e.reason,
+        )
 
-            status_processor = StatusProcessorV2(status_df, etl_logger)
-            status_results = status_processor.process()
-            status_clean = status_results["status_clean"]
-            project_completion = status_results["project_completion_by_plant"]
+        return _failed_response(etl_logger, start_time, str(e), job_id)
 
-            etl_logger.info(
-                "=== STATUS SHEET PROCESSING COMPLETE ===",
-                status_clean_rows=len(status_clean),
-                project_completion_rows=len(project_completion),
-            )
+    except Exception as e:
+        etl_logger.error(
+            "ETL transformation failed with unexpected error", error=str(e)
+        )
+        _publish_progress(job_id, request.file_id, "error", 0, description=str(e))
 
-            # Create date dimension from all date columns
-            etl_logger.info("=== STARTING DATE DIMENSION CREATION ===")
-            etl_logger.info("Creating date dimension")
+        logger.error(
+            "Unexpected error during ETL transformation",
+            file_id=request.file_id,
+            error=str(e),
+        )
 
-            date_columns = []
-            date_column_names = []
+        return _failed_response(etl_logger, start_time, str(e), job_id)
 
-            # Collect date columns from MasterBOM
-            etl_logger.info(
-                "Collecting specified date columns",
-                specified_cols=request.options.date_cols,
-            )
-            for col in request.options.date_cols:
-                if col in master_df.columns:
-                    date_columns.append(master_df[col])
-                    date_column_names.append(col)
-                    etl_logger.info(f"Added specified date column: {col}")
-
-            # Auto-detect additional date columns
-            etl_logger.info("Auto-detecting additional date columns")
-            auto_date_cols = detect_date_columns(master_df)
-
-            # Filter out excluded date columns
-            if request.options.excluded_date_cols:
-                etl_logger.info(
-                    "Excluding specified date columns",
-                    excluded=request.options.excluded_date_cols,
-                )
-                auto_date_cols = [
-                    col
-                    for col in auto_date_cols
-                    if col not in request.options.excluded_date_cols
-                ]
-
-            etl_logger.info("Auto-detected date columns", detected_cols=auto_date_cols)
-
-            for col in auto_date_cols:
-                if col not in date_column_names and col in master_df.columns:
-                    date_columns.append(master_df[col])
-                    date_column_names.append(col)
-                    etl_logger.info(f"Added auto-detected date column: {col}")
-
-            etl_logger.info(
-                "Final date columns for dimension",
-                total_columns=len(date_column_names),
-                column_names=date_column_names,
-            )
+    finally:
+        job_registry.finish(job_id)
 
-            dim_dates, date_role_bridge = create_dim_dates(
-                date_columns, date_column_names
-            )
 
-            etl_logger.info(
-                "=== DATE DIMENSION CREATION COMPLETE ===",
-                dim_dates_rows=len(dim_dates),
-                date_bridge_rows=len(date_role_bridge),
+@router.delete("/transform/{job_id}", status_code=202)
+async def cancel_transform(job_id: str):
+    """
+    Cancel a running or queued transform job.
+
+    The job stops at its next checkpoint, removes its partial outputs and
+    publishes a "cancelled" progress event; its POST returns success=False.
+
+    Args:
+        job_id: Job ID given in (or returned for) the transform request
+
+    Returns:
+        Confirmation that cancellation was requested
+    """
+    if not job_registry.cancel(job_id):
+        raise HTTPException(
+            status_code=404, detail="No running transformation with this job ID"
+        )
+
+    logger.info("Transform cancellation requested", job_id=job_id)
+
+    return {
+        "job_id": job_id,
+        "status": "cancelling",
+        "message": "The transformation stops at its next checkpoint",
+    }
+
+
+def _failed_response(
+    etl_logger: ETLLogger, start_time: float, error: str, job_id: str
+) -> TransformResponse:
+    """Response for a run that failed or was stopped before producing outputs."""
+    return TransformResponse(
+        success=False,
+        artifacts=[],
+        summary=TransformSummary(
+            total_parts=0,
+            active_parts=0,
+            inactive_parts=0,
+            new_parts=0,
+            duplicate_parts=0,
+            plants_detected=0,
+            duplicates_removed=0,
+            date_columns_processed=[],
+            processing_time_seconds=time.time() - start_time,
+        ),
+        messages=etl_logger.get_messages(),
+        error=error,
+        job_id=job_id,
+    )
+
+
+def execute_transform(
+    request: TransformRequest,
+    upload_path: Path,
+    storage: DataStorage,
+    etl_logger: ETLLogger,
+    start_time: float,
+    job_id: Optional[str] = None,
+    cancel_token: Optional[CancelToken] = None,
+) -> TransformResponse:
+    """
+    Run the transform stages for one workbook and build the response.
+
+    Args:
+        request: Transform request with sheet selections and options
+        upload_path: Path of the uploaded workbook
+        storage: Storage service writing the artifacts
+        etl_logger: Logger collecting the run's messages
+        start_time: time.time() at the start of the request
+        job_id: Job to publish stage progress under; None publishes nothing
+        cancel_token: Token checked between stages and in MasterBOM loops
+
+    Returns:
+        TransformResponse for a successful run
+    """
+    # Validate sheet names
+    excel_reader = ExcelReader(upload_path)
+    try:
+        available_sheets = excel_reader.get_sheet_names()
+    finally:
+        excel_reader.close()
+
+    if request.master_sheet not in available_sheets:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Master sheet '{request.master_sheet}' not found",
+        )
+
+    if request.status_sheet not in available_sheets:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Status sheet '{request.status_sheet}' not found",
+        )
+
+    checkpoint = cancel_token.check if cancel_token else None
+    dry_run = request.options.dry_run
+    pipeline = _build_transform_pipeline(
+        etl_logger, storage, request.options, checkpoint=checkpoint
+    )
+    if job_id:
+        pipeline.on_event = _stage_progress_reporter(job_id, request.file_id)
+    results = pipeline.run(
+        {
+            "upload_path": upload_path,
+            "master_sheet": request.master_sheet,
+            "status_sheet": request.status_sheet,
+            "options": request.options,
+            "sample_rows": request.options.sample_rows if dry_run else None,
+            "master_projection": _master_projection(request.options),
+            "incremental_key": _incremental_key(request),
+        },
+        # Memoized stages are keyed by the workbook content, not its tables
+        fingerprints={"upload_path": profile_cache.content_hash(upload_path)},
+    )
+
+    all_dataframes = {name: results[name] for name in OUTPUT_TABLES}
+    if dry_run:
+        artifacts = []
+        previews = {name: _table_preview(df) for name, df in all_dataframes.items()}
+    else:
+        artifacts = results["artifacts"] + results["dictionary_artifacts"]
+        previews = {}
+
+    # Calculate summary statistics
+    summary = _calculate_summary(
+        all_dataframes, results["date_column_names"], start_time
+    )
+    incremental_stats = results["incremental_stats"]
+    if incremental_stats:
+        summary.masterbom_mode = incremental_stats["mode"]
+        summary.parts_recomputed = incremental_stats["parts_recomputed"]
+
+    etl_logger.info(
+        "ETL transformation completed successfully",
+        processing_time=summary.processing_time_seconds,
+        total_artifacts=len(artifacts),
+    )
+
+    response = TransformResponse(
+        success=True,
+        artifacts=artifacts,
+        summary=summary,
+        messages=etl_logger.get_messages(),
+        stages=pipeline.metrics,
+        job_id=job_id,
+        dry_run=dry_run,
+        previews=previews,
+    )
+
+    return response
+
+
+def _table_preview(df: pd.DataFrame) -> TablePreview:
+    """Schema and first MAX_PREVIEW_ROWS rows of an output table."""
+    head = df.head(settings.max_preview_rows)
+    return TablePreview(
+        row_count=len(df),
+        columns={str(col): str(dtype) for col, dtype in df.dtypes.items()},
+        head=json.loads(head.to_json(orient="records", date_format="iso")),
+    )
+
+
+def _publish_progress(
+    job_id: str,
+    file_id: str,
+    status: str,
+    progress: float,
+    stage: Optional[str] = None,
+    description: Optional[str] = None,
+) -> None:
+    """Publish a transform progress event with the status's standard wording."""
+    operation, default_description = PROGRESS_STEPS[status]
+    progress_bus.publish(
+        job_id,
+        status=status,
+        operation=operation,
+        description=description or default_description,
+        progress=round(progress),
+        file_id=file_id,
+        stage=stage,
+    )
+
+
+def _stage_progress_reporter(
+    job_id: str, file_id: str
+) -> Callable[[str, str, float], None]:
+    """Pipeline on_event callback publishing progress as stages start."""
+
+    def report(stage_name: str, state: str, completed: float) -> None:
+        # Stages run in parallel, so a start event is the clearest signal;
+        # failures are published once by the route with the error message
+        if state == "started":
+            status = STAGE_STATUS.get(stage_name, "saving")
+            _publish_progress(
+                job_id, file_id, status, 5 + 90 * completed, stage=stage_name
             )
 
-            # Prepare all DataFrames for storage
-            all_dataframes = {
-                "masterbom_clean": master_results["masterbom_clean"],
-                "plant_item_status": master_results["plant_item_status"],
-                "fact_parts": master_results["fact_parts"],
-                "status_clean": status_clean,
-                "project_completion_by_plant": project_completion,
-                "dim_dates": dim_dates,
-                "date_role_bridge": date_role_bridge,
-            }
-
-            # Save data in multiple formats
-            etl_logger.info("Saving processed data")
-
-            artifacts = storage.save_all_formats(all_dataframes)
-
-            # Create data dictionary
-            dict_path = storage.create_data_dictionary(all_dataframes)
-            if dict_path:
-                dict_size = Path(dict_path).stat().st_size
-                artifacts.append(
-                    ArtifactInfo(
-                        name="data_dictionary.md",
-                        path=dict_path,
-                        format="Markdown",
-                        size_bytes=dict_size,
-                    )
-                )
+    return report
+
 
-            # Calculate summary statistics
-            summary = _calculate_summary(all_dataframes, date_column_names, start_time)
+def _build_transform_pipeline(
+    etl_logger: ETLLogger,
+    storage: DataStorage,
+    options: TransformOptions,
+    checkpoint: Optional[Callable[[], None]] = None,
+) -> StagePipeline:
+    """
+    Declare the transform stages; the engine runs independent ones in parallel.
 
-            etl_logger.info(
-                "ETL transformation completed successfully",
-                processing_time=summary.processing_time_seconds,
-                total_artifacts=len(artifacts),
+    Args:
+        etl_logger: Logger collecting the run's messages
+        storage: Storage service writing the artifacts
+        options: Transform options of the request
+        checkpoint: Cancellation checkpoint for the engine and MasterBOM loops
+
+    Returns:
+        Pipeline taking upload_path, master_sheet, status_sheet, options,
+        sample_rows (None to read whole sheets), master_projection (None to
+        read every MasterBOM column) and incremental_key (None for a full
+        MasterBOM pass); dry runs have no output stages
+    """
+    pipeline = StagePipeline(etl_logger, memo=stage_memo, checkpoint=checkpoint)
+
+    def read_master(
+        upload_path: Path,
+        master_sheet: str,
+        sample_rows: Optional[int],
+        master_projection: Optional[Dict],
+    ) -> Dict:
+        projection = None
+        if master_projection is not None:
+            projection = functools.partial(
+                MasterBOMProcessor.column_projection,
+                logger=etl_logger,
+                **master_projection,
             )
 
-            response = TransformResponse(
-                success=True,
-                artifacts=artifacts,
-                summary=summary,
-                messages=etl_logger.get_messages(),
+        return {
+            "master_df": _read_sheet(
+                etl_logger, upload_path, master_sheet, sample_rows, projection
             )
+        }
+
+    def read_status(
+        upload_path: Path, status_sheet: str, sample_rows: Optional[int]
+    ) -> Dict:
+        return {
+            "status_df": _read_sheet(etl_logger, upload_path, status_sheet, sample_rows)
+        }
+
+    def masterbom(
+        master_df: pd.DataFrame,
+        options: TransformOptions,
+        master_sheet: str,
+        incremental_key: Optional[str],
+    ) -> Dict:
+        return _process_masterbom(
+            etl_logger,
+            master_df,
+            options,
+            checkpoint,
+            incremental_key=incremental_key,
+            master_sheet=master_sheet,
+        )
 
-            return response
+    def status(status_df: pd.DataFrame) -> Dict:
+        return _process_status(etl_logger, status_df)
 
-        finally:
-            excel_reader.close()
+    def dim_dates(master_df: pd.DataFrame, options: TransformOptions) -> Dict:
+        return _create_date_dimension(etl_logger, master_df, options)
 
-    except HTTPException:
-        etl_logger.error("ETL transformation failed with HTTP error")
-        raise
+    def save(**tables: pd.DataFrame) -> Dict:
+        # Save data in multiple formats
+        etl_logger.info("Saving processed data")
+        return {"artifacts": storage.save_all_formats(tables)}
 
-    except Exception as e:
-        etl_logger.error(
-            "ETL transformation failed with unexpected error", error=str(e)
+    def dictionary(**tables: pd.DataFrame) -> Dict:
+        return {"dictionary_artifacts": _create_dictionary(storage, tables)}
+
+    # Reads are memoized by the workbook content hash, sheet and read options
+    pipeline.add_stage(
+        "read_master",
+        read_master,
+        ["upload_path", "master_sheet", "sample_rows", "master_projection"],
+        ["master_df"],
+        memoize=True,
+    )
+    pipeline.add_stage(
+        "read_status",
+        read_status,
+        ["upload_path", "status_sheet", "sample_rows"],
+        ["status_df"],
+        memoize=True,
+    )
+    # Incremental runs read and update on-disk state, so they are never memoized
+    pipeline.add_stage(
+        "masterbom",
+        masterbom,
+        ["master_df", "options", "master_sheet", "incremental_key"],
+        list(MASTERBOM_TABLES) + ["incremental_stats"],
+        memoize=not _is_incremental(options),
+    )
+    pipeline.add_stage(
+        "status",
+        status,
+        ["status_df"],
+        ["status_clean", "project_completion_by_plant"],
+        memoize=True,
+    )
+    pipeline.add_stage(
+        "dim_dates",
+        dim_dates,
+        ["master_df", "options"],
+        ["dim_dates", "date_role_bridge", "date_column_names"],
+        memoize=True,
+    )
+    if options.dry_run:
+        return pipeline
+
+    pipeline.add_stage("storage", save, OUTPUT_TABLES, ["artifacts"])
+    pipeline.add_stage(
+        "dictionary", dictionary, OUTPUT_TABLES, ["dictionary_artifacts"]
+    )
+
+    return pipeline
+
+
+def _is_incremental(options: TransformOptions) -> bool:
+    """Whether the MasterBOM stage uses incremental state (never for a sample)."""
+    return options.incremental and not options.dry_run
+
+
+def _incremental_key(request: TransformRequest) -> Optional[str]:
+    """Workbook key of the run's incremental state, or None for a full run."""
+    if not _is_incremental(request.options):
+        return None
+    return request.options.incremental_key or request.file_id
+
+
+def _master_projection(options: TransformOptions) -> Optional[Dict]:
+    """Arguments of MasterBOMProcessor.column_projection, or None to read all."""
+    if not options.column_projection:
+        return None
+
+    # The date dimension also reads the requested date columns
+    return {"id_col": options.id_col, "extra_columns": sorted(options.date_cols)}
+
+
+def _read_sheet(
+    etl_logger: ETLLogger,
+    upload_path: Path,
+    sheet: str,
+    sample_rows: Optional[int] = None,
+    projection: Optional[ColumnProjection] = None,
+) -> pd.DataFrame:
+    """
+    Read one sheet with its own reader so sheets can be read concurrently.
+
+    With sample_rows set only the first rows are parsed; the reader streams
+    the sheet and stops there instead of loading it whole. With a projection
+    only the columns it picks are parsed.
+    """
+    etl_logger.info("Reading Excel sheets", sheet=sheet, sample_rows=sample_rows)
+
+    excel_reader = ExcelReader(upload_path)
+    try:
+        df = excel_reader.read_sheet(sheet, nrows=sample_rows, projection=projection)
+    finally:
+        excel_reader.close()
+
+    etl_logger.info(
+        "Sheet loaded successfully", sheet=sheet, rows=len(df), cols=len(df.columns)
+    )
+
+    return df
+
+
+def _process_masterbom(
+    etl_logger: ETLLogger,
+    master_df: pd.DataFrame,
+    options: TransformOptions,
+    checkpoint: Optional[Callable[[], None]] = None,
+    incremental_key: Optional[str] = None,
+    master_sheet: str = "",
+) -> Dict:
+    """
+    MasterBOM stage: clean the sheet and build its three tables.
+
+    With an incremental_key the previous run's state for that workbook key and
+    master_sheet is reused and only changed parts are recomputed.
+    """
+    etl_logger.info("=== STARTING MASTERBOM PROCESSING ===")
+    etl_logger.info(
+        "Processing MasterBOM sheet",
+        input_rows=len(master_df),
+        input_cols=len(master_df.columns),
+        id_col=options.id_col,
+        date_cols=options.date_cols,
+    )
+
+    master_processor = MasterBOMProcessor(master_df, etl_logger, checkpoint)
+    incremental_stats = None
+    if incremental_key is not None:
+        incremental = IncrementalTransform(etl_logger, incremental_key, master_sheet)
+        master_results, incremental_stats = incremental.process(
+            master_processor, id_col=options.id_col
+        )
+    else:
+        master_results = master_processor.process(
+            id_col=options.id_col, date_cols=options.date_cols
         )
 
-        logger.error(
-            "Unexpected error during ETL transformation",
-            file_id=request.file_id,
-            error=str(e),
+    etl_logger.info(
+        "=== MASTERBOM PROCESSING COMPLETE ===",
+        output_tables=len(master_results),
+        table_names=list(master_results.keys()),
+    )
+
+    return {**master_results, "incremental_stats": incremental_stats}
+
+
+def _process_status(etl_logger: ETLLogger, status_df: pd.DataFrame) -> Dict:
+    """Status stage: clean the sheet and derive completion by plant."""
+    etl_logger.info("=== STARTING STATUS SHEET PROCESSING ===")
+    etl_logger.info(
+        "Processing Status sheet",
+        input_rows=len(status_df),
+        input_cols=len(status_df.columns),
+    )
+
+    status_processor = StatusProcessorV2(status_df, etl_logger)
+    status_results = status_processor.process()
+    status_clean = status_results["status_clean"]
+    project_completion = status_results["project_completion_by_plant"]
+
+    etl_logger.info(
+        "=== STATUS SHEET PROCESSING COMPLETE ===",
+        status_clean_rows=len(status_clean),
+        project_completion_rows=len(project_completion),
+    )
+
+    return {
+        "status_clean": status_clean,
+        "project_completion_by_plant": project_completion,
+    }
+
+
+def _create_date_dimension(
+    etl_logger: ETLLogger, master_df: pd.DataFrame, options: TransformOptions
+) -> Dict:
+    """Date dimension stage: build dim_dates from specified and detected columns."""
+    # Create date dimension from all date columns
+    etl_logger.info("=== STARTING DATE DIMENSION CREATION ===")
+    etl_logger.info("Creating date dimension")
+
+    date_columns = []
+    date_column_names = []
+
+    # Collect date columns from MasterBOM
+    etl_logger.info(
+        "Collecting specified date columns",
+        specified_cols=options.date_cols,
+    )
+    for col in options.date_cols:
+        if col in master_df.columns:
+            date_columns.append(master_df[col])
+            date_column_names.append(col)
+            etl_logger.info(f"Added specified date column: {col}")
+
+    # Auto-detect additional date columns
+    etl_logger.info("Auto-detecting additional date columns")
+    auto_date_cols = detect_date_columns(master_df)
+
+    # Filter out excluded date columns
+    if options.excluded_date_cols:
+        etl_logger.info(
+            "Excluding specified date columns",
+            excluded=options.excluded_date_cols,
         )
+        auto_date_cols = [
+            col for col in auto_date_cols if col not in options.excluded_date_cols
+        ]
+
+    etl_logger.info("Auto-detected date columns", detected_cols=auto_date_cols)
+
+    for col in auto_date_cols:
+        if col not in date_column_names and col in master_df.columns:
+            date_columns.append(master_df[col])
+            date_column_names.append(col)
+            etl_logger.info(f"Added auto-detected date column: {col}")
+
+    etl_logger.info(
+        "Final date columns for dimension",
+        total_columns=len(date_column_names),
+        column_names=date_column_names,
+    )
 
-        return TransformResponse(
-            success=False,
-            artifacts=[],
-            summary=TransformSummary(
-                total_parts=0,
-                active_parts=0,
-                inactive_parts=0,
-                new_parts=0,
-                duplicate_parts=0,
-                plants_detected=0,
-                duplicates_removed=0,
-                date_columns_processed=[],
-                processing_time_seconds=time.time() - start_time,
-            ),
-            messages=etl_logger.get_messages(),
-            error=str(e),
+    dim_dates, date_role_bridge = create_dim_dates(date_columns, date_column_names)
+
+    etl_logger.info(
+        "=== DATE DIMENSION CREATION COMPLETE ===",
+        dim_dates_rows=len(dim_dates),
+        date_bridge_rows=len(date_role_bridge),
+    )
+
+    return {
+        "dim_dates": dim_dates,
+        "date_role_bridge": date_role_bridge,
+        "date_column_names": date_column_names,
+    }
+
+
+def _create_dictionary(
+    storage: DataStorage, dataframes: Dict[str, pd.DataFrame]
+) -> List[ArtifactInfo]:
+    """Dictionary stage: write data_dictionary.md for the output tables."""
+    dict_path = storage.create_data_dictionary(dataframes)
+    if not dict_path:
+        return []
+
+    dict_size = Path(dict_path).stat().st_size
+    return [
+        ArtifactInfo(
+            name="data_dictionary.md",
+            path=dict_path,
+            format="Markdown",
+            size_bytes=dict_size,
         )
+    ]
 
 
 def _calculate_summary(
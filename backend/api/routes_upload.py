@@ -12,6 +12,7 @@ from backend.core.config import settings
 from backend.core.logging import logger
 from backend.models.schemas import ErrorResponse, UploadResponse
 from backend.services.excel_reader import ExcelReader
+from backend.services.progress import progress_bus
 
 router = APIRouter()
 
@@ -99,6 +100,14 @@ async def upload_file(file: UploadFile = File(...)):
             detected_sheets=detected_sheets,
         )
 
+        progress_bus.publish(
+            file_id,
+            status="upload",
+            operation="File Upload",
+            description="Excel file uploaded successfully",
+            progress=10,
+        )
+
         # Create enhanced response with detected sheets
         response_data = UploadResponse(
             file_id=file_id,
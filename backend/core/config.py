@@ -54,6 +54,84 @@ class Settings(BaseSettings):
     )
     large_dataset_threshold: int = Field(default=50000, alias="LARGE_DATASET_THRESHOLD")
 
+    # Output Format Configuration
+    parquet_profile: str = Field(default="optimized", alias="PARQUET_PROFILE")
+    parquet_compression: Optional[str] = Field(
+        default=None, alias="PARQUET_COMPRESSION"
+    )
+    parquet_row_group_size: Optional[int] = Field(
+        default=None, alias="PARQUET_ROW_GROUP_SIZE"
+    )
+    parquet_partition_by_plant: bool = Field(
+        default=False, alias="PARQUET_PARTITION_BY_PLANT"
+    )
+    csv_compression: str = Field(default="none", alias="CSV_COMPRESSION")
+    arrow_output: bool = Field(default=True, alias="ARROW_OUTPUT")
+    arrow_compression: str = Field(default="uncompressed", alias="ARROW_COMPRESSION")
+
+    # Profile Cache Configuration
+    profile_cache_folder: str = Field(
+        default="data/cache/profiles", alias="PROFILE_CACHE_FOLDER"
+    )
+    profile_cache_size: int = Field(default=64, alias="PROFILE_CACHE_SIZE")
+    profile_cache_disk_entries: int = Field(
+        default=1024, alias="PROFILE_CACHE_DISK_ENTRIES"
+    )
+    profile_refine_workers: int = Field(default=1, alias="PROFILE_REFINE_WORKERS")
+    profile_workers: int = Field(default=1, alias="PROFILE_WORKERS")
+
+    # Transform Pipeline Configuration
+    pipeline_workers: int = Field(default=2, alias="PIPELINE_WORKERS")
+    pipeline_memo_size: int = Field(default=0, alias="PIPELINE_MEMO_SIZE")
+    pipeline_memo_max_size: str = Field(default="512MB", alias="PIPELINE_MEMO_MAX_SIZE")
+
+    # Transform Budget Configuration (0 disables a budget)
+    transform_timeout_seconds: float = Field(
+        default=1800.0, alias="TRANSFORM_TIMEOUT_SECONDS"
+    )
+    transform_memory_limit: str = Field(default="0", alias="TRANSFORM_MEMORY_LIMIT")
+
+    # Stage Memory Budget Configuration (0 disables chunking)
+    stage_memory_budget: str = Field(default="1GB", alias="STAGE_MEMORY_BUDGET")
+    spill_folder: str = Field(default="", alias="SPILL_FOLDER")
+
+    # Progress Event Configuration
+    progress_history_size: int = Field(default=200, alias="PROGRESS_HISTORY_SIZE")
+    progress_heartbeat_seconds: float = Field(
+        default=15.0, alias="PROGRESS_HEARTBEAT_SECONDS"
+    )
+
+    # Batch Transform Configuration
+    batch_output_folder: str = Field(
+        default="data/batches", alias="BATCH_OUTPUT_FOLDER"
+    )
+    batch_workers: int = Field(default=0, alias="BATCH_WORKERS")
+
+    # Incremental Transform Configuration
+    incremental_state_folder: str = Field(
+        default="data/cache/incremental", alias="INCREMENTAL_STATE_FOLDER"
+    )
+    incremental_max_changed_ratio: float = Field(
+        default=0.5, alias="INCREMENTAL_MAX_CHANGED_RATIO"
+    )
+    incremental_state_max_entries: int = Field(
+        default=16, alias="INCREMENTAL_STATE_MAX_ENTRIES"
+    )
+
+    # Transform Result Cache Configuration
+    transform_cache_enabled: bool = Field(default=True, alias="TRANSFORM_CACHE_ENABLED")
+    transform_cache_folder: str = Field(
+        default="data/cache/transforms", alias="TRANSFORM_CACHE_FOLDER"
+    )
+    transform_cache_max_size: str = Field(
+        default="1GB", alias="TRANSFORM_CACHE_MAX_SIZE"
+    )
+
+    # Query Endpoint Configuration
+    query_max_rows: int = Field(default=100000, alias="QUERY_MAX_ROWS")
+    query_timeout_seconds: float = Field(default=30.0, alias="QUERY_TIMEOUT_SECONDS")
+    query_threads: int = Field(default=4, alias="QUERY_THREADS")
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -78,18 +156,68 @@ class Settings(BaseSettings):
         """Get PowerBI templates folder as Path object."""
         return Path(self.powerbi_templates_folder)
 
+    @property
+    def profile_cache_folder_path(self) -> Path:
+        """Get profile cache folder as Path object."""
+        return Path(self.profile_cache_folder)
+
+    @property
+    def batch_output_folder_path(self) -> Path:
+        """Get batch transform output folder as Path object."""
+        return Path(self.batch_output_folder)
+
+    @property
+    def incremental_state_folder_path(self) -> Path:
+        """Get incremental transform state folder as Path object."""
+        return Path(self.incremental_state_folder)
+
+    @property
+    def transform_cache_folder_path(self) -> Path:
+        """Get transform result cache folder as Path object."""
+        return Path(self.transform_cache_folder)
+
+    @property
+    def spill_folder_path(self) -> Optional[Path]:
+        """Get spill folder as Path object (None for the system temp folder)."""
+        return Path(self.spill_folder) if self.spill_folder else None
+
     @property
     def max_upload_bytes(self) -> int:
         """Convert max upload size to bytes."""
-        size_str = self.max_upload_size.upper()
-        if size_str.endswith("MB"):
-            return int(size_str[:-2]) * 1024 * 1024
-        elif size_str.endswith("KB"):
-            return int(size_str[:-2]) * 1024
-        elif size_str.endswith("GB"):
-            return int(size_str[:-2]) * 1024 * 1024 * 1024
-        else:
-            return int(size_str)
+        return _parse_size(self.max_upload_size)
+
+    @property
+    def transform_memory_limit_bytes(self) -> int:
+        """Convert the per-transform memory budget to bytes."""
+        return _parse_size(self.transform_memory_limit)
+
+    @property
+    def stage_memory_budget_bytes(self) -> int:
+        """Convert the per-stage memory budget to bytes."""
+        return _parse_size(self.stage_memory_budget)
+
+    @property
+    def pipeline_memo_max_bytes(self) -> int:
+        """Convert the in-memory stage memo budget to bytes."""
+        return _parse_size(self.pipeline_memo_max_size)
+
+    @property
+    def transform_cache_max_bytes(self) -> int:
+        """Convert the transform cache disk budget to bytes."""
+        return _parse_size(self.transform_cache_max_size)
+
+
+def _parse_size(size: str) -> int:
+    """Convert a size such as "50MB" to bytes."""
+    size_str = size.upper()
+    if size_str.endswith("MB"):
+        return int(size_str[:-2]) * 1024 * 1024
+    elif size_str.endswith("KB"):
+        return int(size_str[:-2]) * 1024
+    elif size_str.endswith("GB"):
+        return int(size_str[:-2]) * 1024 * 1024 * 1024
+    else:
+        return int(size_str)
 
 
 # Global settings instance
@@ -0,0 +1,45 @@
+"""
+Pandas copy-on-write mode and the DataFrame ownership rules built on it.
+
+Ownership rules for the transform pipeline:
+
+- A stage never writes to a DataFrame it received; frames passed between
+  stages (and kept in the stage memo and transform cache) are read-only.
+- A stage that needs to change a received frame takes a lazy_copy of it and
+  owns that object. Under copy-on-write, the copy shares all column data with
+  the original, and only the columns that are written to get copied.
+- Prefer operations that return new frames (assign, rename, drop, boolean
+  filters) over in-place writes; they share the unchanged columns too.
+- A frame returned under two names is returned as two lazy copies, so a
+  consumer of one name cannot change the other.
+
+Importing this module turns copy-on-write on; it is always on from pandas 3.
+"""
+
+from typing import TypeVar
+
+import pandas as pd
+
+PandasObject = TypeVar("PandasObject", pd.DataFrame, pd.Series)
+
+
+def enable_copy_on_write() -> None:
+    """Turn on pandas copy-on-write mode (needed on pandas 2.x only)."""
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+
+def lazy_copy(obj: PandasObject) -> PandasObject:
+    """
+    New DataFrame or Series that shares obj's data until either one is written.
+
+    Args:
+        obj: DataFrame or Series owned by someone else
+
+    Returns:
+        A copy the caller owns and may write to
+    """
+    return obj.copy(deep=False)
+
+
+enable_copy_on_write()
@@ -52,6 +52,19 @@ class ColumnProfile(BaseModel):
     null_percentage: float
     unique_count: int
     sample_values: List[Any]
+    unique_count_approximate: bool = False
+    unique_count_error: Optional[float] = None  # relative standard error
+    quantiles: Optional[Dict[str, Optional[float]]] = None
+    quantiles_approximate: bool = False
+    quantile_rank_error: Optional[float] = None  # normalized rank error
+
+
+class DuplicateGroup(BaseModel):
+    """A set of identical rows found during profiling."""
+
+    first_row: int
+    count: int
+    values: Dict[str, Any]
 
 
 class ProfileResponse(BaseModel):
@@ -62,6 +75,13 @@ class ProfileResponse(BaseModel):
     total_cols: int
     duplicate_rows: int
     columns: List[ColumnProfile]
+    profile_mode: str = "exact"
+    duplicate_rows_approximate: bool = False
+    duplicate_rows_error: Optional[int] = None  # one standard error, in rows
+    top_duplicate_groups: List[DuplicateGroup] = Field(default_factory=list)
+    is_estimate: bool = False  # computed from a row sample, refined later
+    sample_rows: Optional[int] = None
+    refinement_status: Optional[str] = None  # running | failed while estimated
 
 
 class TransformOptions(BaseModel):
@@ -72,6 +92,16 @@ class TransformOptions(BaseModel):
     id_col: str = Field(default="YAZAKI PN")
     master_sheet_name: Optional[str] = None
     status_sheet_name: Optional[str] = None
+    incremental: bool = False
+    # Incremental state is kept per key and MasterBOM sheet; new uploads of one
+    # workbook share it by passing the same key (defaults to the file ID)
+    incremental_key: Optional[str] = Field(default=None, max_length=256)
+    # Run the rules on the first sample_rows rows only and write no artifacts
+    dry_run: bool = False
+    sample_rows: int = Field(default=1000, ge=1)
+    # Parse only the MasterBOM columns the rules read; masterbom_clean then
+    # leaves out the columns it would otherwise only pass through
+    column_projection: bool = False
 
 
 class TransformRequest(BaseModel):
@@ -81,6 +111,8 @@ class TransformRequest(BaseModel):
     master_sheet: str
     status_sheet: str
     options: TransformOptions = Field(default_factory=TransformOptions)
+    # Client-chosen ID to follow progress under; a new one is generated if unset
+    job_id: Optional[str] = Field(default=None, max_length=64)
 
 
 class ArtifactInfo(BaseModel):
@@ -91,6 +123,8 @@ class ArtifactInfo(BaseModel):
     format: str
     size_bytes: int
     row_count: Optional[int] = None
+    compression: Optional[str] = None
+    uncompressed_size_bytes: Optional[int] = None
 
 
 class TransformSummary(BaseModel):
@@ -105,6 +139,27 @@ class TransformSummary(BaseModel):
     duplicates_removed: int
     date_columns_processed: List[str]
     processing_time_seconds: float
+    masterbom_mode: str = "full"
+    parts_recomputed: Optional[int] = None
+
+
+class StageMetrics(BaseModel):
+    """Timing and memory of one pipeline stage run."""
+
+    name: str
+    seconds: float
+    memoized: bool = False
+    rss_start_mb: Optional[float] = None
+    rss_end_mb: Optional[float] = None
+    rss_peak_mb: Optional[float] = None
+
+
+class TablePreview(BaseModel):
+    """Schema and first rows of one output table of a dry run."""
+
+    row_count: int
+    columns: Dict[str, str]
+    head: List[Dict[str, Any]]
 
 
 class TransformResponse(BaseModel):
@@ -115,6 +170,76 @@ class TransformResponse(BaseModel):
     summary: TransformSummary
     messages: List[Dict[str, Any]]
     error: Optional[str] = None
+    cached: bool = False
+    stages: List[StageMetrics] = Field(default_factory=list)
+    job_id: Optional[str] = None
+    dry_run: bool = False
+    previews: Dict[str, TablePreview] = Field(default_factory=dict)
+
+
+class ProgressEvent(BaseModel):
+    """One progress update of a transform job."""
+
+    sequence: int
+    job_id: str
+    file_id: Optional[str] = None
+    status: str
+    operation: str
+    description: str
+    progress: int
+    stage: Optional[str] = None
+    timestamp: datetime
+
+
+class BatchTransformRequest(BaseModel):
+    """Request model for transforming several workbooks in one call."""
+
+    jobs: List[TransformRequest] = Field(min_length=1)
+    consolidate: bool = False
+
+
+class BatchJobResult(BaseModel):
+    """Outcome of one workbook in a batch transform."""
+
+    file_id: str
+    master_sheet: str
+    status_sheet: str
+    success: bool
+    output_folder: str
+    artifacts: List[ArtifactInfo] = Field(default_factory=list)
+    summary: Optional[TransformSummary] = None
+    error: Optional[str] = None
+    processing_time_seconds: float
+
+
+class BatchTransformResponse(BaseModel):
+    """Response model (and manifest) of a batch transform."""
+
+    batch_id: str
+    success: bool
+    jobs: List[BatchJobResult]
+    consolidated_artifacts: List[ArtifactInfo] = Field(default_factory=list)
+    manifest_path: str
+    processing_time_seconds: float
+
+
+class QueryRequest(BaseModel):
+    """Request model for read-only SQL over processed outputs."""
+
+    sql: str
+    limit: int = Field(default=1000, ge=1)
+    format: str = Field(default="json", pattern="^(json|arrow)$")
+    timeout_seconds: Optional[float] = Field(default=None, gt=0)
+
+
+class QueryResponse(BaseModel):
+    """Response model for JSON query results."""
+
+    columns: List[str]
+    rows: List[Dict[str, Any]]
+    row_count: int
+    truncated: bool
+    elapsed_ms: float
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,152 @@
+"""Cooperative cancellation and wall-clock/memory budgets for transform jobs."""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from backend.core.config import settings
+from backend.services.stage_pipeline import PipelineCancelled, current_rss_bytes
+
+
+class JobCancelled(PipelineCancelled):
+    """Raised at a checkpoint of a job that was cancelled or ran over budget."""
+
+    def __init__(self, job_id: str, reason: str):
+        """Initialize with the job ID and a human-readable reason."""
+        super().__init__(f"Job '{job_id}' stopped: {reason}")
+        self.job_id = job_id
+        self.reason = reason
+
+
+class CancelToken:
+    """Cancellation flag and budgets of one job, polled at its checkpoints."""
+
+    def __init__(
+        self,
+        job_id: str,
+        timeout_seconds: float = 0,
+        memory_limit_bytes: int = 0,
+    ):
+        """
+        Initialize a token.
+
+        Args:
+            job_id: Job the token belongs to
+            timeout_seconds: Wall-clock budget from now; 0 for none
+            memory_limit_bytes: Resident memory budget of the process; 0 for none
+        """
+        self.job_id = job_id
+        self.deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_bytes = memory_limit_bytes
+        self._reason: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def cancel(self, reason: str = "cancelled by request") -> None:
+        """Ask the job to stop at its next checkpoint."""
+        with self._lock:
+            if self._reason is None:
+                self._reason = reason
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel was called."""
+        return self._reason is not None
+
+    def check(self) -> None:
+        """
+        Checkpoint: raise JobCancelled if the job should stop.
+
+        Raises:
+            JobCancelled: The job was cancelled or exceeded a budget
+        """
+        if self._reason is not None:
+            raise JobCancelled(self.job_id, self._reason)
+
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.cancel(f"exceeded the {self.timeout_seconds:g}s time budget")
+            raise JobCancelled(self.job_id, self._reason)
+
+        if self.memory_limit_bytes:
+            rss = current_rss_bytes()
+            if rss is not None and rss > self.memory_limit_bytes:
+                self.cancel(
+                    f"exceeded the {self.memory_limit_bytes // (1024 * 1024)}MB "
+                    "memory budget"
+                )
+                raise JobCancelled(self.job_id, self._reason)
+
+
+class JobRegistry:
+    """Tokens of the jobs running in this process, so they can be cancelled."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._tokens: Dict[str, CancelToken] = {}
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        job_id: str,
+        timeout_seconds: Optional[float] = None,
+        memory_limit_bytes: Optional[int] = None,
+    ) -> CancelToken:
+        """
+        Register a job and return its token.
+
+        Args:
+            job_id: Unique job ID
+            timeout_seconds: Wall-clock budget (defaults to TRANSFORM_TIMEOUT_SECONDS)
+            memory_limit_bytes: Memory budget (defaults to TRANSFORM_MEMORY_LIMIT)
+
+        Returns:
+            The job's CancelToken
+
+        Raises:
+            ValueError: A job with this ID is already running
+        """
+        token = CancelToken(
+            job_id,
+            timeout_seconds=(
+                settings.transform_timeout_seconds
+                if timeout_seconds is None
+                else timeout_seconds
+            ),
+            memory_limit_bytes=(
+                settings.transform_memory_limit_bytes
+                if memory_limit_bytes is None
+                else memory_limit_bytes
+            ),
+        )
+
+        with self._lock:
+            if job_id in self._tokens:
+                raise ValueError(f"Job '{job_id}' is already running")
+            self._tokens[job_id] = token
+
+        return token
+
+    def cancel(self, job_id: str, reason: str = "cancelled by request") -> bool:
+        """Cancel a running job; returns False if no such job is running."""
+        with self._lock:
+            token = self._tokens.get(job_id)
+
+        if token is None:
+            return False
+
+        token.cancel(reason)
+        return True
+
+    def finish(self, job_id: str) -> None:
+        """Forget a job that has ended."""
+        with self._lock:
+            self._tokens.pop(job_id, None)
+
+    def running(self) -> List[str]:
+        """IDs of the registered jobs."""
+        with self._lock:
+            return list(self._tokens)
+
+
+# Global registry of running transform jobs
+job_registry = JobRegistry()
@@ -1,12 +1,15 @@
 """Data cleaning utilities and functions."""
 
 import hashlib
+import numbers
 import re
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from backend.core.copy_on_write import lazy_copy
 from backend.core.logging import logger
 
 
@@ -113,11 +116,12 @@ def standardize_text(series: pd.Series) -> pd.Series:
         if not isinstance(series, pd.Series):
             series = pd.Series(series)
 
-        # Create a copy to avoid modifying the original
-        result_series = series.copy()
+        # Values are written in place, so work on our own copy
+        result_series = lazy_copy(series)
 
-        # Process each value individually to avoid Series ambiguity
-        for idx in result_series.index:
+        # Process each value individually to avoid Series ambiguity; walk
+        # positions so subsets with a non-default index are handled too
+        for idx in range(len(result_series)):
             try:
                 val = result_series.iloc[idx]
 
@@ -154,35 +158,415 @@ def standardize_text(series: pd.Series) -> pd.Series:
         return series
 
 
-def create_row_hash(df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.Series:
+# Runs of whitespace collapsed when normalizing header text
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def blank_cell_mask(df: pd.DataFrame) -> np.ndarray:
+    """
+    Boolean mask of cells that are null or whitespace-only text.
+
+    Nulls come from one isna() pass over the frame; only text columns are
+    stripped, in a single pass over their flattened values.
+
+    Args:
+        df: DataFrame to inspect
+
+    Returns:
+        Array of shape df.shape, True where a cell is blank
+    """
+    mask = df.isna().to_numpy(copy=True)
+
+    text_positions = [
+        position
+        for position, dtype in enumerate(df.dtypes)
+        if pd.api.types.is_string_dtype(dtype)
+    ]
+    if text_positions and len(df):
+        values = df.iloc[:, text_positions].to_numpy(dtype=object)
+        flat = pd.Series(values.ravel())
+        try:
+            whitespace = flat.str.strip().eq("").to_numpy(dtype=bool)
+        except AttributeError:
+            # No string values at all (e.g. object columns of numbers)
+            whitespace = np.zeros(len(flat), dtype=bool)
+        mask[:, text_positions] |= whitespace.reshape(values.shape)
+
+    return mask
+
+
+def find_blank_rows_and_columns(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find rows and columns that contain only blank cells.
+
+    Returns:
+        Tuple of (blank row flags, blank column flags) as boolean arrays
+    """
+    mask = blank_cell_mask(df)
+    return mask.all(axis=1), mask.all(axis=0)
+
+
+class HeaderMatcher:
+    """
+    Match header text against ordered patterns with precompiled regexes.
+
+    By default a pattern matches when each of its space-separated words
+    occurs somewhere in the header; with ``contiguous`` the whole pattern
+    must occur as a substring. Words listed in ``synonyms`` match any of
+    their alternatives (e.g. "%" also matching "percent").
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        contiguous: bool = False,
+        synonyms: Optional[Dict[str, List[str]]] = None,
+    ):
+        """Compile the patterns, kept in priority order."""
+        self.patterns = list(patterns)
+        synonyms = synonyms or {}
+
+        sources = []
+        for pattern in self.patterns:
+            if contiguous:
+                sources.append(re.escape(pattern))
+            else:
+                # One lookahead per word, so words may appear in any order
+                lookaheads = []
+                for word in pattern.split():
+                    alternatives = synonyms.get(word, [word])
+                    lookaheads.append(
+                        "(?=.*(?:{}))".format("|".join(map(re.escape, alternatives)))
+                    )
+                sources.append("^" + "".join(lookaheads))
+
+        self._regexes = [re.compile(source, re.DOTALL) for source in sources]
+        self._any_regex = re.compile(
+            "|".join(f"(?:{source})" for source in sources) or "(?!)", re.DOTALL
+        )
+
+    @staticmethod
+    def normalize(header) -> str:
+        """Lower-case, trim and collapse whitespace in a header."""
+        return WHITESPACE_PATTERN.sub(" ", str(header).lower().strip())
+
+    def first_match(self, header: str) -> Optional[int]:
+        """Index of the first pattern matching a normalized header, or None."""
+        for index, regex in enumerate(self._regexes):
+            if regex.search(header):
+                return index
+        return None
+
+    def matches(self, header: str) -> List[int]:
+        """Indices of every pattern matching a normalized header, in order."""
+        return [
+            index for index, regex in enumerate(self._regexes) if regex.search(header)
+        ]
+
+    def contains_any(self, values: pd.Series) -> np.ndarray:
+        """Vectorized test of which text values match at least one pattern."""
+        return values.str.contains(self._any_regex).fillna(False).to_numpy(dtype=bool)
+
+
+# Word values accepted as percentages, keyed by lower-case text
+PERCENTAGE_WORDS = {
+    "complete": 1.0,
+    "done": 1.0,
+    "finished": 1.0,
+    "none": 0.0,
+    "n/a": 0.0,
+    "na": 0.0,
+    "not available": 0.0,
+}
+
+
+def parse_percentage(
+    series: pd.Series,
+    words: Optional[Dict[str, float]] = None,
+    decimal_comma: bool = False,
+    max_percent: Optional[float] = None,
+    clip: bool = False,
+) -> pd.Series:
     """
-    Create a hash for each row based on significant columns.
+    Parse percentage values ("85%", "0.85", "85", "done") to the 0-1 range.
+
+    Symbols are stripped with string operations and numbers parsed in bulk;
+    numbers above 1 are read as percent and divided by 100.
+
+    Args:
+        series: Raw percentage values
+        words: Lookup of lower-case words to values for non-numeric text
+        decimal_comma: Treat "," as the decimal separator
+        max_percent: Only rescale values up to this bound (default: no bound)
+        clip: Clip the result to [0, 1]
+
+    Returns:
+        Float series with NaN where a value could not be parsed
+    """
+    result = pd.Series(np.nan, index=series.index, dtype="float64", name=series.name)
+
+    present = series.notna()
+    if not present.any():
+        return result
+
+    # Status columns repeat a few values; parse each distinct value once
+    codes, uniques = pd.factorize(series[present])
+    values = pd.Series(uniques)
+
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        values_num = values.astype("float64")
+        text = None
+    else:
+        text = values.astype(str).str.strip()
+        if decimal_comma:
+            text = text.str.replace(",", ".", regex=False)
+        text = text.str.replace("%", "", regex=False)
+        values_num = pd.to_numeric(text.str.strip(), errors="coerce").astype("float64")
+
+    # Values above 1 are percentages (e.g. 85 = 85%)
+    rescale = values_num > 1
+    if max_percent is not None:
+        rescale &= values_num <= max_percent
+    values_num = values_num.mask(rescale, values_num / 100.0)
+
+    # Non-numeric text such as "Complete" or "N/A"
+    if words and text is not None:
+        values_num = values_num.fillna(text.str.lower().map(words))
+
+    if clip:
+        values_num = values_num.clip(0.0, 1.0)
+
+    result[present] = values_num.to_numpy()[codes]
+    return result
+
+
+# Kinds of canonical cell values; ints, floats and bools are all numbers
+_NUMBER, _DATETIME, _TEXT = 0, 1, 2
+
+# Text holding a plain decimal number ("12", "-0.5") is the number it spells, so
+# IDs typed as text in one workbook and as numbers in another hash alike;
+# leading zeros, spaces and exponents keep text such as "007" distinct
+_NUMERIC_TEXT = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?")
+
+# Separates the kinds so e.g. a timestamp never shares a number's hash
+_KIND_TAGS = {
+    _NUMBER: np.uint64(0),
+    _DATETIME: np.uint64(0xA0761D6478BD642F),
+    _TEXT: np.uint64(0xE7037ED1A0B428DB),
+}
+
+# Stand-in hash for a missing cell so None, NaN, NaT and pd.NA all agree
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+# Hash keys (16 bytes each) for the two 64-bit lanes of a row fingerprint
+_LANE_HASH_KEYS = ("0123456789123456", "row-fingerprint2")
+
+# Separators used to build the canonical row text for cryptographic digests
+_DIGEST_FIELD_SEPARATOR = "\x1f"
+_DIGEST_CELL_SEPARATOR = "\x1e"
+
+
+def create_row_hash(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None,
+    bits: int = 64,
+    digest: Optional[str] = None,
+) -> pd.Series:
+    """
+    Create a fingerprint for each row based on significant columns.
+
+    Cells are reduced to a canonical form first, so the result does not depend
+    on column order or on how a value happened to be typed (1, 1.0, "1" and
+    True agree; so do None, NaN and NaT; timestamps compare in UTC).
 
     Args:
         df: DataFrame to hash
         columns: Specific columns to include in hash (default: all)
+        bits: Fingerprint width, 64 (uint64 values) or 128 (32-char hex strings)
+        digest: Optional hashlib algorithm (e.g. "sha256") for a cryptographic
+            hex digest of the canonical row instead of the fast fingerprint
 
     Returns:
-        Series with row hashes
+        Series of row fingerprints aligned with the DataFrame index: uint64
+        values for 64 bits, hex strings for 128 bits or a digest
     """
+    if bits not in (64, 128):
+        raise ValueError("Row hash width must be 64 or 128 bits")
+    if digest is not None:
+        hashlib.new(digest)  # Fail early on unknown algorithms
+
     if columns is None:
         columns = df.columns.tolist()
 
-    def hash_row(row):
-        # Convert row values to string and concatenate
-        row_str = "|".join(str(row[col]) for col in columns if col in row.index)
+    columns = sorted({str(col): col for col in columns if col in df.columns}.items())
+
+    if digest is not None:
+        rows = np.full(len(df), "", dtype=object)
+        for name, col in columns:
+            codes, values, kinds = _canonical_uniques(_column_values(df, col))
+            texts = np.array(
+                [f"{kind}{value!r}" for value, kind in zip(values, kinds)] + [""],
+                dtype=object,
+            )
+            rows = (
+                rows
+                + name
+                + _DIGEST_FIELD_SEPARATOR
+                + texts[codes]
+                + _DIGEST_CELL_SEPARATOR
+            )
+
+        hashes = [hashlib.new(digest, row.encode("utf-8")).hexdigest() for row in rows]
+        return pd.Series(hashes, index=df.index, dtype=object)
+
+    lanes = []
+    for hash_key in _LANE_HASH_KEYS[: bits // 64]:
+        combined = np.full(len(df), _hash_text([hash_key], hash_key)[0])
+        for name, col in columns:
+            codes, values, kinds = _canonical_uniques(_column_values(df, col))
+            unique_hashes = np.append(
+                _hash_uniques(values, kinds, hash_key), _NULL_HASH
+            )
+            name_hash = _hash_text([name], hash_key)[0]
+            combined = _mix64(combined ^ _mix64(unique_hashes[codes] ^ name_hash))
+        lanes.append(combined)
+
+    if bits == 64:
+        return pd.Series(lanes[0], index=df.index, dtype="uint64")
+
+    return pd.Series(_to_hex(lanes), index=df.index, dtype=object)
+
+
+def _column_values(df: pd.DataFrame, col) -> pd.Series:
+    """Values of a column by label, taking the first of duplicate labels."""
+    values = df[col]
+    return values.iloc[:, 0] if isinstance(values, pd.DataFrame) else values
+
+
+def _canonical_uniques(
+    series: pd.Series,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Factorize a column into canonical unique values.
 
-        # Create MD5 hash
-        return hashlib.md5(row_str.encode()).hexdigest()
+    Args:
+        series: Column to canonicalize
+
+    Returns:
+        Tuple of (codes with -1 for missing cells, canonical unique values,
+        kind of each unique value)
+    """
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Index(uniques)
+
+    if pd.api.types.is_bool_dtype(uniques.dtype) or (
+        pd.api.types.is_numeric_dtype(uniques.dtype)
+        and not pd.api.types.is_complex_dtype(uniques.dtype)
+    ):
+        # Adding 0.0 folds -0.0 into 0.0
+        values = (uniques.to_numpy(dtype=np.float64) + 0.0).astype(object)
+        kinds = np.full(len(values), _NUMBER, dtype=np.int8)
+    elif pd.api.types.is_datetime64_any_dtype(uniques.dtype):
+        stamps = pd.DatetimeIndex(uniques)
+        if stamps.tz is not None:
+            stamps = stamps.tz_convert(None)
+        values = stamps.as_unit("ns").asi8.astype(object)
+        kinds = np.full(len(values), _DATETIME, dtype=np.int8)
+    elif pd.api.types.infer_dtype(uniques, skipna=False) == "string":
+        values = uniques.to_numpy(dtype=object, copy=True)
+        is_number = (
+            pd.Series(values, dtype=object).str.fullmatch(_NUMERIC_TEXT).to_numpy(bool)
+        )
+        values[is_number] = values[is_number].astype(np.float64) + 0.0
+        kinds = np.where(is_number, _NUMBER, _TEXT).astype(np.int8)
+    else:
+        # Mixed object columns (typical for Excel) are resolved value by value
+        canonical = [_canonical_value(value) for value in uniques]
+        values = np.empty(len(canonical), dtype=object)
+        values[:] = [value for value, _ in canonical]
+        kinds = np.array([kind for _, kind in canonical], dtype=np.int8)
+
+    # Missing cells point one past the uniques, where callers append a null
+    codes = np.where(codes < 0, len(values), codes)
+
+    return codes, values, kinds
+
+
+def _canonical_value(value) -> Tuple[object, int]:
+    """Canonical (value, kind) of a single cell from an object column."""
+    if isinstance(value, (bool, np.bool_, numbers.Real)):
+        return float(value) + 0.0, _NUMBER
+
+    if isinstance(value, (datetime, np.datetime64)):
+        try:
+            stamp = pd.Timestamp(value)
+            if stamp.tz is not None:
+                stamp = stamp.tz_convert(None)
+            return int(stamp.as_unit("ns").value), _DATETIME
+        except (ValueError, OverflowError):
+            pass
+
+    text = str(value)
+    if isinstance(value, str) and _NUMERIC_TEXT.fullmatch(text):
+        return float(text) + 0.0, _NUMBER
+
+    return text, _TEXT
+
+
+def _hash_uniques(values: np.ndarray, kinds: np.ndarray, hash_key: str) -> np.ndarray:
+    """Hash canonical unique values into 64-bit values."""
+    hashes = np.zeros(len(values), dtype=np.uint64)
+    # hash_array only takes the key for strings; numbers get it mixed in
+    key_hash = _hash_text([hash_key], hash_key)[0]
+
+    for kind, dtype in ((_NUMBER, np.float64), (_DATETIME, np.int64), (_TEXT, None)):
+        mask = kinds == kind
+        if not mask.any():
+            continue
+
+        if dtype is None:
+            kind_hashes = _hash_text(values[mask], hash_key)
+        else:
+            kind_hashes = pd.util.hash_array(values[mask].astype(dtype))
+            kind_hashes = _mix64(kind_hashes ^ key_hash)
+        hashes[mask] = kind_hashes ^ _KIND_TAGS[kind]
+
+    return hashes
+
+
+def _hash_text(values, hash_key: str) -> np.ndarray:
+    """Keyed 64-bit hashes of strings."""
+    return pd.util.hash_array(
+        np.asarray(values, dtype=object), hash_key=hash_key, categorize=False
+    )
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """Avalanche 64-bit values (splitmix64 finalizer)."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
 
-    return df.apply(hash_row, axis=1)
+
+# Two hex digits for every byte value, used to format fingerprints
+_HEX_BYTES = np.array([f"{byte:02x}" for byte in range(256)])
+
+
+def _to_hex(lanes: List[np.ndarray]) -> np.ndarray:
+    """Format 64-bit lanes as one big-endian hex string per row."""
+    # Byte-swap after stacking: column_stack would return native byte order
+    raw = np.column_stack(lanes).astype(">u8").view(np.uint8)
+    digits = np.ascontiguousarray(_HEX_BYTES[raw])
+    return digits.view(f"<U{digits.shape[1] * 2}").ravel().astype(object)
 
 
 def flag_duplicate_rows(
     df: pd.DataFrame, subset: Optional[List[str]] = None
 ) -> Tuple[pd.DataFrame, int]:
     """
-    Flag duplicate rows instead of removing them and return DataFrame with duplicate flag.
+    Flag duplicate rows instead of removing them and return them with the flag.
 
     Args:
         df: DataFrame to process
@@ -194,8 +578,9 @@ def flag_duplicate_rows(
     original_count = len(df)
 
     # Add duplicate flag column
-    df_with_flag = df.copy()
-    df_with_flag["is_duplicate_entry"] = df.duplicated(subset=subset, keep="first")
+    df_with_flag = df.assign(
+        is_duplicate_entry=df.duplicated(subset=subset, keep="first")
+    )
 
     duplicate_count = int(df_with_flag["is_duplicate_entry"].sum())
 
@@ -239,6 +624,57 @@ def remove_duplicate_rows(
     return cleaned_df, duplicate_count
 
 
+# Column name patterns of date columns
+DATE_NAME_PATTERNS = [
+    r"date",
+    r"time",
+    r"approved",
+    r"promised",
+    r"created",
+    r"updated",
+    r"modified",
+    r"sop",
+    r"milestone",
+]
+
+# Column name patterns excluded from date detection (part numbers, IDs, etc.)
+DATE_NAME_EXCLUDE_PATTERNS = [
+    r"supplier.*pn",
+    r"original.*supplier.*pn",
+    r"supplier pn",
+    r"original supplier pn",
+    r"part.*number",
+    r"pn$",
+    r"id$",
+    r"code$",
+    r"number$",
+]
+
+
+def date_column_candidates(columns: Iterable) -> List:
+    """
+    Columns whose name suggests dates, before any content check.
+
+    Args:
+        columns: Column names to filter
+
+    Returns:
+        The columns detect_date_columns would inspect, in order
+    """
+    candidates = []
+    for col in columns:
+        col_lower = str(col).lower()
+
+        # Skip columns that match exclusion patterns
+        if any(re.search(pattern, col_lower) for pattern in DATE_NAME_EXCLUDE_PATTERNS):
+            continue
+
+        if any(re.search(pattern, col_lower) for pattern in DATE_NAME_PATTERNS):
+            candidates.append(col)
+
+    return candidates
+
+
 def detect_date_columns(df: pd.DataFrame) -> List[str]:
     """
     Auto-detect date columns based on column names and content.
@@ -251,58 +687,21 @@ def detect_date_columns(df: pd.DataFrame) -> List[str]:
     """
     date_columns = []
 
-    # Common date column name patterns
-    date_patterns = [
-        r"date",
-        r"time",
-        r"approved",
-        r"promised",
-        r"created",
-        r"updated",
-        r"modified",
-        r"sop",
-        r"milestone",
-    ]
-
-    # Patterns to exclude (part numbers, IDs, etc.)
-    exclude_patterns = [
-        r"supplier.*pn",
-        r"original.*supplier.*pn",
-        r"supplier pn",
-        r"original supplier pn",
-        r"part.*number",
-        r"pn$",
-        r"id$",
-        r"code$",
-        r"number$",
-    ]
-
-    for col in df.columns:
-        col_lower = str(col).lower()
-
-        # Skip columns that match exclusion patterns
-        is_excluded = any(re.search(pattern, col_lower) for pattern in exclude_patterns)
-        if is_excluded:
-            continue
-
-        # Check column name patterns
-        is_date_name = any(re.search(pattern, col_lower) for pattern in date_patterns)
-
-        if is_date_name:
-            # Verify content looks like dates
-            sample = df[col].dropna().head(10)
-            if len(sample) > 0:
-                try:
-                    parsed = pd.to_datetime(sample, errors="coerce")
-                    valid_ratio = parsed.notna().sum() / len(sample)
-
-                    if valid_ratio > 0.5:  # At least 50% valid dates
-                        date_columns.append(col)
-                        logger.info(
-                            f"Auto-detected date column: '{col}'",
-                            valid_ratio=valid_ratio,
-                        )
-                except Exception:
-                    pass
+    for col in date_column_candidates(df.columns):
+        # Verify content looks like dates
+        sample = df[col].dropna().head(10)
+        if len(sample) > 0:
+            try:
+                parsed = pd.to_datetime(sample, errors="coerce")
+                valid_ratio = parsed.notna().sum() / len(sample)
+
+                if valid_ratio > 0.5:  # At least 50% valid dates
+                    date_columns.append(col)
+                    logger.info(
+                        f"Auto-detected date column: '{col}'",
+                        valid_ratio=valid_ratio,
+                    )
+            except Exception:
+                pass
 
     return date_columns
@@ -2,13 +2,23 @@
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from pandas.io.parsers import TextParser
 
 from backend.core.logging import logger
 
+# Rows read to plan a column projection; covers header continuation rows and
+# the rows a processor inspects to find its header
+PROJECTION_HEAD_ROWS = 15
+
+# Maps the first rows of a sheet to the positions of the columns to parse
+ColumnProjection = Callable[[pd.DataFrame], Optional[List[int]]]
+
 
 class ExcelReader:
     """Service for reading and managing Excel workbooks."""
@@ -42,23 +52,62 @@ class ExcelReader:
         dtype: str = "str",
         nrows: Optional[int] = None,
         clean_headers: bool = True,
+        projection: Optional[ColumnProjection] = None,
     ) -> pd.DataFrame:
-        """Read a specific sheet as DataFrame."""
+        """
+        Read a specific sheet as DataFrame.
+
+        Args:
+            sheet_name: Sheet to read
+            dtype: Type the cells are read as
+            nrows: Read only this many data rows
+            clean_headers: Drop header continuation rows below the header
+            projection: Given the first PROJECTION_HEAD_ROWS rows of the sheet
+                (header continuation rows dropped), returns the positions of
+                the columns to parse, or None to parse all of them
+
+        Returns:
+            The sheet, with only the projected columns when projection is set
+        """
         try:
+            usecols = None
+            header_rows = None
+            if projection is not None:
+                head = pd.read_excel(
+                    self.file_path,
+                    sheet_name=sheet_name,
+                    dtype=dtype,
+                    nrows=min(nrows or PROJECTION_HEAD_ROWS, PROJECTION_HEAD_ROWS),
+                    engine="openpyxl",
+                )
+                # Continuation rows are found on all columns, as without projection
+                header_rows = (
+                    self._header_continuation_rows(head, sheet_name)
+                    if clean_headers
+                    else []
+                )
+                usecols = projection(
+                    head.drop(index=header_rows).reset_index(drop=True)
+                )
+
             df = pd.read_excel(
                 self.file_path,
                 sheet_name=sheet_name,
                 dtype=dtype,
                 nrows=nrows,
+                usecols=usecols,
                 engine="openpyxl",
             )
 
             # Clean multi-row headers if requested
             if clean_headers:
-                df = self._clean_multi_row_headers(df, sheet_name)
+                df = self._clean_multi_row_headers(df, sheet_name, header_rows)
 
             logger.info(
-                f"Read sheet '{sheet_name}'", rows=len(df), cols=len(df.columns)
+                f"Read sheet '{sheet_name}'",
+                rows=len(df),
+                cols=len(df.columns),
+                projected=usecols is not None,
             )
 
             return df
@@ -67,13 +116,121 @@ class ExcelReader:
             logger.error(f"Failed to read sheet '{sheet_name}': {e}")
             raise ValueError(f"Could not read sheet '{sheet_name}': {e}")
 
+    def count_rows(self, sheet_name: str) -> Optional[int]:
+        """
+        Data rows of a sheet as recorded in its dimensions, header excluded.
+
+        Cheap, as no rows are parsed, but an upper bound: trailing empty rows
+        are counted too. None when the file does not record dimensions.
+        """
+        if self.workbook is None:
+            self.workbook = load_workbook(self.file_path, read_only=True)
+
+        max_row = self.workbook[sheet_name].max_row
+        return None if max_row is None else max(max_row - 1, 0)
+
+    def read_sheet_rows(
+        self, sheet_name: str, positions: Sequence[int], dtype: str = "str"
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        Read only the given data rows of a sheet.
+
+        The sheet is streamed row by row and only the wanted rows are
+        converted and kept, so the full sheet is never held in memory. Cells
+        are parsed as pandas.read_excel parses them, and header continuation
+        rows are dropped as in read_sheet when they are among the wanted rows.
+
+        Args:
+            sheet_name: Sheet to read
+            positions: Positions of the data rows to keep (header excluded)
+            dtype: Type the cells are read as
+
+        Returns:
+            The wanted rows, indexed by position, and the sheet's data rows
+        """
+        workbook = load_workbook(self.file_path, read_only=True)
+        try:
+            worksheet = workbook[sheet_name]
+            # Like pandas, ignore recorded dimensions, which may be stale
+            worksheet.reset_dimensions()
+
+            wanted = set(int(position) for position in positions)
+            header = []
+            rows = []
+            kept_positions = []
+            width = 0
+            last_row_with_data = -1
+            for row_number, cells in enumerate(worksheet.rows):
+                row_width = len(cells)
+                while row_width and cells[row_width - 1].value is None:
+                    row_width -= 1
+                if row_width:
+                    last_row_with_data = row_number
+                    width = max(width, row_width)
+
+                if row_number == 0:
+                    header = [_cell_value(cell) for cell in cells[:row_width]]
+                elif row_number - 1 in wanted:
+                    rows.append([_cell_value(cell) for cell in cells[:row_width]])
+                    kept_positions.append(row_number - 1)
+
+            total_rows = max(last_row_with_data, 0)
+            kept = [
+                (position, row)
+                for position, row in zip(kept_positions, rows)
+                if position < total_rows
+            ]
+            data = [header] + [row for _, row in kept]
+            data = [row + [""] * (width - len(row)) for row in data]
+
+            df = TextParser(data, header=0, dtype=dtype, skip_blank_lines=False).read()
+            df.index = [position for position, _ in kept]
+
+            header_rows = self._header_continuation_rows(df, sheet_name)
+            if header_rows:
+                df = df.drop(index=header_rows)
+                total_rows -= len(header_rows)
+
+            logger.info(
+                f"Read sampled rows of sheet '{sheet_name}'",
+                rows=len(df),
+                total_rows=total_rows,
+            )
+
+            return df, total_rows
+
+        except Exception as e:
+            logger.error(f"Failed to read rows of sheet '{sheet_name}': {e}")
+            raise ValueError(f"Could not read sheet '{sheet_name}': {e}")
+
+        finally:
+            workbook.close()
+
     def _clean_multi_row_headers(
-        self, df: pd.DataFrame, sheet_name: str
+        self,
+        df: pd.DataFrame,
+        sheet_name: str,
+        rows_to_remove: Optional[List[int]] = None,
     ) -> pd.DataFrame:
         """Clean multi-row headers that are common in Excel files."""
         if len(df) == 0:
             return df
 
+        if rows_to_remove is None:
+            rows_to_remove = self._header_continuation_rows(df, sheet_name)
+
+        # Remove detected header rows
+        if rows_to_remove:
+            df = df.drop(index=rows_to_remove).reset_index(drop=True)
+            logger.info(
+                f"Removed {len(rows_to_remove)} header continuation rows "
+                f"from {sheet_name}"
+            )
+
+        return df
+
+    def _header_continuation_rows(self, df: pd.DataFrame, sheet_name: str) -> List[int]:
+        """Positions of the rows below the header that continue it."""
         # Look for rows that appear to be continuation of headers
         rows_to_remove = []
 
@@ -126,17 +283,11 @@ class ExcelReader:
                 if numeric_like / len(row_values) < 0.2:
                     rows_to_remove.append(i)
                     logger.info(
-                        f"Detected header continuation row {i} in {sheet_name}: {row_values[:3]}"
+                        f"Detected header continuation row {i} in {sheet_name}: "
+                        f"{row_values[:3]}"
                     )
 
-        # Remove detected header rows
-        if rows_to_remove:
-            df = df.drop(index=rows_to_remove).reset_index(drop=True)
-            logger.info(
-                f"Removed {len(rows_to_remove)} header continuation rows from {sheet_name}"
-            )
-
-        return df
+        return rows_to_remove
 
     def get_sheet_info(self, sheet_name: str) -> Dict[str, any]:
         """Get basic information about a sheet."""
@@ -219,7 +370,8 @@ class ExcelReader:
 
             if desc_col_idx is None:
                 logger.warning(
-                    "Description column not found, assuming all columns after ID are projects"
+                    "Description column not found, "
+                    "assuming all columns after ID are projects"
                 )
                 desc_col_idx = len(columns)
 
@@ -247,3 +399,15 @@ class ExcelReader:
         if self.workbook:
             self.workbook.close()
             self.workbook = None
+
+
+def _cell_value(cell):
+    """A cell's value as pandas.read_excel passes it to its parser."""
+    if cell.value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return np.nan
+    if cell.data_type == TYPE_NUMERIC and int(cell.value) == cell.value:
+        # Excel stores integers as floats; pandas reads them back as int
+        return int(cell.value)
+    return cell.value
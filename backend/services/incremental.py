@@ -0,0 +1,327 @@
+"""Incremental MasterBOM transform that only recomputes changed parts."""
+
+import hashlib
+import json
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from backend.core.config import settings
+from backend.core.logging import ETLLogger
+from backend.services.cleaning import create_row_hash
+from backend.services.masterbom_rules import MasterBOMProcessor
+
+# Bump when MasterBOM rules or row hashes change so stale state forces a full run
+INCREMENTAL_STATE_VERSION = "4"
+
+# Tables produced by MasterBOMProcessor that are kept between runs
+MASTERBOM_TABLES = ("masterbom_clean", "plant_item_status", "fact_parts")
+
+# Columns added by MasterBOMProcessor.prepare that are not part of the source
+DERIVED_ID_COLUMNS = ["part_id_raw", "part_id_std"]
+
+# Parquet metadata key listing object columns whose missing values are None
+NONE_COLUMNS_KEY = b"incremental_none_columns"
+
+
+class IncrementalTransform:
+    """Re-run MasterBOM rules only for parts whose source rows changed."""
+
+    def __init__(
+        self,
+        logger: ETLLogger,
+        workbook_key: str,
+        master_sheet: str,
+        state_root: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize with logger and the workbook whose previous run state is used.
+
+        Args:
+            logger: ETL logger
+            workbook_key: Stable name of the workbook (e.g. its file ID); state
+                is kept per workbook key and MasterBOM sheet
+            master_sheet: Name of the MasterBOM sheet
+            state_root: Folder holding the state of every workbook
+            max_entries: Workbook states kept, least recently used evicted
+        """
+        self.logger = logger
+        self.state_root = state_root or settings.incremental_state_folder_path
+        self.state_root.mkdir(parents=True, exist_ok=True)
+        self.max_entries = (
+            settings.incremental_state_max_entries
+            if max_entries is None
+            else max_entries
+        )
+
+        raw = json.dumps([workbook_key, master_sheet])
+        self.state_key = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+        self.state_folder = self.state_root / self.state_key
+
+    def process(
+        self, processor: MasterBOMProcessor, id_col: str = "YAZAKI PN"
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict]:
+        """
+        Process a MasterBOM sheet, reusing the previous run where rows are unchanged.
+
+        Args:
+            processor: Processor holding the raw MasterBOM sheet
+            id_col: Name of the ID column
+
+        Returns:
+            Tuple of (processed DataFrames, run statistics)
+        """
+        source = processor.prepare(id_col)
+        source_columns = [c for c in source.columns if c not in DERIVED_ID_COLUMNS]
+
+        rows = pd.DataFrame(
+            {
+                "part_id_std": source["part_id_std"].to_numpy(),
+                "row_hash": create_row_hash(source, source_columns).to_numpy(),
+            }
+        )
+        manifest = {
+            "version": INCREMENTAL_STATE_VERSION,
+            "id_column": str(processor.id_column),
+            "columns": [str(c) for c in source_columns],
+            "project_columns": [str(c) for c in processor.project_columns],
+            "date_columns": [str(c) for c in processor.date_columns],
+        }
+
+        previous = self._load_state(manifest)
+        changed_parts = None
+        if previous is not None:
+            changed_parts = self._find_changed_parts(previous[0], rows)
+
+            # Past this point rebuilding everything is cheaper than merging
+            total_parts = max(rows["part_id_std"].nunique(), 1)
+            if len(changed_parts) > settings.incremental_max_changed_ratio * (
+                total_parts
+            ):
+                changed_parts = None
+
+        if changed_parts is None:
+            self.logger.info("Incremental transform running a full MasterBOM pass")
+            results = processor.process_parts(rows["part_id_std"].unique())
+            stats = {"mode": "full", "parts_recomputed": len(results["fact_parts"])}
+        else:
+            self.logger.info(
+                "Incremental transform recomputing changed parts",
+                changed_parts=len(changed_parts),
+                source_rows=len(rows),
+            )
+            changes = {}
+            if changed_parts:
+                changes = processor.process_parts(changed_parts)
+            results = self._merge(
+                previous[1], changes, changed_parts, source, processor
+            )
+            stats = {"mode": "incremental", "parts_recomputed": len(changed_parts)}
+
+        self._save_state(manifest, rows, results)
+
+        return results, stats
+
+    def _load_state(
+        self, manifest: Dict
+    ) -> Optional[Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]]:
+        """Load the previous row hashes and outputs if they match this sheet layout."""
+        manifest_path = self.state_folder / "manifest.json"
+        if not manifest_path.exists():
+            return None
+
+        try:
+            previous_manifest = json.loads(manifest_path.read_text("utf-8"))
+            if previous_manifest != manifest:
+                self.logger.info("Sheet layout changed since the last incremental run")
+                return None
+
+            rows = pd.read_parquet(self.state_folder / "row_hashes.parquet")
+            outputs = {
+                name: _read_output(self.state_folder / f"{name}.parquet")
+                for name in MASTERBOM_TABLES
+            }
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable incremental state: {e}")
+            return None
+
+        # The manifest's mtime records the last use for LRU eviction
+        manifest_path.touch()
+
+        return rows, outputs
+
+    def _save_state(
+        self, manifest: Dict, rows: pd.DataFrame, results: Dict[str, pd.DataFrame]
+    ) -> None:
+        """Persist the manifest, row hashes and outputs for the next run."""
+        # Written aside and renamed into place, so a concurrent run never
+        # loads a half-written state
+        staging = self.state_root / f".{self.state_key}.{uuid.uuid4().hex}.tmp"
+
+        try:
+            staging.mkdir()
+            rows.to_parquet(staging / "row_hashes.parquet", index=False)
+            for name in MASTERBOM_TABLES:
+                _write_output(results[name], staging / f"{name}.parquet")
+            (staging / "manifest.json").write_text(
+                json.dumps(manifest), encoding="utf-8"
+            )
+
+            shutil.rmtree(self.state_folder, ignore_errors=True)
+            staging.rename(self.state_folder)
+            self._evict()
+
+        except Exception as e:
+            self.logger.warning(f"Failed to save incremental state: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _evict(self) -> None:
+        """Remove the least recently used workbook states beyond max_entries."""
+        entries = self._entries()
+        for entry in entries[: max(len(entries) - self.max_entries, 0)]:
+            shutil.rmtree(entry, ignore_errors=True)
+            self.logger.info("Evicted incremental state", key=entry.name)
+
+    def _entries(self) -> List[Path]:
+        """Saved workbook state folders, least recently used first."""
+        entries = []
+        for entry in self.state_root.iterdir():
+            # Dot-prefixed folders are states still being staged by _save_state
+            manifest_path = entry / "manifest.json"
+            if entry.name.startswith(".") or not manifest_path.exists():
+                continue
+            entries.append((manifest_path.stat().st_mtime, entry))
+
+        entries.sort(key=lambda item: item[0])
+        return [entry for _, entry in entries]
+
+    @staticmethod
+    def _find_changed_parts(previous: pd.DataFrame, current: pd.DataFrame) -> Set[str]:
+        """Parts whose ordered sequence of row hashes differs between two runs."""
+
+        def keyed(rows: pd.DataFrame) -> pd.DataFrame:
+            return rows.assign(occurrence=rows.groupby("part_id_std").cumcount())
+
+        compared = keyed(previous).merge(
+            keyed(current),
+            on=["part_id_std", "occurrence"],
+            how="outer",
+            suffixes=("_previous", "_current"),
+        )
+        differs = compared["row_hash_previous"] != compared["row_hash_current"]
+
+        return set(compared.loc[differs, "part_id_std"])
+
+    def _merge(
+        self,
+        previous: Dict[str, pd.DataFrame],
+        changes: Dict[str, pd.DataFrame],
+        changed_parts: Set[str],
+        source: pd.DataFrame,
+        processor: MasterBOMProcessor,
+    ) -> Dict[str, pd.DataFrame]:
+        """Replace changed parts in the previous outputs, in full-run row order."""
+        changed = list(changed_parts)
+        part_ids = source["part_id_std"]
+
+        def combine(table: str, key: str) -> pd.DataFrame:
+            kept = previous[table]
+            kept = kept[~kept[key].isin(changed)]
+            if table not in changes or changes[table].empty:
+                return kept
+            return pd.concat([kept, changes[table]])
+
+        # masterbom_clean follows sheet order: the k-th row of a part goes to
+        # the position of that part's k-th row in the current sheet
+        masterbom = combine("masterbom_clean", "part_id_std")
+        source_positions = pd.Series(
+            np.arange(len(source)),
+            index=pd.MultiIndex.from_arrays(
+                [part_ids.to_numpy(), part_ids.groupby(part_ids).cumcount().to_numpy()]
+            ),
+        )
+        positions = source_positions.reindex(
+            pd.MultiIndex.from_arrays(
+                [
+                    masterbom["part_id_std"].to_numpy(),
+                    masterbom.groupby("part_id_std").cumcount().to_numpy(),
+                ]
+            )
+        ).to_numpy()
+        order = np.argsort(positions, kind="stable")
+        masterbom = masterbom.iloc[order]
+        masterbom.index = source.index[positions[order]]
+
+        # plant_item_status lists, per project column, single-row parts in
+        # sheet order followed by resolved duplicate parts by first appearance
+        status = combine("plant_item_status", "part_id_std")
+        first_position = pd.Series(np.arange(len(source)), index=part_ids.to_numpy())
+        first_position = first_position[~first_position.index.duplicated()]
+        duplicated_parts = part_ids[part_ids.duplicated()].unique()
+        project_order = {col: i for i, col in enumerate(processor.project_columns)}
+        sort_keys = pd.DataFrame(
+            {
+                "project": status["project_plant"].map(project_order).to_numpy(),
+                "duplicated": status["part_id_std"].isin(duplicated_parts).to_numpy(),
+                "position": status["part_id_std"].map(first_position).to_numpy(),
+            }
+        )
+        order = sort_keys.sort_values(
+            ["project", "duplicated", "position"], kind="stable"
+        ).index
+        status = status.iloc[order].reset_index(drop=True)
+
+        # fact_parts is grouped by part ID, so it is sorted by item_id
+        fact_parts = combine("fact_parts", "item_id")
+        fact_parts = fact_parts.sort_values("item_id", kind="stable").reset_index(
+            drop=True
+        )
+
+        return {
+            "masterbom_clean": masterbom,
+            "plant_item_status": status,
+            "fact_parts": fact_parts,
+        }
+
+
+def _write_output(df: pd.DataFrame, parquet_path: Path) -> None:
+    """Write an output table, recording which object columns use None for missing."""
+    none_columns = [
+        str(col)
+        for col in df.columns
+        if df[col].dtype == object
+        and any(value is None for value in df[col].to_numpy())
+    ]
+
+    table = pa.Table.from_pandas(df)
+    metadata = {**table.schema.metadata, NONE_COLUMNS_KEY: json.dumps(none_columns)}
+    pq.write_table(table.replace_schema_metadata(metadata), parquet_path)
+
+
+def _read_output(parquet_path: Path) -> pd.DataFrame:
+    """
+    Read an output table back with the dtypes of the run that wrote it.
+
+    Arrow reads text as the pandas string dtype; columns that were object
+    columns become object columns again, with None or NaN for missing values
+    as the full run had them.
+    """
+    table = pq.read_table(parquet_path)
+    none_columns = set(json.loads(table.schema.metadata[NONE_COLUMNS_KEY]))
+    df = table.to_pandas()
+
+    for column in table.schema.pandas_metadata["columns"]:
+        name = column["name"]
+        if column["numpy_type"] == "object" and name in df.columns:
+            values = df[name].astype(object)
+            missing = None if name in none_columns else np.nan
+            df[name] = values.where(values.notna(), missing)
+
+    return df
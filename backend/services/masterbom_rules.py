@@ -1,28 +1,160 @@
 """Business rules and transformations for MasterBOM sheet processing."""
 
-from typing import Dict, List, Tuple
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from backend.core.config import settings
+from backend.core.copy_on_write import lazy_copy
 from backend.core.logging import ETLLogger
 from backend.services.cleaning import (
+    HeaderMatcher,
+    blank_cell_mask,
     clean_id,
+    date_column_candidates,
     detect_date_columns,
     flag_duplicate_rows,
     parse_date_column,
     standardize_text,
 )
+from backend.services.spill import SpillStore, frame_bytes
+
+# Cell text that marks the ID column in a header row
+ID_HEADER_MATCHER = HeaderMatcher(
+    ["YAZAKI PN", "yazaki pn", "part number", "part_number", "id"], contiguous=True
+)
+
+# Estimated bytes a melted row adds beyond its ID columns (project, status,
+# class, flags, notes and plant counts)
+MELTED_ROW_OVERHEAD_BYTES = 160
+
+# Copies of the melted table alive at once while melting, classifying and merging
+MELT_WORKING_COPIES = 3
+
+# Source columns the rules read besides the ID column and the project block:
+# standardized text, fact_parts attributes, duplicate resolution and dates
+ATTRIBUTE_COLUMNS = [
+    "Item Description",
+    "Original Supplier Name",
+    "Part Specification",
+    "Supplier Name",
+    "Supplier PN",
+    "PSW",
+    "PSW Type",
+    "PSW Sub Type",
+    "YPN Status",
+    "Handling Manual",
+    "IMDS STATUS (Yes, No, N/A)",
+    "FAR Status",
+    "PPAP Details",
+    "Approved Date",
+    "PSW Date",
+    "FAR Date",
+    "Promised Date",
+    "FAR Promised date",
+]
 
 
 class MasterBOMProcessor:
     """Processor for MasterBOM sheet with business rules."""
 
-    def __init__(self, df: pd.DataFrame, logger: ETLLogger):
-        """Initialize with DataFrame and logger."""
-        self.df = df.copy()
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        logger: ETLLogger,
+        checkpoint: Optional[Callable[[], None]] = None,
+        memory_budget: Optional[int] = None,
+    ):
+        """
+        Initialize with DataFrame and logger.
+
+        Args:
+            df: Raw MasterBOM sheet
+            logger: ETL logger instance
+            checkpoint: Called between steps and inside per-column and per-part
+                loops; raises to abort processing (see CancelToken.check)
+            memory_budget: Bytes the plant-item-status melt may project to use
+                before it is chunked and spilled (defaults to STAGE_MEMORY_BUDGET;
+                0 never chunks)
+        """
+        self.df = lazy_copy(df)
         self.logger = logger
+        self.checkpoint = checkpoint
+        self.memory_budget = (
+            settings.stage_memory_budget_bytes
+            if memory_budget is None
+            else memory_budget
+        )
         self.project_columns = []
         self.id_column = None
+        self.date_columns = []
+
+    @classmethod
+    def column_projection(
+        cls,
+        head: pd.DataFrame,
+        logger: ETLLogger,
+        id_col: str = "YAZAKI PN",
+        extra_columns: Iterable[str] = (),
+    ) -> Optional[List[int]]:
+        """
+        Plan which sheet columns the rules read, from the first rows of the sheet.
+
+        The ID column, the project block, ATTRIBUTE_COLUMNS and columns named
+        like dates are kept; the others would only pass through to
+        masterbom_clean and need not be parsed.
+
+        Args:
+            head: First rows of the raw sheet, as ExcelReader.read_sheet reads them
+            logger: ETL logger instance
+            id_col: Name of the ID column
+            extra_columns: Further sheet header names to keep, e.g. the date
+                columns requested for the date dimension
+
+        Returns:
+            Positions of the columns to read, or None to read the whole sheet
+            (no ID column, or headers that are only found with every column)
+        """
+
+        def plan(frame: pd.DataFrame) -> Optional[Tuple[List, str, List]]:
+            planner = cls(frame, logger)
+            planner._detect_and_fix_headers()
+            planner._clean_column_names()
+            columns = planner.df.columns.tolist()
+            if not any(str(col).upper() == id_col.upper() for col in columns):
+                return None
+            planner._identify_columns(id_col)
+            return columns, planner.id_column, planner.project_columns
+
+        planned = plan(head)
+        if planned is None:
+            return None
+
+        columns, id_column, project_columns = planned
+        keep = {id_column, *project_columns, *ATTRIBUTE_COLUMNS}
+        keep.update(date_column_candidates(columns))
+        keep_raw = set(extra_columns) | set(date_column_candidates(head.columns))
+        positions = [
+            position
+            for position, (raw, col) in enumerate(zip(head.columns, columns))
+            if col in keep or raw in keep_raw
+        ]
+
+        # Header detection weighs every column, so make sure it still finds
+        # the same header when it only sees the kept ones
+        projected = ([columns[position] for position in positions],) + planned[1:]
+        if plan(head.iloc[:, positions]) != projected:
+            logger.warning("Headers change under column projection; reading all")
+            return None
+
+        logger.info(
+            "Planned MasterBOM column projection",
+            read_columns=len(positions),
+            skipped_columns=len(columns) - len(positions),
+        )
+        return positions
 
     def process(
         self, id_col: str = "YAZAKI PN", date_cols: List[str] = None
@@ -43,6 +175,23 @@ class MasterBOMProcessor:
             input_cols=len(self.df.columns),
         )
 
+        self.prepare(id_col)
+
+        return self._build_outputs()
+
+    def prepare(self, id_col: str = "YAZAKI PN") -> pd.DataFrame:
+        """
+        Run the sheet-level steps (headers, columns, IDs, date column choice).
+
+        These steps depend on the sheet as a whole; everything after them works
+        part by part, which is what lets process_parts recompute a subset.
+
+        Args:
+            id_col: Name of the ID column
+
+        Returns:
+            The prepared source DataFrame with part_id_raw/part_id_std columns
+        """
         # Step 1: Detect and fix multi-row headers
         self._detect_and_fix_headers()
 
@@ -54,27 +203,52 @@ class MasterBOMProcessor:
 
         # Step 3: Clean ID column
         self._clean_id_column()
+        self._checkpoint()
 
-        # Step 4: Process date columns
+        # Step 4: Choose date columns
         preferred_date_cols = [
             "Approved Date",  # approval of part into MBOM
             "PSW Date",  # PSW approval date (if present)
             "FAR Date",  # FAR closed/ok date (if present)
         ]
         auto_detected = detect_date_columns(self.df)
-        date_cols = [
+        self.date_columns = [
             c for c in preferred_date_cols if c in self.df.columns
         ] or auto_detected
-        self._process_date_columns(date_cols)
+
+        return self.df
+
+    def process_parts(self, part_ids: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Process only the rows of the given parts of a prepared sheet.
+
+        Args:
+            part_ids: Standardized part IDs (part_id_std) to process
+
+        Returns:
+            Dictionary with processed DataFrames restricted to those parts
+        """
+        self.df = self.df[self.df["part_id_std"].isin(list(part_ids))]
+
+        self.logger.info("Processing MasterBOM parts subset", input_rows=len(self.df))
+
+        return self._build_outputs()
+
+    def _build_outputs(self) -> Dict[str, pd.DataFrame]:
+        """Run the per-part steps on the prepared sheet and return the tables."""
+        # Step 4: Process date columns
+        self._process_date_columns(self.date_columns)
 
         # Step 5: Standardize text columns
         self._standardize_text_columns()
 
         # Step 6: Create normalized plant-item-status table
         plant_item_status = self._create_plant_item_status()
+        self._checkpoint()
 
         # Step 7: Create fact parts table
         fact_parts = self._create_fact_parts()
+        self._checkpoint()
 
         # Step 8: Clean main DataFrame
         masterbom_clean = self._finalize_masterbom()
@@ -93,55 +267,59 @@ class MasterBOMProcessor:
             "fact_parts": fact_parts,
         }
 
+    def _checkpoint(self):
+        """Give a cancellation checkpoint the chance to abort processing."""
+        if self.checkpoint is not None:
+            self.checkpoint()
+
     def _detect_and_fix_headers(self):
         """Detect and fix multi-row headers in Excel data."""
         self.logger.info("Detecting multi-row headers")
 
-        # Look for the actual data start by finding the first row with the ID column pattern
-        id_patterns = ["YAZAKI PN", "yazaki pn", "part number", "part_number", "id"]
+        # Look for the actual data start by finding the first row with the ID
+        # column pattern
         data_start_row = None
 
         # Check first 10 rows for potential header rows
-        for i in range(min(10, len(self.df))):
-            row_values = [
-                str(val).strip().lower()
-                for val in self.df.iloc[i].values
-                if pd.notna(val)
-            ]
+        head = self.df.head(10).to_numpy(dtype=object)
+        present = ~pd.isna(head)
+        if present.any():
+            rows, _ = np.nonzero(present)
+            row_values = pd.Series(head[present]).astype(str).str.strip().str.lower()
+
+            # Rows containing an ID column pattern
+            has_id = np.bincount(
+                rows[ID_HEADER_MATCHER.contains_any(row_values)], minlength=len(head)
+            )
 
-            # Look for ID column patterns in this row
-            for pattern in id_patterns:
-                if any(pattern in val for val in row_values):
-                    # Check if this row looks like headers (contains text, not numbers)
-                    non_numeric_count = sum(
-                        1
-                        for val in row_values
-                        if not val.replace(".", "").replace("-", "").isdigit()
-                    )
-                    if (
-                        non_numeric_count > len(row_values) * 0.7
-                    ):  # 70% non-numeric suggests headers
-                        data_start_row = i
-                        break
+            # Check if the row looks like headers (contains text, not numbers)
+            numeric = (
+                row_values.str.replace(".", "", regex=False)
+                .str.replace("-", "", regex=False)
+                .str.isdigit()
+                .to_numpy(dtype=bool)
+            )
+            non_numeric_count = np.bincount(rows[~numeric], minlength=len(head))
+            value_count = np.bincount(rows, minlength=len(head))
 
-            if data_start_row is not None:
-                break
+            # 70% non-numeric suggests headers
+            header_rows = (has_id > 0) & (non_numeric_count > value_count * 0.7)
+            if header_rows.any():
+                data_start_row = int(header_rows.argmax())
 
         if data_start_row is not None and data_start_row > 0:
             self.logger.info(
                 f"Found multi-row headers, data starts at row {data_start_row}"
             )
 
-            # Use the detected row as new headers
-            new_headers = []
-            header_row = self.df.iloc[data_start_row]
-
-            for i, val in enumerate(header_row):
-                if pd.notna(val) and str(val).strip():
-                    new_headers.append(str(val).strip())
-                else:
-                    # Use original column name if header is empty
-                    new_headers.append(f"Column_{i}")
+            # Use the detected row as new headers; blank cells keep a
+            # positional name
+            header_row = self.df.iloc[[data_start_row]]
+            blank = blank_cell_mask(header_row)[0]
+            new_headers = [
+                f"Column_{i}" if blank[i] else str(val).strip()
+                for i, val in enumerate(header_row.iloc[0])
+            ]
 
             # Remove header rows and reset
             self.df = self.df.iloc[data_start_row + 1 :].reset_index(drop=True)
@@ -226,6 +404,7 @@ class MasterBOMProcessor:
         processed_cols = []
 
         for col in date_cols:
+            self._checkpoint()
             if col in self.df.columns:
                 try:
                     date_df = parse_date_column(self.df[col], col)
@@ -258,6 +437,7 @@ class MasterBOMProcessor:
 
         standardized = 0
         for col in text_columns:
+            self._checkpoint()
             if col in self.df.columns:
                 self.df[col] = standardize_text(self.df[col])
                 standardized += 1
@@ -269,7 +449,8 @@ class MasterBOMProcessor:
         Create normalized plant-item-status long table with enhanced duplicate handling.
 
         Implements:
-        - Proper status handling: 'X' (Active), 'D' (Discontinued), Blank/NULL (Not in Project)
+        - Proper status handling: 'X' (Active), 'D' (Discontinued),
+          Blank/NULL (Not in Project)
         - Morocco supplier prioritization for duplicates
         - Enhanced duplicate resolution logic
         """
@@ -303,10 +484,46 @@ class MasterBOMProcessor:
             col for col in base_cols + additional_cols if col in deduplicated_df.columns
         ]
 
+        column_chunks = self._plan_project_chunks(deduplicated_df, id_vars)
+        if len(column_chunks) > 1:
+            melted = self._create_plant_item_status_chunked(
+                deduplicated_df, id_vars, column_chunks
+            )
+        else:
+            # Steps 4-5: Classify statuses and resolve duplicates
+            melted = self._melt_project_columns(
+                deduplicated_df, id_vars, self.project_columns
+            )
+
+            # Step 6: Calculate plant counts per part
+            plant_counts = self._calculate_plant_counts(melted)
+            melted = melted.merge(plant_counts, on="part_id_std", how="left")
+
+            # Step 7: Clean up columns (remove helper columns if they exist)
+            melted = melted[self._plant_item_status_columns(melted)]
+
+        self.logger.info(
+            "Enhanced plant-item-status processing complete",
+            total_records=len(melted),
+            unique_parts=melted["part_id_std"].nunique(),
+            unique_plants=melted["project_plant"].nunique(),
+            active_records=len(melted[melted["status_class"] == "active"]),
+            discontinued_records=len(melted[melted["status_class"] == "discontinued"]),
+            not_in_project_records=len(
+                melted[melted["status_class"] == "not_in_project"]
+            ),
+        )
+
+        return melted
+
+    def _melt_project_columns(
+        self, df: pd.DataFrame, id_vars: List[str], project_columns: List[str]
+    ) -> pd.DataFrame:
+        """Melt project columns to long format, classify and deduplicate them."""
         melted = pd.melt(
-            deduplicated_df,
+            df,
             id_vars=id_vars,
-            value_vars=self.project_columns,
+            value_vars=project_columns,
             var_name="project_plant",
             value_name="raw_status",
         )
@@ -316,15 +533,13 @@ class MasterBOMProcessor:
         melted["is_duplicate"] = False  # Will be updated in duplicate detection
         melted["is_new"] = melted["status_class"] == "not_in_project"
         melted["notes"] = None
+        self._checkpoint()
 
         # Step 5: Detect and resolve remaining duplicates in melted data
-        melted = self._resolve_melted_duplicates(melted)
+        return self._resolve_melted_duplicates(melted)
 
-        # Step 6: Calculate plant counts per part
-        plant_counts = self._calculate_plant_counts(melted)
-        melted = melted.merge(plant_counts, on="part_id_std", how="left")
-
-        # Step 7: Clean up columns (remove helper columns if they exist)
+    def _plant_item_status_columns(self, melted: pd.DataFrame) -> List[str]:
+        """Output columns of plant_item_status, in order."""
         final_columns = [
             "part_id_std",
             "part_id_raw",
@@ -340,24 +555,91 @@ class MasterBOMProcessor:
             "n_new",
             "n_duplicate",
         ]
-        final_columns = [
+        return [
             col for col in final_columns if col in melted.columns and col is not None
         ]
-        melted = melted[final_columns]
+
+    def _plan_project_chunks(
+        self, df: pd.DataFrame, id_vars: List[str]
+    ) -> List[List[str]]:
+        """
+        Split the project columns so each melted chunk fits the memory budget.
+
+        The melted table has one row per part and project column, repeating the
+        ID columns; melting, classifying and merging hold a few copies of it.
+        """
+        if not self.memory_budget or len(self.project_columns) < 2 or df.empty:
+            return [self.project_columns]
+
+        row_bytes = frame_bytes(df, id_vars) / len(df) + MELTED_ROW_OVERHEAD_BYTES
+        projected = (
+            row_bytes * len(df) * len(self.project_columns) * MELT_WORKING_COPIES
+        )
+        chunk_count = min(
+            math.ceil(projected / self.memory_budget), len(self.project_columns)
+        )
+        if chunk_count <= 1:
+            return [self.project_columns]
+
+        chunk_width = math.ceil(len(self.project_columns) / chunk_count)
+        chunks = [
+            self.project_columns[start : start + chunk_width]
+            for start in range(0, len(self.project_columns), chunk_width)
+        ]
 
         self.logger.info(
-            "Enhanced plant-item-status processing complete",
-            total_records=len(melted),
-            unique_parts=melted["part_id_std"].nunique(),
-            unique_plants=melted["project_plant"].nunique(),
-            active_records=len(melted[melted["status_class"] == "active"]),
-            discontinued_records=len(melted[melted["status_class"] == "discontinued"]),
-            not_in_project_records=len(
-                melted[melted["status_class"] == "not_in_project"]
-            ),
+            "Projected plant-item-status size exceeds the stage memory budget",
+            projected_mb=round(projected / (1024 * 1024)),
+            budget_mb=round(self.memory_budget / (1024 * 1024)),
+            chunks=len(chunks),
+            project_columns_per_chunk=chunk_width,
         )
 
-        return melted
+        return chunks
+
+    def _create_plant_item_status_chunked(
+        self, df: pd.DataFrame, id_vars: List[str], column_chunks: List[List[str]]
+    ) -> pd.DataFrame:
+        """
+        Build plant_item_status a few project columns at a time.
+
+        Rows are produced project column by project column, so concatenating
+        the chunks in order gives the same table as a single melt. Classified
+        chunks are spilled to Parquet; plant counts need every project, so they
+        are summed over the chunks and merged in a second pass.
+        """
+        classified = SpillStore("plant_item_status")
+        finished = SpillStore("plant_item_status_final")
+        with classified, finished:
+            chunk_counts = []
+            for columns in column_chunks:
+                melted = self._melt_project_columns(df, id_vars, columns)
+                chunk_counts.append(self._calculate_plant_counts(melted))
+                classified.append(melted)
+                del melted
+
+            # Step 6: Calculate plant counts per part over all chunks
+            plant_counts = (
+                pd.concat(chunk_counts, ignore_index=True)
+                .groupby("part_id_std", as_index=False)
+                .sum()
+            )
+            del chunk_counts
+
+            # Step 7: Merge counts and clean up columns chunk by chunk
+            for melted in classified:
+                self._checkpoint()
+                melted = melted.merge(plant_counts, on="part_id_std", how="left")
+                finished.append(melted[self._plant_item_status_columns(melted)])
+                del melted
+
+            self.logger.info(
+                "Spilled plant-item-status chunks to Parquet",
+                chunks=len(column_chunks),
+                rows=finished.rows,
+            )
+
+            return finished.read()
 
     def _classify_status_enhanced(self, row) -> str:
         """
@@ -397,16 +679,16 @@ class MasterBOMProcessor:
         3. Prioritize Morocco suppliers when duplicates exist
         4. Keep only the Morocco supplier record when choosing between duplicates
         """
-        df_work = self.df.copy()
+        # Only read and filtered, so no copy is needed
+        df_work = self.df
 
         if "part_id_std" not in df_work.columns:
             self.logger.warning("No part_id_std column found for duplicate handling")
             return df_work
 
         # Find duplicated part IDs
-        duplicated_parts = df_work[
-            df_work.duplicated(subset=["part_id_std"], keep=False)
-        ]
+        is_duplicated = df_work.duplicated(subset=["part_id_std"], keep=False)
+        duplicated_parts = df_work[is_duplicated]
 
         if duplicated_parts.empty:
             self.logger.info("No duplicates found in source data")
@@ -418,27 +700,28 @@ class MasterBOMProcessor:
             unique_duplicated_parts=duplicated_parts["part_id_std"].nunique(),
         )
 
-        # Process each duplicated part
-        resolved_records = []
-        non_duplicated = df_work[
-            ~df_work.duplicated(subset=["part_id_std"], keep=False)
+        # Process each duplicated part on the few columns the decision reads,
+        # collecting row positions; the kept rows are taken in one go at the end
+        non_duplicated = df_work[~is_duplicated]
+        lookup = duplicated_parts[
+            [col for col in ["Supplier Name"] if col in duplicated_parts.columns]
         ]
+        part_positions = duplicated_parts.groupby("part_id_std", sort=False).indices
 
+        selected_positions = []
         for part_id in duplicated_parts["part_id_std"].unique():
-            part_records = df_work[df_work["part_id_std"] == part_id].copy()
+            self._checkpoint()
+            positions = part_positions[part_id]
 
             # Apply Morocco supplier prioritization
-            resolved_record = self._resolve_duplicate_with_morocco_priority(
-                part_id, part_records
+            selected = self._resolve_duplicate_with_morocco_priority(
+                part_id, lookup.iloc[positions]
             )
-            resolved_records.append(resolved_record)
+            selected_positions.append(positions[selected])
 
         # Combine resolved records with non-duplicated records
-        if resolved_records:
-            resolved_df = pd.concat(resolved_records, ignore_index=True)
-            final_df = pd.concat([non_duplicated, resolved_df], ignore_index=True)
-        else:
-            final_df = non_duplicated
+        resolved_df = duplicated_parts.take(selected_positions)
+        final_df = pd.concat([non_duplicated, resolved_df], ignore_index=True)
 
         duplicates_removed = len(df_work) - len(final_df)
         self.logger.info(
@@ -452,72 +735,70 @@ class MasterBOMProcessor:
 
     def _resolve_duplicate_with_morocco_priority(
         self, part_id: str, part_records: pd.DataFrame
-    ) -> pd.DataFrame:
+    ) -> int:
         """
         Resolve duplicates for a specific part ID using Morocco supplier priority.
 
         Args:
             part_id: The part ID being processed
-            part_records: All records for this part ID
+            part_records: All records for this part ID (at least Supplier Name,
+                when the sheet has it)
 
         Returns:
-            Single record (highest priority) for this part ID
+            Position in part_records of the single (highest priority) record
         """
         if len(part_records) == 1:
-            return part_records
+            return 0
 
         # Check if we have Supplier Name column
         if "Supplier Name" not in part_records.columns:
             self.logger.warning(
                 f"No Supplier Name column for duplicate resolution of {part_id}"
             )
-            return part_records.iloc[[0]]  # Return first record
+            return 0  # Use first record
 
         # Define Morocco supplier patterns (case-insensitive)
         morocco_patterns = ["MA", "MAROC", "MOROCCO", "MAROC"]
 
-        # Find Morocco suppliers
-        morocco_records = pd.DataFrame()
+        # Find Morocco suppliers, in pattern order; records matching several
+        # patterns count once
+        suppliers = part_records["Supplier Name"]
+        morocco_positions = []
         for pattern in morocco_patterns:
-            mask = part_records["Supplier Name"].str.contains(
-                pattern, case=False, na=False
+            mask = suppliers.str.contains(pattern, case=False, na=False).to_numpy()
+            morocco_positions.extend(
+                position
+                for position in np.flatnonzero(mask)
+                if position not in morocco_positions
             )
-            if mask.any():
-                morocco_records = pd.concat(
-                    [morocco_records, part_records[mask]], ignore_index=True
-                )
-
-        # Remove duplicates in morocco_records if any
-        if not morocco_records.empty:
-            morocco_records = morocco_records.drop_duplicates()
 
         # Decision logic
-        if len(morocco_records) == 1:
+        if len(morocco_positions) == 1:
             # Single Morocco supplier found - use it
-            selected_record = morocco_records
+            selected = morocco_positions[0]
             self.logger.info(
                 f"Morocco supplier prioritized for part {part_id}",
-                supplier=morocco_records.iloc[0].get("Supplier Name", "Unknown"),
+                supplier=suppliers.iloc[selected],
                 total_duplicates=len(part_records),
             )
-        elif len(morocco_records) > 1:
+        elif len(morocco_positions) > 1:
             # Multiple Morocco suppliers - use first one
-            selected_record = morocco_records.iloc[[0]]
+            selected = morocco_positions[0]
             self.logger.info(
                 f"Multiple Morocco suppliers found for part {part_id}, using first",
-                supplier=selected_record.iloc[0].get("Supplier Name", "Unknown"),
-                total_morocco_records=len(morocco_records),
+                supplier=suppliers.iloc[selected],
+                total_morocco_records=len(morocco_positions),
             )
         else:
             # No Morocco suppliers found - use first record
-            selected_record = part_records.iloc[[0]]
+            selected = 0
             self.logger.info(
                 f"No Morocco supplier found for part {part_id}, using first record",
-                supplier=selected_record.iloc[0].get("Supplier Name", "Unknown"),
+                supplier=suppliers.iloc[selected],
                 total_duplicates=len(part_records),
             )
 
-        return selected_record
+        return int(selected)
 
     def _check_duplicate(self, row) -> bool:
         """Legacy duplicate check - kept for backward compatibility."""
@@ -527,7 +808,8 @@ class MasterBOMProcessor:
         """
         Resolve any remaining duplicates in the melted data.
 
-        This handles edge cases where duplicates might still exist after source processing.
+        This handles edge cases where duplicates might still exist after source
+        processing.
         """
         # Check for duplicates in melted data (same part + same project_plant)
         duplicate_mask = melted_df.duplicated(
@@ -570,7 +852,8 @@ class MasterBOMProcessor:
         # Ensure all status columns exist with new naming
         status_mapping = {
             "active": "n_active",
-            "discontinued": "n_inactive",  # Map discontinued to n_inactive for compatibility
+            # Map discontinued to n_inactive for compatibility
+            "discontinued": "n_inactive",
             "not_in_project": "n_new",  # Map not_in_project to n_new for compatibility
             "duplicate": "n_duplicate",
         }
@@ -712,7 +995,8 @@ class MasterBOMProcessor:
 
         if duplicate_count > 0:
             self.logger.info(
-                "Duplicate handling complete: Flagged duplicate rows (preserved in dataset)",
+                "Duplicate handling complete: "
+                "Flagged duplicate rows (preserved in dataset)",
                 count=duplicate_count,
                 total_rows=len(cleaned_df),
                 unique_rows=len(cleaned_df) - duplicate_count,
@@ -724,7 +1008,8 @@ class MasterBOMProcessor:
         if "is_duplicate_entry" in cleaned_df.columns:
             duplicate_flagged = cleaned_df["is_duplicate_entry"].sum()
             self.logger.info(
-                f"Verification: {duplicate_flagged} rows flagged as duplicates in final dataset"
+                f"Verification: {duplicate_flagged} rows flagged as duplicates "
+                "in final dataset"
             )
         else:
             self.logger.warning("is_duplicate_entry column not found in final dataset")
@@ -11,6 +11,7 @@ import pandas as pd
 
 from backend.core.config import settings
 from backend.core.logging import ETLLogger
+from backend.services.storage import PARQUET_PARTITION_COLUMNS
 
 
 class PowerBIIntegration:
@@ -51,9 +52,12 @@ class PowerBIIntegration:
                     self.logger.warning(f"Source file not found: {source_path}")
                     continue
 
-                # Copy to pipeline folder
+                # Copy to pipeline folder (partitioned datasets are folders)
                 dest_path = self.pipeline_folder / source_path.name
-                shutil.copy2(source_path, dest_path)
+                if source_path.is_dir():
+                    shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
+                else:
+                    shutil.copy2(source_path, dest_path)
                 copied_files.append(str(dest_path))
 
                 self.logger.info(
@@ -137,11 +141,22 @@ class PowerBIIntegration:
         queries = {}
 
         for table_name, df in dataframes.items():
+            if (
+                settings.parquet_partition_by_plant
+                and table_name in PARQUET_PARTITION_COLUMNS
+                and PARQUET_PARTITION_COLUMNS[table_name] in df.columns
+            ):
+                queries[table_name] = self._create_partitioned_power_query(
+                    table_name, df, PARQUET_PARTITION_COLUMNS[table_name]
+                )
+                continue
+
             # Create M script for Parquet file connection
             parquet_file = f"{table_name}.parquet"
+            parquet_path = f"{self.pipeline_folder.absolute()}/{parquet_file}"
 
             m_script = f"""let
-    Source = Parquet.Document(File.Contents("{self.pipeline_folder.absolute()}/{parquet_file}")),
+    Source = Parquet.Document(File.Contents("{parquet_path}")),
     PromoteHeaders = Table.PromoteHeaders(Source, [PromoteAllScalars=true]),
     ChangeTypes = {self._generate_column_types(df)}
 in
@@ -154,7 +169,42 @@ in
 
         return queries
 
-    def _generate_column_types(self, df: pd.DataFrame) -> str:
+    def _create_partitioned_power_query(
+        self, table_name: str, df: pd.DataFrame, partition_col: str
+    ) -> Dict:
+        """Create a folder-based M script for a Hive-partitioned Parquet dataset."""
+        dataset_folder = self.pipeline_folder.absolute() / table_name
+        data_columns = [str(col) for col in df.columns if col != partition_col]
+        column_list = ", ".join(f'"{col}"' for col in data_columns)
+
+        # The plant key lives in the "<partition_col>=<value>" folder name, so
+        # filtering on it before Parquet.Document lets refreshes skip partitions
+        folder_key = (
+            "Uri.UnescapeDataString(Text.BeforeDelimiter(Text.AfterDelimiter("
+            f'Text.Replace([Folder Path], "/", "\\"), "{partition_col}="), "\\"))'
+        )
+        m_script = f"""let
+    Source = Folder.Files("{dataset_folder}"),
+    ParquetFiles = Table.SelectRows(Source, each [Extension] = ".parquet"),
+    WithKey = Table.AddColumn(ParquetFiles, "{partition_col}", each {folder_key}),
+    WithData = Table.AddColumn(WithKey, "Data", each Parquet.Document([Content])),
+    KeepColumns = Table.SelectColumns(WithData, {{"{partition_col}", "Data"}}),
+    Expanded = Table.ExpandTableColumn(KeepColumns, "Data", {{{column_list}}}),
+    Reordered = Table.ReorderColumns(Expanded, {{"{partition_col}", {column_list}}}),
+    ChangeTypes = {self._generate_column_types(df, "Reordered")}
+in
+    ChangeTypes"""
+
+        return {
+            "script": m_script,
+            "description": (
+                f"Load {table_name} from Parquet dataset partitioned by {partition_col}"
+            ),
+        }
+
+    def _generate_column_types(
+        self, df: pd.DataFrame, source_step: str = "PromoteHeaders"
+    ) -> str:
         """Generate Power Query column type transformations."""
         type_mappings = {
             "object": "type text",
@@ -170,7 +220,7 @@ in
             column_types.append(f'{{"{col}", {pbi_type}}}')
 
         return (
-            f"Table.TransformColumnTypes(PromoteHeaders,{{{', '.join(column_types)}}})"
+            f"Table.TransformColumnTypes({source_step},{{{', '.join(column_types)}}})"
         )
 
     def _create_relationships(self, dataframes: Dict[str, pd.DataFrame]) -> List[Dict]:
@@ -0,0 +1,140 @@
+"""Cache of sheet profiles keyed by workbook content, sheet and profiler version."""
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from backend.core.config import settings
+from backend.core.logging import logger
+from backend.models.schemas import ProfileResponse
+from backend.services.profiler import PROFILER_VERSION
+
+
+class ProfileCache:
+    """In-memory LRU of ProfileResponse objects backed by an on-disk JSON store."""
+
+    def __init__(
+        self,
+        cache_folder: Optional[Path] = None,
+        max_entries: int = 64,
+        max_disk_entries: int = 1024,
+    ):
+        """Initialize with the on-disk folder and the memory and disk LRU sizes."""
+        self.cache_folder = cache_folder or settings.profile_cache_folder_path
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(max_entries, 1)
+        self.max_disk_entries = max(max_disk_entries, 1)
+        self._entries: "OrderedDict[str, ProfileResponse]" = OrderedDict()
+        self._content_hashes: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def content_hash(self, file_path: Path) -> str:
+        """SHA-256 of the workbook bytes, memoized by path, size and mtime."""
+        stat = file_path.stat()
+        stat_key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            cached = self._content_hashes.get(stat_key)
+            if cached:
+                self._content_hashes.move_to_end(stat_key)
+                return cached
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+
+        content_hash = digest.hexdigest()
+        with self._lock:
+            # Every new or rewritten upload adds a key; keep the newest ones
+            self._content_hashes[stat_key] = content_hash
+            self._content_hashes.move_to_end(stat_key)
+            while len(self._content_hashes) > self.max_entries:
+                self._content_hashes.popitem(last=False)
+        return content_hash
+
+    def make_key(self, content_hash: str, sheet: str, mode: str = "exact") -> str:
+        """Build the cache key for a (content hash, sheet, profiler version, mode)."""
+        raw = json.dumps([content_hash, sheet, PROFILER_VERSION, mode])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ProfileResponse]:
+        """Return a cached profile from memory or disk, or None on a miss."""
+        with self._lock:
+            profile = self._entries.get(key)
+            if profile is not None:
+                self._entries.move_to_end(key)
+                return profile
+
+        cache_path = self.cache_folder / f"{key}.json"
+        if not cache_path.exists():
+            return None
+
+        try:
+            profile = ProfileResponse.model_validate_json(
+                cache_path.read_text(encoding="utf-8")
+            )
+            # The file's mtime records the last use for LRU eviction
+            os.utime(cache_path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable profile cache entry: {e}")
+            cache_path.unlink(missing_ok=True)
+            return None
+
+        self._remember(key, profile)
+        return profile
+
+    def put(self, key: str, profile: ProfileResponse) -> None:
+        """Store a profile in memory and on disk."""
+        self._remember(key, profile)
+
+        cache_path = self.cache_folder / f"{key}.json"
+        # Concurrent puts of one key each write their own file before the rename
+        tmp_path = self.cache_folder / f".{key}.{uuid.uuid4().hex}.tmp"
+        try:
+            tmp_path.write_text(profile.model_dump_json(), encoding="utf-8")
+            with self._lock:
+                tmp_path.replace(cache_path)
+                self._evict()
+        except Exception as e:
+            logger.warning(f"Failed to persist profile cache entry: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Remove least recently used profiles until the disk store fits."""
+        entries = self._disk_entries()
+        for cache_path in entries[: max(len(entries) - self.max_disk_entries, 0)]:
+            cache_path.unlink(missing_ok=True)
+            logger.info("Evicted profile cache entry", key=cache_path.stem)
+
+    def _disk_entries(self) -> List[Path]:
+        """Profiles stored on disk, least recently used first."""
+        entries = []
+        for cache_path in self.cache_folder.glob("*.json"):
+            try:
+                entries.append((cache_path.stat().st_mtime, cache_path))
+            except FileNotFoundError:
+                continue
+
+        entries.sort(key=lambda item: item[0])
+        return [cache_path for _, cache_path in entries]
+
+    def _remember(self, key: str, profile: ProfileResponse) -> None:
+        """Insert into the in-memory LRU, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = profile
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Global profile cache instance
+profile_cache = ProfileCache(
+    max_entries=settings.profile_cache_size,
+    max_disk_entries=settings.profile_cache_disk_entries,
+)
@@ -0,0 +1,83 @@
+"""Background refinement of estimated sheet profiles."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from backend.core.config import settings
+from backend.core.logging import logger
+from backend.models.schemas import ProfileResponse
+
+
+class ProfileRefiner:
+    """Run full profiles in background threads while estimates are served."""
+
+    def __init__(self, max_workers: int = 1):
+        """Initialize with the number of background profiling threads."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1), thread_name_prefix="profile-refine"
+        )
+        self._jobs: Dict[str, Tuple[Future, ProfileResponse]] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self, key: str, estimate: ProfileResponse, refine: Callable[[], None]
+    ) -> None:
+        """
+        Start refining a profile unless a refinement for the key is running.
+
+        Args:
+            key: Profile cache key the full profile will be stored under
+            estimate: Estimated profile served until the refinement finishes
+            refine: Callable that computes and caches the full profile
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job[0].done():
+                return
+
+            future = self._executor.submit(refine)
+            self._jobs[key] = (future, estimate)
+
+        future.add_done_callback(lambda done: self._finish(key, done))
+
+    def get(self, key: str) -> Optional[ProfileResponse]:
+        """
+        Return the estimate for a key with its refinement status.
+
+        A failed refinement is reported once and then forgotten, so the next
+        request starts a new attempt.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return None
+
+            future, estimate = job
+            if not future.done():
+                status = "running"
+            elif future.exception() is not None:
+                status = "failed"
+                del self._jobs[key]
+            else:
+                # Finished; the full profile is in the profile cache
+                del self._jobs[key]
+                return None
+
+        return estimate.model_copy(update={"refinement_status": status})
+
+    def _finish(self, key: str, future: Future) -> None:
+        """Log the outcome and drop successful jobs."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Background profile refinement failed: {error}")
+            return
+
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job[0] is future:
+                del self._jobs[key]
+
+
+# Global profile refiner instance
+profile_refiner = ProfileRefiner(max_workers=settings.profile_refine_workers)
@@ -1,60 +1,133 @@
 """Data profiling service for analyzing DataFrame quality and statistics."""
 
-from typing import Any, Dict, List
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+from backend.core.config import settings
 from backend.core.logging import logger
-from backend.models.schemas import ColumnProfile, ProfileResponse
+from backend.models.schemas import ColumnProfile, DuplicateGroup, ProfileResponse
+from backend.services.cleaning import create_row_hash
+from backend.services.sketches import HyperLogLog, KLLSketch
+
+# Bump when profiling output changes so cached profiles are not reused
+PROFILER_VERSION = "6"
+
+# Values inspected for type inference before confirming against the full column
+INFER_SAMPLE_SIZE = 1000
+
+# Non-null rows scanned for sample values before falling back to the full column
+SAMPLE_SCAN_ROWS = 5000
+
+DATE_PATTERNS = [
+    re.compile(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}"),
+    re.compile(r"\d{4}[/-]\d{1,2}[/-]\d{1,2}"),
+    re.compile(r"\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)"),
+]
+
+BOOL_VALUES = ["true", "false", "yes", "no", "1", "0", "x", "d"]
+
+# Largest duplicate groups reported and columns shown per group
+TOP_DUPLICATE_GROUPS = 5
+DUPLICATE_GROUP_COLUMNS = 10
+
+# Quantiles reported for numeric columns in approximate mode
+SKETCH_QUANTILES = {"p01": 0.01, "p25": 0.25, "p50": 0.5, "p75": 0.75, "p99": 0.99}
+
+# Stratified sample used for the fast first answer of progressive profiling
+SAMPLE_HEAD_ROWS = 1000
+SAMPLE_TAIL_ROWS = 1000
+SAMPLE_BLOCK_COUNT = 20
+SAMPLE_BLOCK_SIZE = 100
+
+# Smallest sheet (rows x columns) profiled across worker processes
+PARALLEL_MIN_CELLS = 1_000_000
+
+# Inferred types of object columns that Arrow stores without changing a value;
+# other object columns (e.g. ints mixed with floats) are profiled in-process
+ARROW_EXACT_OBJECT_TYPES = {
+    "string",
+    "empty",
+    "integer",
+    "floating",
+    "boolean",
+    "datetime",
+}
 
 
 class DataProfiler:
     """Service for profiling DataFrame data quality and statistics."""
 
-    def __init__(self, df: pd.DataFrame, sheet_name: str):
-        """Initialize with DataFrame and sheet name."""
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        sheet_name: str,
+        approximate: bool = False,
+        workers: Optional[int] = None,
+    ):
+        """
+        Initialize with DataFrame and sheet name.
+
+        Args:
+            df: Sheet data to profile
+            sheet_name: Name of the sheet
+            approximate: Use sketches (HyperLogLog, KLL) for distinct counts,
+                duplicate rows and numeric quantiles instead of exact scans
+            workers: Processes used to profile columns of large sheets
+                (defaults to PROFILE_WORKERS; 1 profiles in-process)
+        """
         self.df = df
         self.sheet_name = sheet_name
         self.total_rows = len(df)
         self.total_cols = len(df.columns)
+        self.approximate = approximate
+        self.workers = settings.profile_workers if workers is None else workers
 
     def profile_column(self, col_name: str, max_samples: int = 10) -> ColumnProfile:
         """Profile a single column."""
         series = self.df[col_name]
-
-        # Basic counts
         non_null_count = series.notna().sum()
-        null_count = series.isna().sum()
+        unique_count = series.nunique()
+
+        return self._build_column_profile(
+            col_name, series, non_null_count, unique_count, max_samples
+        )
+
+    def _build_column_profile(
+        self,
+        col_name: str,
+        series: pd.Series,
+        non_null_count: int,
+        unique_count: int,
+        max_samples: int = 10,
+    ) -> ColumnProfile:
+        """Assemble a column profile from precomputed counts."""
+        null_count = self.total_rows - non_null_count
         null_percentage = (
             (null_count / self.total_rows) * 100 if self.total_rows > 0 else 0
         )
 
-        # Unique values
-        unique_count = series.nunique()
+        # Non-null values are shared by sampling and type inference
+        non_null = series.dropna()
 
         # Sample values (non-null, unique)
         sample_values = []
         try:
-            non_null_series = series.dropna()
-            if len(non_null_series) > 0:
-                unique_values = non_null_series.unique()
-                sample_count = min(max_samples, len(unique_values))
-                sample_values = unique_values[:sample_count].tolist()
-
-                # Convert numpy types to Python types for JSON serialization
-                sample_values = [
-                    item.item() if hasattr(item, "item") else item
-                    for item in sample_values
-                ]
+            sample_values = self._sample_unique_values(non_null, max_samples)
         except Exception as e:
             logger.warning(f"Failed to get sample values for column '{col_name}': {e}")
             sample_values = []
 
         # Infer data type
-        dtype_str = self._infer_dtype(series)
+        dtype_str = self._infer_dtype(series, non_null)
 
-        return ColumnProfile(
+        profile = ColumnProfile(
             name=col_name,
             dtype=dtype_str,
             non_null_count=int(non_null_count),
@@ -64,69 +137,273 @@ class DataProfiler:
             sample_values=sample_values,
         )
 
-    def _infer_dtype(self, series: pd.Series) -> str:
-        """Infer the most appropriate data type for a series."""
-        # Remove null values for type inference
+        if self.approximate:
+            profile.unique_count_approximate = True
+            profile.unique_count_error = round(HyperLogLog().relative_error, 4)
+
+            if dtype_str in ("integer", "numeric"):
+                sketch = self._sketch_quantiles(non_null)
+                profile.quantiles = {
+                    label: value
+                    for label, value in zip(
+                        SKETCH_QUANTILES,
+                        sketch.quantiles(SKETCH_QUANTILES.values()).values(),
+                    )
+                }
+                profile.quantiles_approximate = True
+                profile.quantile_rank_error = round(sketch.rank_error, 4)
+
+        return profile
+
+    def _approximate_unique_count(self, series: pd.Series) -> int:
+        """Estimate distinct non-null values with HyperLogLog."""
         non_null = series.dropna()
+        sketch = HyperLogLog()
+        sketch.update(create_row_hash(non_null.to_frame()).to_numpy())
+        # The estimate can overshoot; there are never more distinct values
+        return min(sketch.count(), len(non_null))
+
+    def _sketch_quantiles(self, non_null: pd.Series) -> KLLSketch:
+        """Feed a numeric column to a KLL sketch in batches."""
+        sketch = KLLSketch()
+        values = pd.to_numeric(non_null, errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        batch_size = max(settings.chunk_size, 1)
+        for start in range(0, len(values), batch_size):
+            sketch.update(values[start : start + batch_size])
+        return sketch
+
+    def _sample_unique_values(self, non_null: pd.Series, max_samples: int) -> List[Any]:
+        """Return the first distinct non-null values in column order."""
+        if len(non_null) == 0:
+            return []
+
+        # Distinct values usually show up early, so scan a bounded head first
+        unique_values = pd.unique(non_null.iloc[:SAMPLE_SCAN_ROWS])
+        if len(unique_values) < max_samples and len(non_null) > SAMPLE_SCAN_ROWS:
+            unique_values = pd.unique(non_null)
+
+        sample_values = unique_values[:max_samples].tolist()
+
+        # Convert numpy types to Python types for JSON serialization
+        return [
+            item.item() if hasattr(item, "item") else item for item in sample_values
+        ]
+
+    def _infer_dtype(
+        self, series: pd.Series, non_null: Optional[pd.Series] = None
+    ) -> str:
+        """
+        Infer the most appropriate data type for a series.
+
+        Inference runs on a bounded sample. A negative answer from the sample is
+        final; a positive numeric or boolean answer is confirmed against the
+        full column only when the sample did not cover every value.
+        """
+        # Remove null values for type inference
+        if non_null is None:
+            non_null = series.dropna()
 
         if len(non_null) == 0:
             return "empty"
 
+        sample = non_null.iloc[:INFER_SAMPLE_SIZE]
+        sample_is_complete = len(sample) == len(non_null)
+
         # Check if all values are numeric
-        try:
-            pd.to_numeric(non_null)
-            # Check if integers
-            if all(
-                str(val).replace(".", "").replace("-", "").isdigit()
-                for val in non_null
-                if str(val).strip()
-            ):
-                return "integer"
-            else:
-                return "numeric"
-        except (ValueError, TypeError):
-            pass
+        numeric_type = self._numeric_type(sample)
+        if numeric_type is not None and not sample_is_complete:
+            numeric_type = self._numeric_type(non_null)
+        if numeric_type is not None:
+            return numeric_type
 
         # Check if date-like
-        date_patterns = [
-            r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",
-            r"\d{4}[/-]\d{1,2}[/-]\d{1,2}",
-            r"\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)",
-        ]
-
         sample_str = str(non_null.iloc[0]).lower()
-        for pattern in date_patterns:
-            import re
-
-            if re.search(pattern, sample_str):
-                return "date"
+        if any(pattern.search(sample_str) for pattern in DATE_PATTERNS):
+            return "date"
 
         # Check if boolean-like
-        bool_values = {"true", "false", "yes", "no", "1", "0", "x", "d"}
-        unique_lower = {str(val).strip().lower() for val in non_null.unique()}
-        if unique_lower.issubset(bool_values):
+        is_boolean = self._is_boolean_like(sample)
+        if is_boolean and not sample_is_complete:
+            is_boolean = self._is_boolean_like(non_null)
+        if is_boolean:
             return "boolean"
 
         # Default to text
         return "text"
 
+    @staticmethod
+    def _numeric_type(values: pd.Series) -> Optional[str]:
+        """Return "integer"/"numeric" if every value parses as a number, else None."""
+        if not pd.api.types.is_numeric_dtype(values):
+            # Empty strings parse to NaN without raising, anything else is a failure
+            failed = pd.to_numeric(values, errors="coerce").isna()
+            if failed.any() and (values[failed].astype(str) != "").any():
+                return None
+
+        as_text = values.astype(str)
+        non_blank = as_text.str.strip() != ""
+        digits_only = (
+            as_text.str.replace(".", "", regex=False)
+            .str.replace("-", "", regex=False)
+            .str.isdigit()
+        )
+
+        return "integer" if digits_only[non_blank].all() else "numeric"
+
+    @staticmethod
+    def _is_boolean_like(values: pd.Series) -> bool:
+        """Check whether every value is one of the boolean-like tokens."""
+        normalized = values.astype(str).str.strip().str.lower()
+        return bool(normalized.isin(BOOL_VALUES).all())
+
     def count_duplicate_rows(self) -> int:
         """Count duplicate rows in the DataFrame."""
-        try:
-            # Consider only non-null columns for duplicate detection
-            non_null_cols = [
-                col for col in self.df.columns if self.df[col].notna().any()
-            ]
+        duplicate_count, _ = self.find_duplicate_rows(top_n=0)
+        return duplicate_count
 
-            if not non_null_cols:
-                return 0
+    def find_duplicate_rows(
+        self, top_n: int = TOP_DUPLICATE_GROUPS
+    ) -> Tuple[int, List[DuplicateGroup]]:
+        """
+        Count duplicate rows via 64-bit row hashes and report the largest groups.
 
-            duplicate_count = self.df[non_null_cols].duplicated().sum()
-            return int(duplicate_count)
+        Rows are fingerprinted with create_row_hash; only rows whose hash
+        collides with another row are compared value by value, so the exact
+        comparison never touches the (usually large) set of unique rows.
 
+        Returns:
+            Tuple of (duplicate row count, largest duplicate groups); (0, [])
+            when the rows cannot be compared (e.g. unhashable cells)
+        """
+        try:
+            return self._find_duplicate_rows(top_n)
         except Exception as e:
             logger.warning(f"Failed to count duplicates: {e}")
-            return 0
+            return 0, []
+
+    def _find_duplicate_rows(self, top_n: int) -> Tuple[int, List[DuplicateGroup]]:
+        """Duplicate row count and largest groups, raising on incomparable cells."""
+        # Consider only non-null columns for duplicate detection
+        non_null_cols = self.df.columns[self.df.notna().any().to_numpy()]
+
+        if len(non_null_cols) == 0:
+            return 0, []
+
+        # Work on row positions: index labels need not be unique
+        frame = self.df[non_null_cols]
+        row_hashes = create_row_hash(frame).to_numpy()
+
+        # Rows sharing a hash bucket are the only duplicate candidates
+        candidate_positions = np.flatnonzero(
+            pd.Series(row_hashes).duplicated(keep=False).to_numpy()
+        )
+        if len(candidate_positions) == 0:
+            return 0, []
+
+        # Confirm real duplicates inside the colliding buckets
+        candidate_frame = frame.iloc[candidate_positions].reset_index(drop=True)
+        confirmed = candidate_frame.duplicated(keep=False).to_numpy()
+        duplicate_count = int(candidate_frame.duplicated().sum())
+
+        groups = []
+        if top_n > 0 and duplicate_count > 0:
+            duplicate_positions = candidate_positions[confirmed]
+            duplicate_hashes = pd.Series(row_hashes[duplicate_positions])
+            group_sizes = duplicate_hashes.value_counts().head(top_n)
+            for row_hash, group_size in group_sizes.items():
+                first_position = int(
+                    duplicate_positions[np.flatnonzero(duplicate_hashes == row_hash)[0]]
+                )
+                first_row = frame.iloc[first_position].dropna()
+                groups.append(
+                    DuplicateGroup(
+                        first_row=first_position,
+                        count=int(group_size),
+                        values={
+                            str(col): value.item() if hasattr(value, "item") else value
+                            for col, value in first_row.iloc[
+                                :DUPLICATE_GROUP_COLUMNS
+                            ].items()
+                        },
+                    )
+                )
+
+        return duplicate_count, groups
+
+    def estimate_duplicate_rows(self) -> Dict[str, int]:
+        """Estimate duplicate rows as total rows minus approximate distinct rows."""
+        try:
+            non_null_cols = self.df.columns[self.df.notna().any().to_numpy()]
+            if len(non_null_cols) == 0:
+                return {"duplicate_rows": 0, "error": 0}
+
+            sketch = HyperLogLog()
+            sketch.update(create_row_hash(self.df[non_null_cols]).to_numpy())
+
+            distinct_rows = min(sketch.count(), self.total_rows)
+            return {
+                "duplicate_rows": self.total_rows - distinct_rows,
+                "error": int(round(distinct_rows * sketch.relative_error)),
+            }
+
+        except Exception as e:
+            logger.warning(f"Failed to estimate duplicates: {e}")
+            return {"duplicate_rows": 0, "error": 0}
+
+    def stratified_sample(self, seed: int = 0) -> pd.DataFrame:
+        """Take the head, the tail and random blocks of consecutive rows."""
+        return self.df.iloc[stratified_positions(self.total_rows, seed)]
+
+    def profile_sampled(self, total_rows: Optional[int] = None) -> ProfileResponse:
+        """
+        Profile a stratified sample and extrapolate counts to the full sheet.
+
+        Null counts are scaled from the sample; distinct counts and duplicate
+        rows are those seen in the sample and flagged as approximate. The
+        result is marked as an estimate so clients know to fetch the full
+        profile once it is ready.
+
+        Args:
+            total_rows: Rows of the full sheet when this profiler already
+                holds the stratified sample (see ExcelReader.read_sheet_rows)
+        """
+        if total_rows is None:
+            sample = self.stratified_sample()
+            total_rows = self.total_rows
+        else:
+            sample = self.df
+        sample_rows = len(sample)
+        sample_profile = DataProfiler(
+            sample, self.sheet_name, workers=1
+        ).profile_sheet()
+
+        scale = total_rows / sample_rows if sample_rows else 0
+        columns = []
+        for column in sample_profile.columns:
+            non_null_count = min(int(round(column.non_null_count * scale)), total_rows)
+            columns.append(
+                column.model_copy(
+                    update={
+                        "non_null_count": non_null_count,
+                        "null_count": total_rows - non_null_count,
+                        "unique_count_approximate": True,
+                    }
+                )
+            )
+
+        return sample_profile.model_copy(
+            update={
+                "total_rows": total_rows,
+                "columns": columns,
+                "profile_mode": "sampled",
+                "duplicate_rows_approximate": True,
+                "top_duplicate_groups": [],
+                "is_estimate": True,
+                "sample_rows": sample_rows,
+            }
+        )
 
     def profile_sheet(self) -> ProfileResponse:
         """Profile the entire sheet."""
@@ -134,20 +411,80 @@ class DataProfiler:
             f"Profiling sheet '{self.sheet_name}'",
             rows=self.total_rows,
             cols=self.total_cols,
+            approximate=self.approximate,
+        )
+
+        column_profiles = None
+        if self._use_process_pool():
+            try:
+                column_profiles = self._profile_columns_parallel()
+            except Exception as e:
+                logger.warning(
+                    f"Parallel profiling failed, profiling in-process: {e}"
+                )
+
+        if column_profiles is None:
+            column_profiles = self._profile_columns(
+                [str(col) for col in self.df.columns]
+            )
+
+        # Count duplicate rows
+        duplicate_rows_error = None
+        duplicate_groups = []
+        if self.approximate:
+            estimate = self.estimate_duplicate_rows()
+            duplicate_rows = estimate["duplicate_rows"]
+            duplicate_rows_error = estimate["error"]
+        else:
+            duplicate_rows, duplicate_groups = self.find_duplicate_rows()
+
+        logger.info(
+            f"Profiling complete for '{self.sheet_name}'",
+            duplicate_rows=duplicate_rows,
+            columns_profiled=len(column_profiles),
         )
 
-        # Profile each column
+        return ProfileResponse(
+            sheet_name=self.sheet_name,
+            total_rows=self.total_rows,
+            total_cols=self.total_cols,
+            duplicate_rows=duplicate_rows,
+            columns=column_profiles,
+            profile_mode="approximate" if self.approximate else "exact",
+            duplicate_rows_approximate=self.approximate,
+            duplicate_rows_error=duplicate_rows_error,
+            top_duplicate_groups=duplicate_groups,
+        )
+
+    def _profile_columns(self, column_names: List[str]) -> List[ColumnProfile]:
+        """Profile every column of self.df, labelling them with column_names."""
+        # Null and distinct counts for every column in one columnar pass
+        non_null_counts = self.df.notna().sum().to_numpy()
+        if self.approximate:
+            unique_counts = [
+                self._approximate_unique_count(self.df.iloc[:, position])
+                for position in range(self.total_cols)
+            ]
+        else:
+            unique_counts = self.df.nunique().to_numpy()
+
+        # Profile each column from the precomputed counts
         column_profiles = []
-        for col_name in self.df.columns:
+        for position, col_name in enumerate(column_names):
             try:
-                profile = self.profile_column(str(col_name))
+                profile = self._build_column_profile(
+                    col_name,
+                    self.df.iloc[:, position],
+                    non_null_counts[position],
+                    unique_counts[position],
+                )
                 column_profiles.append(profile)
             except Exception as e:
                 logger.error(f"Failed to profile column '{col_name}': {e}")
                 # Create minimal profile for failed column
                 column_profiles.append(
                     ColumnProfile(
-                        name=str(col_name),
+                        name=col_name,
                         dtype="error",
                         non_null_count=0,
                         null_count=self.total_rows,
@@ -157,19 +494,183 @@ class DataProfiler:
                     )
                 )
 
-        # Count duplicate rows
-        duplicate_rows = self.count_duplicate_rows()
+        return column_profiles
+
+    def _use_process_pool(self) -> bool:
+        """Whether the sheet is large enough to pay for worker processes."""
+        return (
+            self.workers > 1
+            and self.total_cols > 1
+            and self.total_rows * self.total_cols >= PARALLEL_MIN_CELLS
+        )
+
+    def _profile_columns_parallel(self) -> List[ColumnProfile]:
+        """
+        Profile column blocks in worker processes.
+
+        Each block is written once as an Arrow IPC stream into shared memory;
+        workers map it instead of receiving a pickled copy of the frame.
+        Object columns Arrow cannot store value for value are profiled here,
+        as is duplicate detection, so only column profiles are returned and
+        merged back in column order.
+        """
+        shared, local = [], []
+        for position in range(self.total_cols):
+            column = self.df.iloc[:, position]
+            exact = column.dtype != object or (
+                pd.api.types.infer_dtype(column, skipna=True)
+                in ARROW_EXACT_OBJECT_TYPES
+            )
+            (shared if exact else local).append(position)
+
+        profiles = {}
+        if local:
+            in_process = DataProfiler(
+                self.df.iloc[:, local],
+                self.sheet_name,
+                approximate=self.approximate,
+                workers=1,
+            )
+            names = [str(self.df.columns[position]) for position in local]
+            profiles.update(zip(local, in_process._profile_columns(names)))
+
+        workers = min(self.workers, len(shared))
+        blocks = np.array_split(np.array(shared, dtype=int), max(workers, 1))
+
+        segments = []
+        try:
+            if workers > 0:
+                for positions in blocks:
+                    segments.append(self._share_column_block(positions))
+
+                # Spawned workers do not inherit the server's threads or locks
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    futures = [
+                        pool.submit(
+                            _profile_shared_block,
+                            segment.name,
+                            size,
+                            [str(self.df.columns[position]) for position in positions],
+                            self.sheet_name,
+                            self.approximate,
+                        )
+                        for (segment, size), positions in zip(segments, blocks)
+                    ]
+                    for future, positions in zip(futures, blocks):
+                        profiles.update(zip(positions.tolist(), future.result()))
+
+        finally:
+            for segment, _ in segments:
+                segment.close()
+                segment.unlink()
 
         logger.info(
-            f"Profiling complete for '{self.sheet_name}'",
-            duplicate_rows=duplicate_rows,
-            columns_profiled=len(column_profiles),
+            "Profiled columns in worker processes",
+            workers=workers,
+            columns=len(shared),
+            in_process_columns=len(local),
         )
 
-        return ProfileResponse(
-            sheet_name=self.sheet_name,
-            total_rows=self.total_rows,
-            total_cols=self.total_cols,
-            duplicate_rows=duplicate_rows,
-            columns=column_profiles,
+        return [profiles[position] for position in range(self.total_cols)]
+
+    def _share_column_block(
+        self, positions: np.ndarray
+    ) -> Tuple[shared_memory.SharedMemory, int]:
+        """Write a block of columns into shared memory as an Arrow IPC stream."""
+        block = self.df.iloc[:, positions]
+        # Arrow needs unique string names; labels are restored by the worker
+        block.columns = [str(position) for position in positions]
+        table = pa.Table.from_pandas(block, preserve_index=False)
+
+        counter = pa.MockOutputStream()
+        with pa.ipc.new_stream(counter, table.schema) as writer:
+            writer.write_table(table)
+        size = counter.size()
+
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            sink = pa.FixedSizeBufferWriter(pa.py_buffer(segment.buf))
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            sink.close()
+        except Exception:
+            segment.close()
+            segment.unlink()
+            raise
+
+        return segment, size
+
+
+def _profile_shared_block(
+    segment_name: str,
+    size: int,
+    column_names: List[str],
+    sheet_name: str,
+    approximate: bool,
+) -> List[ColumnProfile]:
+    """Worker entry point: profile a column block held in shared memory."""
+    segment = shared_memory.SharedMemory(name=segment_name)
+    try:
+        return _profile_arrow_block(
+            segment.buf, size, column_names, sheet_name, approximate
+        )
+    finally:
+        segment.close()
+
+
+def _profile_arrow_block(
+    buffer: memoryview,
+    size: int,
+    column_names: List[str],
+    sheet_name: str,
+    approximate: bool,
+) -> List[ColumnProfile]:
+    """Profile an Arrow IPC column block; all views on the buffer end here."""
+    table = pa.ipc.open_stream(pa.py_buffer(buffer)[:size]).read_all()
+    # Columns that were object columns become object columns again, with ints
+    # kept as ints next to missing values, so dtypes match in-process profiling
+    block = table.to_pandas(integer_object_nulls=True)
+    for column in table.schema.pandas_metadata["columns"]:
+        if column["numpy_type"] == "object" and column["name"] in block.columns:
+            block[column["name"]] = block[column["name"]].astype(object)
+
+    profiler = DataProfiler(block, sheet_name, approximate=approximate, workers=1)
+    return profiler._profile_columns(column_names)
+
+
+def stratified_positions(total_rows: int, seed: int = 0) -> np.ndarray:
+    """
+    Row positions of the head, the tail and random blocks of consecutive rows.
+
+    Blocks keep the local row structure (e.g. grouped part numbers) that a
+    uniform row sample would break up, while head and tail catch header
+    leftovers and trailing totals.
+
+    Args:
+        total_rows: Rows of the sheet
+        seed: Seed of the block choice
+
+    Returns:
+        Sorted unique row positions
+    """
+    head_end = min(SAMPLE_HEAD_ROWS, total_rows)
+    tail_start = max(total_rows - SAMPLE_TAIL_ROWS, head_end)
+
+    positions = [np.arange(head_end), np.arange(tail_start, total_rows)]
+
+    middle_blocks = (tail_start - head_end) // SAMPLE_BLOCK_SIZE
+    if middle_blocks > 0:
+        rng = np.random.default_rng(seed)
+        block_ids = rng.choice(
+            middle_blocks,
+            size=min(SAMPLE_BLOCK_COUNT, middle_blocks),
+            replace=False,
         )
+        for block_id in block_ids:
+            block_start = head_end + int(block_id) * SAMPLE_BLOCK_SIZE
+            positions.append(np.arange(block_start, block_start + SAMPLE_BLOCK_SIZE))
+
+    return np.unique(np.concatenate(positions))
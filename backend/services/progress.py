@@ -0,0 +1,175 @@
+"""In-process progress event bus for transform jobs."""
+
+import asyncio
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from backend.core.config import settings
+from backend.models.schemas import ProgressEvent
+
+# Statuses after which a job publishes no further events
+TERMINAL_STATUSES = ("complete", "error", "cancelled")
+
+# A stream subscriber: the loop it waits on and the event that wakes it
+_Waiter = Tuple[asyncio.AbstractEventLoop, asyncio.Event]
+
+
+class ProgressBus:
+    """
+    Thread-safe store of recent progress events, scoped by job ID and file ID.
+
+    Stages publish from worker threads; pollers read the latest event and
+    stream subscribers are woken on their own event loop.
+    """
+
+    def __init__(self, history_size: int = 200, max_scopes: int = 256):
+        """Initialize with the events kept per scope and the scopes kept overall."""
+        self.history_size = history_size
+        self.max_scopes = max_scopes
+        self._history: "OrderedDict[str, Deque[ProgressEvent]]" = OrderedDict()
+        self._waiters: Dict[str, List[_Waiter]] = {}
+        self._latest: Optional[ProgressEvent] = None
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def publish(
+        self,
+        job_id: str,
+        status: str,
+        operation: str,
+        description: str,
+        progress: int,
+        file_id: Optional[str] = None,
+        stage: Optional[str] = None,
+    ) -> ProgressEvent:
+        """
+        Record a progress event and wake the subscribers of its scopes.
+
+        Args:
+            job_id: Job the event belongs to
+            status: Machine-readable state, e.g. "reading" or "complete"
+            operation: Short human-readable step name
+            description: Longer human-readable detail
+            progress: Completion percentage (0-100)
+            file_id: Uploaded file the job works on, if any
+            stage: Pipeline stage that caused the event, if any
+
+        Returns:
+            The recorded event
+        """
+        scopes = [job_id] if file_id in (None, job_id) else [job_id, file_id]
+
+        with self._lock:
+            self._sequence += 1
+            event = ProgressEvent(
+                sequence=self._sequence,
+                job_id=job_id,
+                file_id=file_id,
+                status=status,
+                operation=operation,
+                description=description,
+                progress=max(0, min(int(progress), 100)),
+                stage=stage,
+                timestamp=datetime.now(),
+            )
+
+            wake = []
+            for scope in scopes:
+                history = self._history.get(scope)
+                # A file scope follows the most recent job run on that file
+                if history and history[-1].job_id != job_id:
+                    history.clear()
+                if history is None:
+                    history = deque(maxlen=self.history_size)
+                    self._history[scope] = history
+
+                history.append(event)
+                self._history.move_to_end(scope)
+                wake.extend(self._waiters.pop(scope, []))
+
+            while len(self._history) > self.max_scopes:
+                self._history.popitem(last=False)
+
+            self._latest = event
+
+        for loop, waiter in wake:
+            try:
+                loop.call_soon_threadsafe(waiter.set)
+            except RuntimeError:
+                # The subscriber's loop has already been closed
+                pass
+
+        return event
+
+    def latest(self, scope: Optional[str] = None) -> Optional[ProgressEvent]:
+        """Latest event of a job or file, or of any job when scope is None."""
+        with self._lock:
+            if scope is None:
+                return self._latest
+            history = self._history.get(scope)
+            return history[-1] if history else None
+
+    def history(self, scope: str, after: int = 0) -> List[ProgressEvent]:
+        """Events of a job or file with a sequence number above after."""
+        with self._lock:
+            return [e for e in self._history.get(scope, ()) if e.sequence > after]
+
+    async def subscribe(
+        self, scope: str, after: int = 0, heartbeat: Optional[float] = None
+    ) -> AsyncIterator[Optional[ProgressEvent]]:
+        """
+        Yield the events of a job or file as they are published.
+
+        Buffered events are replayed first; the stream ends after a terminal
+        event. None is yielded when nothing happened for heartbeat seconds.
+
+        Args:
+            scope: Job ID or file ID to follow
+            after: Sequence number of the last event already seen
+            heartbeat: Seconds between keep-alive Nones
+
+        Yields:
+            ProgressEvent objects, or None as a keep-alive
+        """
+        heartbeat = heartbeat or settings.progress_heartbeat_seconds
+        loop = asyncio.get_running_loop()
+
+        while True:
+            waiter = (loop, asyncio.Event())
+            with self._lock:
+                events = [
+                    e for e in self._history.get(scope, ()) if e.sequence > after
+                ]
+                if not events:
+                    # Registered under the lock so no publish can slip between
+                    self._waiters.setdefault(scope, []).append(waiter)
+
+            for event in events:
+                yield event
+                after = event.sequence
+                if event.status in TERMINAL_STATUSES:
+                    return
+            if events:
+                continue
+
+            try:
+                await asyncio.wait_for(waiter[1].wait(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+            finally:
+                self._discard_waiter(scope, waiter)
+
+    def _discard_waiter(self, scope: str, waiter: _Waiter) -> None:
+        """Forget a subscriber that stopped waiting without being woken."""
+        with self._lock:
+            waiters = self._waiters.get(scope)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[scope]
+
+
+# Global progress bus instance
+progress_bus = ProgressBus(history_size=settings.progress_history_size)
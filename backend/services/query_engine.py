@@ -0,0 +1,161 @@
+"""Embedded read-only SQL engine over the processed Parquet outputs."""
+
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import duckdb
+import pyarrow as pa
+
+from backend.core.config import settings
+from backend.core.logging import logger
+
+
+class QueryError(ValueError):
+    """Raised when a query is rejected or fails to execute."""
+
+
+class QueryTimeoutError(QueryError):
+    """Raised when a query exceeds its statement timeout."""
+
+
+class QueryEngine:
+    """Run read-only SQL over processed outputs with an in-process DuckDB."""
+
+    # Output names that can be exposed as unquoted-safe view names
+    _VIEW_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+    def __init__(self, processed_folder: Optional[Path] = None):
+        """Initialize with the folder that holds the processed outputs."""
+        self.processed_folder = processed_folder or settings.processed_folder_path
+
+    def list_tables(self) -> Dict[str, str]:
+        """Map queryable table names to their Parquet source expression."""
+        tables = {}
+
+        if not self.processed_folder.exists():
+            return tables
+
+        for path in sorted(self.processed_folder.iterdir()):
+            if path.is_file() and path.suffix == ".parquet":
+                name = path.stem
+                source = f"read_parquet('{self._sql_path(path)}')"
+            elif path.is_dir() and any(path.rglob("*.parquet")):
+                # Hive-partitioned dataset folders written by DataStorage
+                name = f"{path.name}_dataset"
+                glob = self._sql_path(path) + "/**/*.parquet"
+                source = f"read_parquet('{glob}', hive_partitioning = true)"
+            else:
+                continue
+
+            if self._VIEW_NAME_PATTERN.match(name):
+                tables[name] = source
+
+        return tables
+
+    def execute(
+        self, sql: str, limit: int, timeout_seconds: float
+    ) -> Tuple[pa.Table, bool, float]:
+        """
+        Execute a read-only query.
+
+        Args:
+            sql: A single SELECT statement referencing processed tables by name
+            limit: Maximum number of rows to return
+            timeout_seconds: Wall-clock budget after which the query is interrupted
+
+        Returns:
+            Tuple of (result table, truncated flag, elapsed milliseconds)
+        """
+        tables = self.list_tables()
+        if not tables:
+            raise QueryError("No processed outputs available to query")
+
+        con = duckdb.connect(database=":memory:")
+        try:
+            for name, source in tables.items():
+                con.execute(f'CREATE VIEW "{name}" AS SELECT * FROM {source}')
+
+            # Restrict file access to the processed folder and freeze settings
+            con.execute(
+                "SET allowed_directories = "
+                f"['{self._sql_path(self.processed_folder)}']"
+            )
+            con.execute("SET enable_external_access = false")
+            con.execute(f"SET threads = {max(settings.query_threads, 1)}")
+            con.execute("SET lock_configuration = true")
+
+            statement = self._validate(con, sql)
+
+            # Fetch one extra row to tell whether the result was cut off; the
+            # newlines keep a trailing line comment from swallowing the wrapper
+            wrapped = f"SELECT * FROM (\n{statement}\n) AS q LIMIT {int(limit) + 1}"
+
+            timer = threading.Timer(timeout_seconds, con.interrupt)
+            start = time.perf_counter()
+            timer.start()
+            try:
+                result = con.execute(wrapped).to_arrow_table()
+            except duckdb.InterruptException:
+                raise QueryTimeoutError(
+                    f"Query exceeded the {timeout_seconds:g}s statement timeout"
+                )
+            except duckdb.Error as e:
+                raise QueryError(str(e))
+            finally:
+                timer.cancel()
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        finally:
+            con.close()
+
+        truncated = result.num_rows > limit
+        if truncated:
+            result = result.slice(0, limit)
+
+        logger.info(
+            "Query executed",
+            rows=result.num_rows,
+            truncated=truncated,
+            elapsed_ms=round(elapsed_ms, 2),
+        )
+
+        return result, truncated, elapsed_ms
+
+    def _validate(self, con: duckdb.DuckDBPyConnection, sql: str) -> str:
+        """Ensure the SQL is exactly one SELECT statement and return it."""
+        sql = sql.strip().rstrip(";").strip()
+        if not sql:
+            raise QueryError("Query is empty")
+
+        try:
+            statements = con.extract_statements(sql)
+        except duckdb.Error as e:
+            raise QueryError(f"Invalid SQL: {e}")
+
+        if len(statements) != 1:
+            raise QueryError("Exactly one statement is allowed per query")
+
+        if statements[0].type != duckdb.StatementType.SELECT:
+            raise QueryError("Only read-only SELECT queries are allowed")
+
+        return sql
+
+    @staticmethod
+    def _sql_path(path: Path) -> str:
+        """Render a path as a single-quoted SQL string body."""
+        return str(path.absolute()).replace("\\", "/").replace("'", "''")
+
+
+def arrow_to_records(table: pa.Table) -> List[Dict]:
+    """Convert an Arrow result to JSON-safe row dictionaries."""
+    records = table.to_pylist()
+    for record in records:
+        for key, value in record.items():
+            # NaN is not valid JSON
+            if isinstance(value, float) and value != value:
+                record[key] = None
+    return records
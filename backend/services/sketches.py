@@ -0,0 +1,143 @@
+"""Streaming sketches for approximate profiling of large sheets."""
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter over 64-bit hashes."""
+
+    def __init__(self, precision: int = 14):
+        """Initialize with 2**precision registers."""
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = np.zeros(self.num_registers, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error of the estimate relative to the true count."""
+        return 1.04 / math.sqrt(self.num_registers)
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Add a batch of 64-bit hashes."""
+        if len(hashes) == 0:
+            return
+
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        value_bits = 64 - self.precision
+
+        index = (hashes >> np.uint64(value_bits)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << value_bits) - 1)
+
+        # Rank = position of the leftmost 1-bit in the remaining bits
+        rank = (value_bits - _bit_length(remainder) + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def count(self) -> int:
+        """Estimate the number of distinct hashes seen."""
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+
+        # Linear counting is more accurate while many registers are still empty
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Bit length of each uint64 value (0 for 0)."""
+    # Each 32-bit half converts to float64 exactly, so frexp's exponent is the
+    # bit length; a whole 64-bit value could round up to the next power of two
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    _, high_length = np.frexp(high)
+    _, low_length = np.frexp(low)
+    return np.where(high_length > 0, high_length + 32, low_length)
+
+
+class KLLSketch:
+    """KLL quantile sketch over numeric values."""
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        """Initialize with accuracy parameter k (larger is more accurate)."""
+        self.k = k
+        self.count = 0
+        self.compactors: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        """Normalized rank error bound (99% confidence, DataSketches fit)."""
+        return 2.446 / self.k**0.9433
+
+    def _capacity(self, level: int) -> int:
+        """Capacity of a compactor; lower levels shrink geometrically."""
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add a batch of numeric values (NaN values are ignored)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self.count += len(values)
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self._compress()
+
+    def _compress(self) -> None:
+        """Compact any level over capacity, promoting half of it upward."""
+        level = 0
+        while level < len(self.compactors):
+            items = self.compactors[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0, dtype=np.float64))
+
+                items = np.sort(items)
+                # Keep an odd leftover at this level so weights stay exact
+                leftover = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[: len(items) - len(leftover)]
+                offset = int(self._rng.integers(2))
+
+                self.compactors[level + 1] = np.concatenate(
+                    [self.compactors[level + 1], paired[offset::2]]
+                )
+                self.compactors[level] = leftover
+            level += 1
+
+    def quantiles(self, fractions: Iterable[float]) -> Dict[float, float]:
+        """Estimate the values at the requested quantile fractions."""
+        fractions = list(fractions)
+        if self.count == 0:
+            return {q: None for q in fractions}
+
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate(
+            [
+                np.full(len(level_items), 2**level, dtype=np.float64)
+                for level, level_items in enumerate(self.compactors)
+            ]
+        )
+
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        total = cumulative[-1]
+
+        result = {}
+        for q in fractions:
+            position = int(np.searchsorted(cumulative, q * total, side="left"))
+            result[q] = float(items[min(position, len(items) - 1)])
+
+        return result
@@ -0,0 +1,85 @@
+"""Temporary Parquet spill files for stages that process data in chunks."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from backend.core.config import settings
+
+
+class SpillStore:
+    """
+    Ordered chunks of a table kept in temporary Parquet files instead of memory.
+
+    Use as a context manager; the spill folder is removed on exit.
+    """
+
+    def __init__(self, name: str = "spill", spill_folder: Optional[Path] = None):
+        """Initialize with a name for the temporary folder and its parent folder."""
+        self.name = name
+        self.spill_folder = spill_folder or settings.spill_folder_path
+        self.folder: Optional[Path] = None
+        self.paths: List[Path] = []
+        self.rows = 0
+        self._dtypes: Optional[Dict[str, object]] = None
+
+    def __enter__(self) -> "SpillStore":
+        if self.spill_folder is not None:
+            self.spill_folder.mkdir(parents=True, exist_ok=True)
+        self.folder = Path(
+            tempfile.mkdtemp(prefix=f"{self.name}_", dir=self.spill_folder)
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        shutil.rmtree(self.folder, ignore_errors=True)
+        self.paths = []
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Write the next chunk; the caller can drop its reference afterwards."""
+        if self._dtypes is None:
+            self._dtypes = df.dtypes.to_dict()
+
+        path = self.folder / f"chunk_{len(self.paths):05d}.parquet"
+        df.to_parquet(path, index=False)
+        self.paths.append(path)
+        self.rows += len(df)
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        """Read the chunks back one at a time, in the order they were written."""
+        for path in self.paths:
+            yield self._restore(pd.read_parquet(path))
+
+    def read(self) -> pd.DataFrame:
+        """Read all chunks back as one DataFrame with a fresh RangeIndex."""
+        if not self.paths:
+            return pd.DataFrame()
+
+        # Chunks with all-null columns have null Arrow types; promote them
+        table = pa.concat_tables(
+            [pq.read_table(path) for path in self.paths],
+            promote_options="permissive",
+        )
+        # self_destruct frees each Arrow column once it is converted
+        df = table.to_pandas(self_destruct=True, split_blocks=True)
+        del table
+
+        return self._restore(df)
+
+    def _restore(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Give a chunk read from Parquet the dtypes it was written with."""
+        changed = {
+            col: dtype for col, dtype in self._dtypes.items() if df[col].dtype != dtype
+        }
+        return df.astype(changed) if changed else df
+
+
+def frame_bytes(df: pd.DataFrame, columns: Optional[List[str]] = None) -> int:
+    """In-memory size of a DataFrame (or some of its columns), strings included."""
+    subset = df if columns is None else df[columns]
+    return int(subset.memory_usage(deep=True, index=False).sum())
@@ -0,0 +1,461 @@
+"""Small declarative stage engine: parallel scheduling, memoization and metrics."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend.core.config import settings
+from backend.core.logging import ETLLogger
+from backend.models.schemas import StageMetrics
+from backend.services.spill import frame_bytes
+
+try:
+    import psutil
+except ImportError:  # RSS falls back to /proc/self/statm or is not reported
+    psutil = None
+
+
+# Seconds between checkpoint calls while stages are running
+CHECKPOINT_INTERVAL = 0.5
+
+# Seconds between resident memory samples taken while a stage runs
+RSS_SAMPLE_INTERVAL = 0.05
+
+
+class StageError(RuntimeError):
+    """Raised when a pipeline is misconfigured or one of its stages fails."""
+
+
+class PipelineCancelled(StageError):
+    """Raised by a checkpoint to stop a pipeline; never wrapped by run()."""
+
+
+class Stage:
+    """A named step that turns named inputs into named outputs."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Dict[str, Any]],
+        inputs: List[str],
+        outputs: List[str],
+        memoize: bool = False,
+    ):
+        """
+        Initialize a stage.
+
+        Args:
+            name: Unique stage name
+            func: Called with the inputs as keyword arguments; returns a dict
+                holding every declared output
+            inputs: Names of the values the stage reads
+            outputs: Names of the values the stage produces
+            memoize: Reuse earlier outputs when the inputs fingerprint the same;
+                only for stages without side effects that do not mutate inputs
+        """
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.memoize = memoize
+
+
+class StageMemo:
+    """
+    Thread-safe in-memory LRU of stage outputs keyed by input fingerprint.
+
+    Bounded by entry count and by the in-memory size of the DataFrames held.
+    """
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0):
+        """
+        Initialize the memo.
+
+        Args:
+            max_entries: Stage results kept at most; 0 disables the memo
+            max_bytes: Size of the DataFrames kept at most; 0 for no size limit
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the memo keeps anything at all."""
+        return self.max_entries > 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return memoized outputs, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, outputs: Dict[str, Any]) -> None:
+        """Remember outputs, evicting the least recently used entries."""
+        if not self.enabled:
+            return
+
+        size = sum(
+            frame_bytes(value)
+            for value in outputs.values()
+            if isinstance(value, pd.DataFrame)
+        )
+        if self.max_bytes and size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (outputs, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes and self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Forget every memoized result."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+class PeakRssSampler:
+    """Context manager sampling process RSS on a thread to find its peak."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        """Initialize with the sampling interval in seconds."""
+        self.interval = interval
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self.peak: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PeakRssSampler":
+        self.start = self.peak = current_rss_bytes()
+        if self.start is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.end = current_rss_bytes()
+        self._record(self.end)
+
+    def _sample(self) -> None:
+        """Sampling loop run on the background thread."""
+        while not self._stop.wait(self.interval):
+            self._record(current_rss_bytes())
+
+    def _record(self, rss: Optional[int]) -> None:
+        """Keep the highest sample seen."""
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+
+class StagePipeline:
+    """Run stages as a DAG, starting each one as soon as its inputs exist."""
+
+    def __init__(
+        self,
+        logger: ETLLogger,
+        max_workers: Optional[int] = None,
+        memo: Optional[StageMemo] = None,
+        on_event: Optional[Callable[[str, str, float], None]] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            logger: ETL logger instance
+            max_workers: Threads running stages (defaults to PIPELINE_WORKERS)
+            memo: Shared memo for stages declared with memoize=True
+            on_event: Called with (stage name, "started" | "completed" | "failed",
+                share of stages completed) as stages run, e.g. to report progress
+            checkpoint: Called between stages and while they run; raising
+                PipelineCancelled stops scheduling. Running stages are not
+                interrupted, so they should call it themselves in long loops
+        """
+        self.logger = logger
+        self.max_workers = max_workers or settings.pipeline_workers
+        self.memo = memo
+        self.on_event = on_event
+        self.checkpoint = checkpoint
+        self.stages: Dict[str, Stage] = {}
+        self.metrics: List[StageMetrics] = []
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable[..., Dict[str, Any]],
+        inputs: List[str],
+        outputs: List[str],
+        memoize: bool = False,
+    ) -> None:
+        """Register a stage (see Stage for the arguments)."""
+        if name in self.stages:
+            raise StageError(f"Stage '{name}' is already registered")
+        self.stages[name] = Stage(name, func, inputs, outputs, memoize)
+
+    def run(
+        self, values: Dict[str, Any], fingerprints: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run every stage.
+
+        Memo keys follow the lineage of the values: initial values are
+        fingerprinted once (or as given in fingerprints), and a stage output
+        inherits the key of the stage run that made it, so DataFrames are
+        never hashed.
+
+        Args:
+            values: Initial values that stages may declare as inputs
+            fingerprints: Stable fingerprints of initial values, e.g. the
+                content hash of an uploaded file, used instead of their own
+
+        Returns:
+            The initial values plus every stage output
+        """
+        values = dict(values)
+        self._validate(values)
+
+        fingerprints = fingerprints or {}
+        lineage = {
+            name: fingerprints.get(name) or fingerprint_value(value)
+            for name, value in values.items()
+        }
+
+        pending = dict(self.stages)
+        running: Dict[Future, Stage] = {}
+        self.metrics = []
+
+        with ThreadPoolExecutor(max_workers=max(self.max_workers, 1)) as executor:
+            while pending or running:
+                self._checkpoint(running)
+                for stage in [s for s in pending.values() if self._ready(s, values)]:
+                    del pending[stage.name]
+                    inputs = {name: values[name] for name in stage.inputs}
+                    memo_key = self._memo_key(stage, lineage)
+                    future = executor.submit(self._run_stage, stage, inputs, memo_key)
+                    running[future] = stage
+
+                timeout = CHECKPOINT_INTERVAL if self.checkpoint else None
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        outputs, metrics = future.result()
+                    except PipelineCancelled:
+                        self._cancel(running)
+                        self._notify(stage.name, "failed")
+                        raise
+                    except Exception as e:
+                        self._cancel(running)
+                        self._notify(stage.name, "failed")
+                        raise StageError(f"Stage '{stage.name}' failed: {e}") from e
+
+                    values.update(outputs)
+                    lineage.update(self._output_lineage(stage, lineage))
+                    self.metrics.append(metrics)
+                    self._notify(stage.name, "completed")
+
+        return values
+
+    def _memo_key(
+        self, stage: Stage, lineage: Dict[str, Optional[str]]
+    ) -> Optional[str]:
+        """Memo key of a stage run, or None if it cannot be memoized."""
+        if not stage.memoize or self.memo is None or not self.memo.enabled:
+            return None
+        return stage_fingerprint(stage, lineage)
+
+    @staticmethod
+    def _output_lineage(
+        stage: Stage, lineage: Dict[str, Optional[str]]
+    ) -> Dict[str, Optional[str]]:
+        """Fingerprints of a stage's outputs, derived from those of its inputs."""
+        # Only memoizable stages promise outputs that follow from their inputs
+        key = stage_fingerprint(stage, lineage) if stage.memoize else None
+        return {
+            name: (
+                hashlib.sha256(f"{key}:{name}".encode("utf-8")).hexdigest()
+                if key
+                else None
+            )
+            for name in stage.outputs
+        }
+
+    def _validate(self, values: Dict[str, Any]) -> None:
+        """Check every input has exactly one producer and the graph has no cycle."""
+        producers = {name: None for name in values}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                if output in producers:
+                    raise StageError(f"Value '{output}' is produced more than once")
+                producers[output] = stage.name
+
+        for stage in self.stages.values():
+            missing = [name for name in stage.inputs if name not in producers]
+            if missing:
+                raise StageError(f"Stage '{stage.name}' has no producer for {missing}")
+
+        # Kahn's algorithm over stages; anything left over sits on a cycle
+        available = set(values)
+        remaining = dict(self.stages)
+        while remaining:
+            ready = [s for s in remaining.values() if set(s.inputs) <= available]
+            if not ready:
+                raise StageError(f"Stages form a cycle: {sorted(remaining)}")
+            for stage in ready:
+                del remaining[stage.name]
+                available.update(stage.outputs)
+
+    def _checkpoint(self, running: Dict[Future, Stage]) -> None:
+        """Call the checkpoint, cancelling queued stages if it raises."""
+        if self.checkpoint is None:
+            return
+
+        try:
+            self.checkpoint()
+        except PipelineCancelled:
+            self._cancel(running)
+            raise
+
+    @staticmethod
+    def _cancel(running: Dict[Future, Stage]) -> None:
+        """Cancel stages that have not started; started ones run to their end."""
+        for future in running:
+            future.cancel()
+
+    def _notify(self, stage_name: str, state: str) -> None:
+        """Pass a stage event to the on_event callback, if any."""
+        if self.on_event is not None:
+            self.on_event(stage_name, state, len(self.metrics) / len(self.stages))
+
+    @staticmethod
+    def _ready(stage: Stage, values: Dict[str, Any]) -> bool:
+        """Whether all inputs of a stage are available."""
+        return all(name in values for name in stage.inputs)
+
+    def _run_stage(
+        self, stage: Stage, inputs: Dict[str, Any], memo_key: Optional[str] = None
+    ):
+        """Run one stage (or reuse its memoized outputs) and measure it."""
+        self._notify(stage.name, "started")
+        start = time.perf_counter()
+
+        # Parallel stages share the process, so their peaks include each other
+        with PeakRssSampler() as rss:
+            outputs = None
+            if memo_key is not None:
+                outputs = self.memo.get(memo_key)
+
+            memoized = outputs is not None
+            if not memoized:
+                self.logger.info(f"Running stage: {stage.name}")
+                outputs = stage.func(**inputs)
+
+                missing = [name for name in stage.outputs if name not in outputs]
+                if missing:
+                    raise StageError(f"Stage '{stage.name}' did not produce {missing}")
+                outputs = {name: outputs[name] for name in stage.outputs}
+
+                if memo_key is not None:
+                    self.memo.put(memo_key, outputs)
+
+        metrics = StageMetrics(
+            name=stage.name,
+            seconds=round(time.perf_counter() - start, 4),
+            memoized=memoized,
+            rss_start_mb=_to_mb(rss.start),
+            rss_end_mb=_to_mb(rss.end),
+            rss_peak_mb=_to_mb(rss.peak),
+        )
+
+        self.logger.info(
+            f"Stage complete: {stage.name}",
+            seconds=metrics.seconds,
+            memoized=memoized,
+            rss_end_mb=metrics.rss_end_mb,
+            rss_peak_mb=metrics.rss_peak_mb,
+        )
+
+        return outputs, metrics
+
+
+def stage_fingerprint(stage: Stage, lineage: Dict[str, Optional[str]]) -> Optional[str]:
+    """
+    SHA-256 over the stage name and the fingerprints of its inputs.
+
+    Returns None when an input has no fingerprint (e.g. a DataFrame passed in
+    directly, or the output of a stage that is not memoizable).
+    """
+    digest = hashlib.sha256(stage.name.encode("utf-8"))
+    for name in sorted(stage.inputs):
+        if lineage.get(name) is None:
+            return None
+        digest.update(name.encode("utf-8"))
+        digest.update(lineage[name].encode("utf-8"))
+    return digest.hexdigest()
+
+
+def fingerprint_value(value: Any) -> Optional[str]:
+    """Fingerprint of an initial pipeline value; None for tables, never hashed."""
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return None
+
+    if isinstance(value, Path):
+        # Files are identified by path, size and modification time
+        stat = value.stat()
+        return json.dumps([str(value), stat.st_size, stat.st_mtime_ns])
+
+    if hasattr(value, "model_dump_json"):
+        return value.model_dump_json()
+
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None where it cannot be read."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _to_mb(size: Optional[int]) -> Optional[float]:
+    """Bytes to megabytes rounded for reporting."""
+    return None if size is None else round(size / (1024 * 1024), 1)
+
+
+# Stage outputs shared across requests
+stage_memo = StageMemo(
+    max_entries=settings.pipeline_memo_size,
+    max_bytes=settings.pipeline_memo_max_bytes,
+)
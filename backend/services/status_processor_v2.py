@@ -2,13 +2,18 @@
 Status sheet processor following exact specification requirements.
 """
 
-import re
 from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
 
+from backend.core.copy_on_write import lazy_copy
 from backend.core.logging import ETLLogger
+from backend.services.cleaning import (
+    HeaderMatcher,
+    find_blank_rows_and_columns,
+    parse_percentage,
+)
 
 
 class StatusProcessorV2:
@@ -16,7 +21,7 @@ class StatusProcessorV2:
 
     def __init__(self, df: pd.DataFrame, logger: ETLLogger):
         """Initialize with DataFrame and logger."""
-        self.df = df.copy()
+        self.df = lazy_copy(df)
         self.logger = logger
 
         # Column mapping specification
@@ -38,6 +43,13 @@ class StatusProcessorV2:
             "bom file date": "bom_file_date",
         }
 
+        # Header patterns in priority order; "% psw"-style patterns accept
+        # either "%" or "percent" next to the other words
+        self.header_matcher = HeaderMatcher(
+            self.column_mapping,
+            synonyms={"%": ["%", "percent"], "%.1": ["%", "percent"]},
+        )
+
         # Required output columns
         self.required_columns = [
             "plant_id",
@@ -93,7 +105,8 @@ class StatusProcessorV2:
 
             return {
                 "status_clean": self.df,
-                "project_completion_by_plant": self.df.copy(),  # Same data, different name for compatibility
+                # Same data, different name for compatibility
+                "project_completion_by_plant": lazy_copy(self.df),
             }
 
         except Exception as e:
@@ -116,31 +129,28 @@ class StatusProcessorV2:
             self.df = self.df.drop(columns=unnamed_cols)
             self.logger.info(f"Dropped {len(unnamed_cols)} unnamed columns")
 
+        # Blank (null or whitespace-only) rows and columns from one cell mask
+        blank_rows, blank_cols = find_blank_rows_and_columns(self.df)
+
         # Drop columns that are entirely blank
-        blank_cols = []
-        for col in self.df.columns:
-            if (
-                self.df[col].isna().all()
-                or (self.df[col].astype(str).str.strip() == "").all()
-            ):
-                blank_cols.append(col)
-
-        if blank_cols:
-            self.df = self.df.drop(columns=blank_cols)
-            self.logger.info(f"Dropped {len(blank_cols)} entirely blank columns")
-
-        # Find first fully empty row and truncate there
-        fully_empty_rows = self.df.isna().all(axis=1)
+        if blank_cols.any():
+            self.df = self.df.loc[:, ~blank_cols]
+            self.logger.info(f"Dropped {int(blank_cols.sum())} entirely blank columns")
+
+        # Find first fully empty (all-NaN) row and truncate there; whitespace-only
+        # spacer rows do not end the table
+        fully_empty_rows = self.df.isna().to_numpy().all(axis=1)
         if fully_empty_rows.any():
-            first_empty_idx = fully_empty_rows.idxmax()
+            first_empty_idx = int(fully_empty_rows.argmax())
             if first_empty_idx > 0:  # Keep at least some data
                 self.df = self.df.iloc[:first_empty_idx]
+                blank_rows = blank_rows[:first_empty_idx]
                 self.logger.info(
                     f"Truncated at first fully empty row: {first_empty_idx}"
                 )
 
-        # Drop rows that are fully NaN
-        self.df = self.df.dropna(how="all")
+        # Drop rows that are fully blank
+        self.df = self.df.loc[~blank_rows]
 
         self.logger.info(
             "Data cleaning complete",
@@ -150,25 +160,20 @@ class StatusProcessorV2:
 
     def _normalize_headers_and_map_schema(self):
         """Normalize headers and map to canonical schema."""
-        # Normalize headers: lower(), trim spaces, collapse multiple spaces
-        normalized_headers = {}
-        for col in self.df.columns:
-            normalized = str(col).lower().strip()
-            normalized = re.sub(r"\s+", " ", normalized)  # Collapse multiple spaces
-            normalized_headers[col] = normalized
-
         # Map to target schema - avoid duplicate mappings
+        targets = list(self.column_mapping.values())
         column_renames = {}
         used_targets = set()
 
-        for original_col, normalized_header in normalized_headers.items():
-            # Find best match in column mapping
-            for source_pattern, target_name in self.column_mapping.items():
-                if target_name not in used_targets and self._header_matches(
-                    normalized_header, source_pattern
-                ):
-                    column_renames[original_col] = target_name
-                    used_targets.add(target_name)
+        for original_col in self.df.columns:
+            # Normalize headers: lower(), trim spaces, collapse multiple spaces
+            normalized_header = HeaderMatcher.normalize(original_col)
+
+            # First matching pattern whose target is still free
+            for match in self.header_matcher.matches(normalized_header):
+                if targets[match] not in used_targets:
+                    column_renames[original_col] = targets[match]
+                    used_targets.add(targets[match])
                     break
 
         # Apply renames
@@ -185,32 +190,6 @@ class StatusProcessorV2:
             mappings=column_renames,
         )
 
-    def _header_matches(self, normalized_header: str, pattern: str) -> bool:
-        """Check if normalized header matches pattern (exact or close variant)."""
-        # Handle percentage patterns specially
-        if pattern == "% psw":
-            return ("psw" in normalized_header and "%" in normalized_header) or (
-                "psw" in normalized_header and "percent" in normalized_header
-            )
-
-        if pattern == "%.1 drawing":
-            return ("drawing" in normalized_header and "%" in normalized_header) or (
-                "drawing" in normalized_header and "percent" in normalized_header
-            )
-
-        if pattern == "% imds":
-            return ("imds" in normalized_header and "%" in normalized_header) or (
-                "imds" in normalized_header and "percent" in normalized_header
-            )
-
-        # Exact match first
-        if normalized_header == pattern:
-            return True
-
-        # For other patterns, check if all words in pattern are in header
-        pattern_words = pattern.split()
-        return all(word in normalized_header for word in pattern_words)
-
     def _apply_type_coercion_and_derived_fields(self):
         """Apply type coercion and create derived fields."""
         # Date columns
@@ -275,35 +254,8 @@ class StatusProcessorV2:
 
     def _parse_percentage_column(self, series: pd.Series) -> pd.Series:
         """Parse percentage values according to specification."""
-
-        def parse_pct(val):
-            if pd.isna(val):
-                return np.nan
-
-            val_str = str(val).strip()
-            if not val_str:
-                return np.nan
-
-            # Handle comma decimal separators
-            val_str = val_str.replace(",", ".")
-
-            # Remove % sign
-            val_str = val_str.replace("%", "")
-
-            try:
-                num_val = float(val_str)
-
-                # If value > 1 and ≤ 100, divide by 100
-                if num_val > 1 and num_val <= 100:
-                    num_val = num_val / 100.0
-
-                # Clip to [0, 1]
-                return max(0.0, min(1.0, num_val))
-
-            except ValueError:
-                return np.nan
-
-        return series.apply(parse_pct)
+        # Comma decimals; values in (1, 100] are percent; clip to [0, 1]
+        return parse_percentage(series, decimal_comma=True, max_percent=100, clip=True)
 
     def _create_derived_fields(self):
         """Create derived fields according to specification."""
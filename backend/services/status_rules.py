@@ -6,7 +6,59 @@ from typing import Dict, List, Optional
 import pandas as pd
 
 from backend.core.logging import ETLLogger
-from backend.services.cleaning import standardize_text
+from backend.services.cleaning import (
+    PERCENTAGE_WORDS,
+    WHITESPACE_PATTERN,
+    HeaderMatcher,
+    find_blank_rows_and_columns,
+    parse_percentage,
+    standardize_text,
+)
+
+# Common header standardizations; the first pattern found in a header wins
+HEADER_STANDARDIZATIONS = {
+    "oem": "OEM",
+    "project": "Project",
+    "ppap": "PPAP",
+    "psw": "PSW",
+    "total part numbers": "Total_Part_Numbers",
+    "psw available": "PSW_Available",
+    "drawing available": "Drawing_Available",
+    "1st ppap milestone": "First_PPAP_Milestone",
+    "managed by": "Managed_By",
+}
+HEADER_STANDARDIZATION_MATCHER = HeaderMatcher(HEADER_STANDARDIZATIONS, contiguous=True)
+
+# Plant/facility patterns in project names, in priority order
+PLANT_PATTERNS = [
+    re.compile(r"_([A-Z]{2,4})$", re.IGNORECASE),  # Suffix like _YMOK, _YRL
+    re.compile(r"_([A-Z]{2,4})_", re.IGNORECASE),  # Middle like _YMOK_, _YRL_
+    re.compile(r"([A-Z]{2,4})\+", re.IGNORECASE),  # Before plus like YMOK+, YRL+
+    re.compile(r"Plant[_\s]*([A-Z0-9]+)", re.IGNORECASE),  # Plant identifier
+    re.compile(r"Facility[_\s]*([A-Z0-9]+)", re.IGNORECASE),  # Facility identifier
+]
+
+# Separators that may split a project name into several plants/locations
+PLANT_SEPARATORS = ["_", "-", "+", "&"]
+
+COMPLETION_PCT_FIELDS = [
+    "overall_completion_pct",
+    "psw_completion_pct",
+    "drawing_completion_pct",
+    "imds_completion_pct",
+    "ppap_completion_pct",
+]
+
+COMPLETION_RECORD_COLUMNS = [
+    "project_name",
+    "oem",
+    "plant_id",
+    "plant_name",
+    *COMPLETION_PCT_FIELDS,
+    "completion_status",
+    "milestone_date",
+    "total_parts",
+]
 
 
 class StatusProcessor:
@@ -85,7 +137,7 @@ class StatusProcessor:
             clean_col = str(col).strip()
 
             # Collapse multiple spaces
-            clean_col = re.sub(r"\s+", " ", clean_col)
+            clean_col = WHITESPACE_PATTERN.sub(" ", clean_col)
 
             # Standardize common header patterns
             clean_col = self._standardize_header_name(clean_col)
@@ -102,24 +154,10 @@ class StatusProcessor:
 
     def _standardize_header_name(self, header: str) -> str:
         """Standardize individual header names."""
-        header_lower = header.lower()
-
-        # Common standardizations
-        standardizations = {
-            "oem": "OEM",
-            "project": "Project",
-            "ppap": "PPAP",
-            "psw": "PSW",
-            "total part numbers": "Total_Part_Numbers",
-            "psw available": "PSW_Available",
-            "drawing available": "Drawing_Available",
-            "1st ppap milestone": "First_PPAP_Milestone",
-            "managed by": "Managed_By",
-        }
-
-        for pattern, replacement in standardizations.items():
-            if pattern in header_lower:
-                return replacement
+        matcher = HEADER_STANDARDIZATION_MATCHER
+        match = matcher.first_match(header.lower())
+        if match is not None:
+            return HEADER_STANDARDIZATIONS[matcher.patterns[match]]
 
         # Default: title case with underscores
         return header.replace(" ", "_").title()
@@ -184,41 +222,7 @@ class StatusProcessor:
 
     def _parse_percentage_values(self, series: pd.Series) -> pd.Series:
         """Parse percentage values from various formats."""
-
-        def parse_value(val):
-            if pd.isna(val):
-                return None
-
-            val_str = str(val).strip()
-
-            # Handle empty strings
-            if not val_str:
-                return None
-
-            # Remove percentage sign
-            val_str = val_str.replace("%", "")
-
-            try:
-                # Convert to float
-                num_val = float(val_str)
-
-                # If value is > 1, assume it's in percentage format (e.g., 85 = 85%)
-                if num_val > 1:
-                    return num_val / 100.0
-                else:
-                    return num_val
-
-            except ValueError:
-                # Handle text values like "Complete", "N/A", etc.
-                val_lower = val_str.lower()
-                if val_lower in ["complete", "done", "finished", "100"]:
-                    return 1.0
-                elif val_lower in ["none", "n/a", "na", "not available", "0"]:
-                    return 0.0
-                else:
-                    return None
-
-        return series.apply(parse_value)
+        return parse_percentage(series, words=PERCENTAGE_WORDS)
 
     def _clean_project_names(self):
         """Clean and standardize project names."""
@@ -259,21 +263,11 @@ class StatusProcessor:
         try:
             original_count = len(self.df)
 
-            # Check for rows where all values are null or empty strings
-            def is_row_not_empty(row):
-                """Check if a row has any non-empty values."""
-                # First check if any values are not null
-                if not row.notna().any():
-                    return False
-
-                # Then check if any non-null values are not empty strings
-                non_null_values = [val for val in row if pd.notna(val)]
-                return any(str(val).strip() != "" for val in non_null_values)
-
-            mask = self.df.apply(is_row_not_empty, axis=1)
+            # Rows where every value is null or an empty string
+            blank_rows, _ = find_blank_rows_and_columns(self.df)
 
             # Filter DataFrame using the boolean mask
-            self.df = self.df.loc[mask]
+            self.df = self.df.loc[~blank_rows]
 
             removed_count = original_count - len(self.df)
 
@@ -339,12 +333,14 @@ class StatusProcessor:
         """
         Extract project completion status by plant from the status sheet.
 
+        Completion, milestone and part-count columns are coerced once per
+        column, plants are pulled out of the project names with extractall
+        and each project row is exploded into one record per plant.
+
         Returns:
             DataFrame with normalized project completion data by plant
         """
         try:
-            completion_records = []
-
             # Get column names for analysis
             columns = self.df.columns.tolist()
 
@@ -387,226 +383,236 @@ class StatusProcessor:
                 completion_cols=len(completion_cols),
             )
 
-            # Process each row to extract completion data
-            for idx, row in self.df.iterrows():
-                try:
-                    # Extract base project information
-                    project_name = (
-                        str(row.get(project_col, "")).strip()
-                        if project_col
-                        else f"Project_{idx}"
-                    )
-                    oem_name = (
-                        str(row.get(oem_col, "")).strip() if oem_col else "Unknown"
-                    )
+            # Extract base project information
+            if project_col:
+                project_names = self._column_text(project_col)
+            else:
+                project_names = pd.Series(
+                    [f"Project_{idx}" for idx in self.df.index], index=self.df.index
+                )
+            oem_names = (
+                self._column_text(oem_col)
+                if oem_col
+                else pd.Series("Unknown", index=self.df.index)
+            )
 
-                    if not project_name or project_name.lower() in ["nan", "none", ""]:
-                        continue
+            valid = ~project_names.str.lower().isin(["nan", "none", ""])
+            if not valid.any():
+                self.logger.warning("No completion records extracted")
+                return pd.DataFrame()
 
-                    # Extract plant information from project name
-                    plants = self._extract_plants_from_project(project_name)
+            projects = pd.DataFrame(
+                {"project_name": project_names[valid], "oem": oem_names[valid]}
+            )
 
-                    # If no plants extracted, create a single record for the project
-                    if not plants:
-                        plants = [
-                            {"plant_id": project_name, "plant_name": project_name}
-                        ]
+            # Per-project metrics, shared by every plant of the project
+            for field, values in self._completion_percentages(
+                completion_cols
+            ).items():
+                projects[field] = values[valid]
+            projects["milestone_date"] = self._first_valid_value(
+                milestone_cols, self._to_milestone_date
+            )[valid]
+            projects["total_parts"] = self._first_valid_value(
+                [
+                    col
+                    for col in columns
+                    if "total" in str(col).lower() and "part" in str(col).lower()
+                ],
+                self._to_part_count,
+            )[valid]
+            projects["completion_status"] = self._determine_completion_status(
+                projects
+            )
+            projects = projects.reset_index(drop=True)
 
-                    # Process completion data for each plant
-                    for plant_info in plants:
-                        completion_record = {
-                            "project_name": project_name,
-                            "oem": oem_name,
-                            "plant_id": plant_info["plant_id"],
-                            "plant_name": plant_info["plant_name"],
-                            "overall_completion_pct": None,
-                            "psw_completion_pct": None,
-                            "drawing_completion_pct": None,
-                            "imds_completion_pct": None,
-                            "ppap_completion_pct": None,
-                            "completion_status": "Unknown",
-                            "milestone_date": None,
-                            "total_parts": None,
-                        }
-
-                        # Extract completion percentages
-                        for col in completion_cols:
-                            col_lower = str(col).lower()
-
-                            # Handle potential Series values from duplicate columns
-                            try:
-                                value = row[col]
-                                # If value is a Series, take the first non-null value
-                                if hasattr(value, "iloc"):
-                                    value = value.iloc[0] if len(value) > 0 else None
-                            except (KeyError, IndexError):
-                                continue
-
-                            # Special handling for drawing (may be referred to as '%.1 drawing')
-                            if ".1" in col_lower and "drawing" in col_lower:
-                                col_lower = "drawing"  # Normalize to 'drawing' for matching below
-
-                            if pd.notna(value):
-                                # Parse completion value
-                                completion_pct = self._parse_completion_value(value)
-
-                                # Categorize by column type
-                                if "psw" in col_lower:
-                                    completion_record["psw_completion_pct"] = (
-                                        completion_pct
-                                    )
-                                elif "drawing" in col_lower:
-                                    completion_record["drawing_completion_pct"] = (
-                                        completion_pct
-                                    )
-                                elif "imds" in col_lower:
-                                    completion_record["imds_completion_pct"] = (
-                                        completion_pct
-                                    )
-                                elif "ppap" in col_lower:
-                                    completion_record["ppap_completion_pct"] = (
-                                        completion_pct
-                                    )
-                                elif any(
-                                    keyword in col_lower
-                                    for keyword in ["total", "overall", "complete"]
-                                ):
-                                    completion_record["overall_completion_pct"] = (
-                                        completion_pct
-                                    )
-
-                        # Extract milestone dates
-                        for col in milestone_cols:
-                            try:
-                                value = row[col]
-                                # If value is a Series, take the first non-null value
-                                if hasattr(value, "iloc"):
-                                    value = value.iloc[0] if len(value) > 0 else None
-                            except (KeyError, IndexError):
-                                continue
-
-                            if pd.notna(value):
-                                try:
-                                    milestone_date = pd.to_datetime(
-                                        value, errors="coerce"
-                                    )
-                                    if pd.notna(milestone_date):
-                                        completion_record["milestone_date"] = (
-                                            milestone_date.date()
-                                        )
-                                        break  # Use first valid date found
-                                except:
-                                    continue
-
-                        # Extract total parts if available
-                        for col in columns:
-                            if (
-                                "total" in str(col).lower()
-                                and "part" in str(col).lower()
-                            ):
-                                try:
-                                    value = row[col]
-                                    # If value is a Series, take the first non-null value
-                                    if hasattr(value, "iloc"):
-                                        value = (
-                                            value.iloc[0] if len(value) > 0 else None
-                                        )
-                                except (KeyError, IndexError):
-                                    continue
-
-                                if pd.notna(value):
-                                    try:
-                                        completion_record["total_parts"] = int(
-                                            float(str(value))
-                                        )
-                                        break
-                                    except:
-                                        continue
-
-                        # Determine overall completion status
-                        completion_record["completion_status"] = (
-                            self._determine_completion_status(completion_record)
-                        )
-
-                        completion_records.append(completion_record)
+            # One record per (project row, plant), in sheet and match order
+            plants = self._extract_plants(projects["project_name"])
+            completion_df = plants.join(projects, on="row")
+            completion_df = completion_df[COMPLETION_RECORD_COLUMNS].reset_index(
+                drop=True
+            )
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to process completion data for row {idx}: {e}"
+            # Records are built from object columns, as from a list of dicts
+            completion_df = completion_df.astype(object).infer_objects()
+            for col in COMPLETION_RECORD_COLUMNS:
+                if completion_df[col].isna().all():
+                    completion_df[col] = pd.Series(
+                        [None] * len(completion_df), dtype=object
                     )
-                    continue
-
-            # Create DataFrame from records
-            if completion_records:
-                completion_df = pd.DataFrame(completion_records)
 
-                # Remove duplicates (same project + plant combination)
-                completion_df = completion_df.drop_duplicates(
-                    subset=["project_name", "plant_id"], keep="first"
-                )
+            # Remove duplicates (same project + plant combination)
+            completion_df = completion_df.drop_duplicates(
+                subset=["project_name", "plant_id"], keep="first"
+            )
 
-                self.logger.info(
-                    "Project completion extraction complete",
-                    total_records=len(completion_df),
-                    unique_projects=completion_df["project_name"].nunique(),
-                    unique_plants=completion_df["plant_id"].nunique(),
-                )
+            self.logger.info(
+                "Project completion extraction complete",
+                total_records=len(completion_df),
+                unique_projects=completion_df["project_name"].nunique(),
+                unique_plants=completion_df["plant_id"].nunique(),
+            )
 
-                return completion_df
-            else:
-                self.logger.warning("No completion records extracted")
-                return pd.DataFrame()
+            return completion_df
 
         except Exception as e:
             self.logger.error(f"Failed to extract project completion data: {e}")
             return pd.DataFrame()
 
-    def _extract_plants_from_project(self, project_name: str) -> List[Dict[str, str]]:
+    def _column_values(self, col: str) -> pd.Series:
+        """Values of a column; the first one wins when the name is duplicated."""
+        values = self.df.loc[:, col]
+        if isinstance(values, pd.DataFrame):
+            values = values.iloc[:, 0]
+        return values
+
+    def _column_text(self, col: str) -> pd.Series:
+        """Column values rendered as stripped strings (missing -> "nan")."""
+        return self._column_values(col).astype(object).map(str).str.strip()
+
+    def _coerce_column(self, col: str, convert) -> pd.Series:
+        """Apply a scalar converter once per distinct non-null value of a column."""
+        values = self._column_values(col)
+        present = values.notna()
+        uniques = pd.unique(values[present])
+        lookup = dict(zip(uniques, map(convert, uniques)))
+        return values[present].map(lookup).reindex(values.index)
+
+    def _completion_percentages(self, completion_cols: List[str]) -> Dict:
+        """Parse the completion columns into one percentage series per field."""
+        fields = {
+            field: pd.Series(None, index=self.df.index, dtype=object)
+            for field in COMPLETION_PCT_FIELDS
+        }
+
+        for col in completion_cols:
+            col_lower = str(col).lower()
+
+            # Special handling for drawing (may be referred to as '%.1 drawing')
+            if ".1" in col_lower and "drawing" in col_lower:
+                col_lower = "drawing"  # Normalize to 'drawing' for matching below
+
+            # Categorize by column type
+            if "psw" in col_lower:
+                field = "psw_completion_pct"
+            elif "drawing" in col_lower:
+                field = "drawing_completion_pct"
+            elif "imds" in col_lower:
+                field = "imds_completion_pct"
+            elif "ppap" in col_lower:
+                field = "ppap_completion_pct"
+            elif any(
+                keyword in col_lower for keyword in ["total", "overall", "complete"]
+            ):
+                field = "overall_completion_pct"
+            else:
+                continue
+
+            # A later column overwrites the field wherever it has a value,
+            # even when that value cannot be parsed
+            present = self._column_values(col).notna()
+            parsed = self._coerce_column(col, self._parse_completion_value)
+            fields[field] = parsed.astype(object).where(present, fields[field])
+
+        return fields
+
+    def _first_valid_value(self, cols: List[str], convert) -> pd.Series:
+        """First successfully converted value across columns, per row."""
+        result = pd.Series(None, index=self.df.index, dtype=object)
+        for col in cols:
+            converted = self._coerce_column(col, convert).astype(object)
+            result = result.where(result.notna(), converted)
+        return result.where(result.notna(), None)
+
+    @staticmethod
+    def _to_milestone_date(value):
+        """Convert a raw milestone value to a date, or None."""
+        try:
+            milestone_date = pd.to_datetime(value, errors="coerce")
+            return milestone_date.date() if pd.notna(milestone_date) else None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _to_part_count(value) -> Optional[int]:
+        """Convert a raw part count to int, or None."""
+        try:
+            return int(float(str(value)))
+        except Exception:
+            return None
+
+    def _extract_plants(self, project_names: pd.Series) -> pd.DataFrame:
         """
-        Extract plant information from project name.
+        Extract plant records from project names.
 
         Args:
-            project_name: Project name that may contain plant identifiers
+            project_names: Project names with a default RangeIndex
 
         Returns:
-            List of plant dictionaries with plant_id and plant_name
+            DataFrame of (row, plant_id, plant_name) ordered by row, then by
+            pattern and match position within the name
         """
-        plants = []
-
-        # Common plant/facility patterns
-        plant_patterns = [
-            r"_([A-Z]{2,4})$",  # Suffix like _YMOK, _YRL
-            r"_([A-Z]{2,4})_",  # Middle like _YMOK_, _YRL_
-            r"([A-Z]{2,4})\+",  # Before plus like YMOK+, YRL+
-            r"Plant[_\s]*([A-Z0-9]+)",  # Plant identifier
-            r"Facility[_\s]*([A-Z0-9]+)",  # Facility identifier
-        ]
-
-        for pattern in plant_patterns:
-            matches = re.findall(pattern, project_name, re.IGNORECASE)
-            for match in matches:
-                plant_id = match.upper()
-                plants.append({"plant_id": plant_id, "plant_name": f"Plant_{plant_id}"})
-
-        # If no specific plants found, try to extract from the full project name
-        if not plants:
-            # Look for common separators that might indicate multiple plants/locations
-            separators = ["_", "-", "+", "&"]
-            for sep in separators:
-                if sep in project_name:
-                    parts = project_name.split(sep)
-                    for i, part in enumerate(parts):
-                        if len(part.strip()) >= 2:  # Reasonable plant identifier length
-                            plant_id = part.strip().upper()
-                            plants.append(
-                                {
-                                    "plant_id": plant_id,
-                                    "plant_name": f"Plant_{plant_id}",
-                                }
-                            )
-                    break
-
-        return plants
+        sources = []
+
+        # Plant/facility patterns; all matches of every pattern are kept
+        for order, pattern in enumerate(PLANT_PATTERNS):
+            found = project_names.str.extractall(pattern)[0].str.upper()
+            sources.append(
+                pd.DataFrame(
+                    {
+                        "row": found.index.get_level_values(0),
+                        "order": order,
+                        "match": found.index.get_level_values("match"),
+                        "plant_id": found.to_numpy(),
+                    }
+                )
+            )
+        matched_rows = pd.concat(sources)["row"].unique()
+
+        # If no specific plants found, split on the first separator present
+        unmatched = project_names[~project_names.index.isin(matched_rows)]
+        separator = pd.Series(None, index=unmatched.index, dtype=object)
+        for sep in reversed(PLANT_SEPARATORS):
+            separator[unmatched.str.contains(sep, regex=False)] = sep
+
+        for sep in PLANT_SEPARATORS:
+            names = unmatched[separator == sep]
+            parts = names.str.split(sep, regex=False).explode().str.strip()
+            parts = parts[parts.str.len() >= 2]  # Reasonable plant identifier length
+            sources.append(
+                pd.DataFrame(
+                    {
+                        "row": parts.index,
+                        "order": 0,
+                        "match": parts.groupby(level=0).cumcount().to_numpy(),
+                        "plant_id": parts.str.upper().to_numpy(),
+                    }
+                )
+            )
+
+        plants = pd.concat(sources, ignore_index=True)
+        plants["plant_name"] = "Plant_" + plants["plant_id"]
+
+        # Projects without any plant become a single record for the project
+        whole = project_names[~project_names.index.isin(plants["row"])]
+        plants = pd.concat(
+            [
+                plants,
+                pd.DataFrame(
+                    {
+                        "row": whole.index,
+                        "order": 0,
+                        "match": 0,
+                        "plant_id": whole.to_numpy(),
+                        "plant_name": whole.to_numpy(),
+                    }
+                ),
+            ],
+            ignore_index=True,
+        )
+
+        plants = plants.sort_values(["row", "order", "match"], kind="stable")
+        return plants[["row", "plant_id", "plant_name"]]
 
     def _parse_completion_value(self, value) -> Optional[float]:
         """
@@ -646,44 +652,27 @@ class StatusProcessor:
         except:
             return None
 
-    def _determine_completion_status(self, record: Dict) -> str:
+    def _determine_completion_status(self, projects: pd.DataFrame) -> pd.Series:
         """
         Determine overall completion status based on available metrics.
 
         Args:
-            record: Completion record dictionary
+            projects: Per-project completion percentages
 
         Returns:
-            Status string
+            Status string per project
         """
-        # Collect all available completion percentages
-        completion_values = []
-
-        for key in [
-            "overall_completion_pct",
-            "psw_completion_pct",
-            "drawing_completion_pct",
-            "imds_completion_pct",
-            "ppap_completion_pct",
-        ]:
-            value = record.get(key)
-            if value is not None:
-                completion_values.append(value)
-
-        if not completion_values:
-            return "Unknown"
-
-        # Calculate average completion
-        avg_completion = sum(completion_values) / len(completion_values)
+        # Average of the available completion percentages
+        avg_completion = (
+            projects[COMPLETION_PCT_FIELDS].astype(float).mean(axis=1, skipna=True)
+        )
 
         # Determine status based on average
-        if avg_completion >= 1.0:
-            return "Complete"
-        elif avg_completion >= 0.8:
-            return "Near Complete"
-        elif avg_completion >= 0.5:
-            return "In Progress"
-        elif avg_completion > 0:
-            return "Started"
-        else:
-            return "Not Started"
+        status = pd.Series("Not Started", index=projects.index, dtype=object)
+        status[avg_completion > 0] = "Started"
+        status[avg_completion >= 0.5] = "In Progress"
+        status[avg_completion >= 0.8] = "Near Complete"
+        status[avg_completion >= 1.0] = "Complete"
+        status[avg_completion.isna()] = "Unknown"
+
+        return status
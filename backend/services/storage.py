@@ -1,31 +1,95 @@
 """Data storage service for saving processed data in multiple formats."""
 
+import gzip
+import shutil
 import sqlite3
 from pathlib import Path
-from typing import Dict, List
+from typing import BinaryIO, Dict, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from sqlalchemy import create_engine
 
 from backend.core.config import settings
+from backend.core.copy_on_write import lazy_copy
 from backend.core.logging import ETLLogger
 from backend.models.schemas import ArtifactInfo
 
+try:
+    import zstandard
+except ImportError:  # zstd CSV output is optional
+    zstandard = None
+
+# File suffix per CSV compression option (CSV_COMPRESSION)
+CSV_COMPRESSION_SUFFIXES = {
+    "none": ".csv",
+    "gzip": ".csv.gz",
+    "zstd": ".csv.zst",
+}
+
+# Parquet writer profiles selectable through PARQUET_PROFILE
+PARQUET_PROFILES = {
+    # Plain pandas-style output: no sorting, one row group per write
+    "default": {
+        "compression": "snappy",
+        "compression_level": None,
+        "row_group_size": None,
+        "sort": False,
+        "dictionary_columns": False,
+    },
+    # Sorted, row groups sized for predicate pushdown, dictionary encoded
+    "optimized": {
+        "compression": "snappy",
+        "compression_level": None,
+        "row_group_size": 128_000,
+        "sort": True,
+        "dictionary_columns": True,
+    },
+    # Same layout as "optimized" with heavier zstd compression for archiving
+    "compact": {
+        "compression": "zstd",
+        "compression_level": 9,
+        "row_group_size": 128_000,
+        "sort": True,
+        "dictionary_columns": True,
+    },
+}
+
+# Sort keys per table so row group statistics are selective for common filters
+PARQUET_SORT_KEYS = {
+    "plant_item_status": ["part_id_std", "project_plant"],
+    "fact_parts": ["item_id"],  # part_id_std is renamed to item_id in fact_parts
+}
+
+# Plant key per table for Hive-partitioned dataset output (PARQUET_PARTITION_BY_PLANT)
+PARQUET_PARTITION_COLUMNS = {
+    "plant_item_status": "project_plant",
+    "project_completion_by_plant": "plant_id",
+}
+
+# Text columns whose distinct ratio is below this are written as dictionary
+# (categorical) columns
+DICTIONARY_CARDINALITY_RATIO = 0.1
+
 
 class DataStorage:
     """Service for storing processed data in multiple formats."""
 
-    def __init__(self, logger: ETLLogger):
-        """Initialize with logger."""
+    def __init__(self, logger: ETLLogger, processed_folder: Optional[Path] = None):
+        """Initialize with logger and the output folder (default PROCESSED_FOLDER)."""
         self.logger = logger
-        self.processed_folder = settings.processed_folder_path
+        self.processed_folder = processed_folder or settings.processed_folder_path
         self.processed_folder.mkdir(parents=True, exist_ok=True)
 
     def save_all_formats(
         self, dataframes: Dict[str, pd.DataFrame]
     ) -> List[ArtifactInfo]:
         """
-        Save all DataFrames in CSV, Parquet, and SQLite formats.
+        Save all DataFrames in CSV, Parquet, Arrow IPC, and SQLite formats.
 
         Args:
             dataframes: Dictionary of {table_name: DataFrame}
@@ -51,10 +115,20 @@ class DataStorage:
             csv_artifacts = self._save_csv(table_name, df)
             artifacts.extend(csv_artifacts)
 
+            # Typed columnar formats share one prepared copy of the table
+            columnar_df = self._prepare_columnar_frame(table_name, df)
+            if columnar_df is None:
+                continue
+
             # Save Parquet
-            parquet_artifacts = self._save_parquet(table_name, df)
+            parquet_artifacts = self._save_parquet(table_name, columnar_df)
             artifacts.extend(parquet_artifacts)
 
+            # Save Arrow IPC (Feather v2) for memory-mapped reloads
+            if settings.arrow_output:
+                arrow_artifacts = self._save_arrow(table_name, columnar_df)
+                artifacts.extend(arrow_artifacts)
+
         # Save SQLite database with all tables
         sqlite_artifacts = self._save_sqlite(dataframes)
         artifacts.extend(sqlite_artifacts)
@@ -64,43 +138,60 @@ class DataStorage:
         return artifacts
 
     def _save_csv(self, table_name: str, df: pd.DataFrame) -> List[ArtifactInfo]:
-        """Save DataFrame as CSV with optimized settings."""
+        """Stream DataFrame to CSV in fixed-size batches, optionally compressed."""
         try:
-            csv_path = self.processed_folder / f"{table_name}.csv"
-
-            # Convert datetime columns to strings for CSV compatibility (optimized)
-            df_csv = df.copy()
-            for col in df_csv.columns:
-                if pd.api.types.is_datetime64_any_dtype(df_csv[col]):
-                    # Use vectorized string conversion for better performance
-                    df_csv[col] = df_csv[col].dt.strftime("%Y-%m-%d")
-                elif "datetime" in str(df_csv[col].dtype).lower():
-                    df_csv[col] = df_csv[col].astype(str)
-
-            # Save with optimized settings for large files
-            df_csv.to_csv(
-                csv_path,
-                index=False,
-                encoding="utf-8",
-                chunksize=(
-                    10000 if len(df_csv) > 50000 else None
-                ),  # Chunk large datasets
-                compression=None,  # No compression for CSV (faster)
+            compression = settings.csv_compression.lower()
+            if compression == "zstd" and zstandard is None:
+                self.logger.warning(
+                    "zstandard is not installed, falling back to gzip CSV compression"
+                )
+                compression = "gzip"
+            if compression not in CSV_COMPRESSION_SUFFIXES:
+                self.logger.warning(
+                    f"Unsupported CSV compression '{compression}', writing plain CSV"
+                )
+                compression = "none"
+
+            csv_path = (
+                self.processed_folder
+                / f"{table_name}{CSV_COMPRESSION_SUFFIXES[compression]}"
             )
+            batch_size = max(settings.chunk_size, 1)
+            uncompressed_size = 0
+
+            with self._open_csv_sink(csv_path, compression) as sink:
+                for start in range(0, len(df), batch_size):
+                    # Batches are views of the typed frame; dates are formatted
+                    # by to_csv as each batch is rendered instead of up front,
+                    # as dates only like the whole-frame strftime this replaced
+                    chunk = df.iloc[start : start + batch_size].to_csv(
+                        index=False,
+                        header=start == 0,
+                        date_format="%Y-%m-%d",
+                    )
+                    data = chunk.encode("utf-8")
+                    uncompressed_size += len(data)
+                    sink.write(data)
 
             file_size = csv_path.stat().st_size
 
             self.logger.info(
-                f"Saved CSV: {table_name}", path=str(csv_path), size_bytes=file_size
+                f"Saved CSV: {table_name}",
+                path=str(csv_path),
+                compression=compression,
+                size_bytes=file_size,
+                uncompressed_size_bytes=uncompressed_size,
             )
 
             return [
                 ArtifactInfo(
-                    name=f"{table_name}.csv",
+                    name=csv_path.name,
                     path=str(csv_path),
                     format="CSV",
                     size_bytes=file_size,
                     row_count=len(df),
+                    compression=None if compression == "none" else compression,
+                    uncompressed_size_bytes=uncompressed_size,
                 )
             ]
 
@@ -108,11 +199,22 @@ class DataStorage:
             self.logger.error(f"Failed to save CSV for {table_name}: {e}")
             return []
 
-    def _save_parquet(self, table_name: str, df: pd.DataFrame) -> List[ArtifactInfo]:
-        """Save DataFrame as Parquet with optimized data type handling."""
+    def _open_csv_sink(self, csv_path: Path, compression: str) -> BinaryIO:
+        """Open a binary sink for CSV output with the requested compression."""
+        if compression == "gzip":
+            return gzip.open(csv_path, "wb", compresslevel=6)
+        if compression == "zstd":
+            return zstandard.ZstdCompressor(level=3).stream_writer(
+                open(csv_path, "wb"), closefd=True
+            )
+        return open(csv_path, "wb")
+
+    def _prepare_columnar_frame(
+        self, table_name: str, df: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """Coerce column types once for the typed columnar formats (Parquet, Arrow)."""
         try:
-            parquet_path = self.processed_folder / f"{table_name}.parquet"
-            df_parquet = df.copy()
+            df_parquet = lazy_copy(df)
 
             # Common date formats to try (most common first for performance)
             date_formats = [
@@ -192,7 +294,8 @@ class DataStorage:
                                 except (ValueError, TypeError):
                                     continue
 
-                            # If no specific format worked, try general parsing but with cache
+                            # If no specific format worked, try general parsing
+                            # but with cache
                             if parsed_date is None or parsed_date.isna().all():
                                 parsed_date = pd.to_datetime(
                                     df_parquet[col], errors="coerce", cache=True
@@ -214,14 +317,20 @@ class DataStorage:
                             df_parquet[col].astype("string").replace("<NA>", None)
                         )
 
-            # Save with optimized settings
-            df_parquet.to_parquet(
-                parquet_path,
-                index=False,
-                engine="pyarrow",
-                compression="snappy",  # Fast compression
-                use_deprecated_int96_timestamps=False,
-            )
+            return df_parquet
+
+        except Exception as e:
+            self.logger.error(f"Failed to prepare columnar data for {table_name}: {e}")
+            return None
+
+    def _save_parquet(self, table_name: str, df: pd.DataFrame) -> List[ArtifactInfo]:
+        """Save a type-prepared DataFrame as Parquet."""
+        try:
+            parquet_path = self.processed_folder / f"{table_name}.parquet"
+            df_parquet = df
+
+            # Save with the configured writer profile
+            self._write_parquet(table_name, df_parquet, parquet_path)
 
             file_size = parquet_path.stat().st_size
 
@@ -231,7 +340,7 @@ class DataStorage:
                 size_bytes=file_size,
             )
 
-            return [
+            artifacts = [
                 ArtifactInfo(
                     name=f"{table_name}.parquet",
                     path=str(parquet_path),
@@ -241,10 +350,350 @@ class DataStorage:
                 )
             ]
 
+            # Optionally also write a plant-partitioned dataset for folder queries
+            if (
+                settings.parquet_partition_by_plant
+                and table_name in PARQUET_PARTITION_COLUMNS
+            ):
+                artifacts.extend(
+                    self._save_parquet_dataset(
+                        table_name, df_parquet, PARQUET_PARTITION_COLUMNS[table_name]
+                    )
+                )
+
+            return artifacts
+
         except Exception as e:
             self.logger.error(f"Failed to save Parquet for {table_name}: {e}")
             return []
 
+    def _save_parquet_dataset(
+        self, table_name: str, df: pd.DataFrame, partition_col: str
+    ) -> List[ArtifactInfo]:
+        """Save DataFrame as a Hive-partitioned Parquet dataset keyed by plant."""
+        try:
+            if partition_col not in df.columns:
+                self.logger.warning(
+                    f"Partition column '{partition_col}' missing, "
+                    f"skipping dataset for {table_name}"
+                )
+                return []
+
+            dataset_path = self.processed_folder / table_name
+            if dataset_path.exists():
+                shutil.rmtree(dataset_path)
+
+            profile = self._get_parquet_profile()
+
+            # Sort so each partition file is laid out like the single-file output
+            sort_keys = []
+            if profile["sort"]:
+                sort_keys = [
+                    col
+                    for col in PARQUET_SORT_KEYS.get(table_name, [])
+                    if col in df and col != partition_col
+                ]
+                if sort_keys:
+                    df = df.sort_values(sort_keys, kind="stable", ignore_index=True)
+
+            dictionary_columns = []
+            if profile["dictionary_columns"]:
+                dictionary_columns = [
+                    col
+                    for col in self._get_dictionary_columns(df)
+                    if col != partition_col
+                ]
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = self._encode_dictionary_columns(table, dictionary_columns)
+
+            # Dictionary-encode the plant key so readers get a categorical column
+            key_index = table.schema.get_field_index(partition_col)
+            table = table.set_column(
+                key_index,
+                partition_col,
+                pc.dictionary_encode(table[partition_col].cast(pa.string())),
+            )
+
+            partitioning = ds.partitioning(
+                pa.schema(
+                    [pa.field(partition_col, pa.dictionary(pa.int32(), pa.string()))]
+                ),
+                flavor="hive",
+            )
+
+            file_options = ds.ParquetFileFormat().make_write_options(
+                compression=profile["compression"],
+                compression_level=profile["compression_level"],
+                use_dictionary=True,
+                write_statistics=True,
+            )
+
+            row_group_size = profile["row_group_size"] or 1_048_576
+            ds.write_dataset(
+                table,
+                dataset_path,
+                format="parquet",
+                partitioning=partitioning,
+                file_options=file_options,
+                basename_template="part-{i}.parquet",
+                max_rows_per_group=row_group_size,
+                min_rows_per_group=min(row_group_size, 1024),
+                existing_data_behavior="delete_matching",
+            )
+
+            partition_files = list(dataset_path.rglob("*.parquet"))
+            dataset_size = sum(f.stat().st_size for f in partition_files)
+
+            self.logger.info(
+                f"Saved partitioned Parquet dataset: {table_name}",
+                path=str(dataset_path),
+                partition_col=partition_col,
+                partitions=len(partition_files),
+                size_bytes=dataset_size,
+            )
+
+            return [
+                ArtifactInfo(
+                    name=table_name,
+                    path=str(dataset_path),
+                    format="Parquet Dataset",
+                    size_bytes=dataset_size,
+                    row_count=len(df),
+                )
+            ]
+
+        except Exception as e:
+            self.logger.error(
+                f"Failed to save partitioned Parquet dataset for {table_name}: {e}"
+            )
+            return []
+
+    def _save_arrow(self, table_name: str, df: pd.DataFrame) -> List[ArtifactInfo]:
+        """Save a type-prepared DataFrame as Arrow IPC (Feather v2)."""
+        try:
+            arrow_path = self.processed_folder / f"{table_name}.arrow"
+
+            # Uncompressed files can be memory-mapped without any decode step
+            compression = settings.arrow_compression.lower()
+            if compression not in ("uncompressed", "lz4"):
+                self.logger.warning(
+                    f"Unsupported Arrow compression '{compression}', "
+                    "using 'uncompressed'"
+                )
+                compression = "uncompressed"
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            feather.write_feather(
+                table,
+                arrow_path,
+                compression=compression,
+                chunksize=settings.chunk_size * 10,
+            )
+
+            file_size = arrow_path.stat().st_size
+
+            self.logger.info(
+                f"Saved Arrow IPC: {table_name}",
+                path=str(arrow_path),
+                compression=compression,
+                size_bytes=file_size,
+            )
+
+            return [
+                ArtifactInfo(
+                    name=f"{table_name}.arrow",
+                    path=str(arrow_path),
+                    format="Arrow",
+                    size_bytes=file_size,
+                    row_count=len(df),
+                )
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Failed to save Arrow IPC for {table_name}: {e}")
+            return []
+
+    def save_consolidated_parquet(
+        self, sources: Dict[str, Path], source_column: str = "source_file_id"
+    ) -> List[ArtifactInfo]:
+        """
+        Concatenate each table's Parquet output across several output folders.
+
+        Args:
+            sources: {source label: folder holding one run's outputs}
+            source_column: Column added to every row naming its source
+
+        Returns:
+            List of artifact information for the consolidated tables
+        """
+        artifacts = []
+        table_names = sorted(
+            {
+                path.stem
+                for folder in sources.values()
+                for path in folder.glob("*.parquet")
+            }
+        )
+
+        for table_name in table_names:
+            try:
+                parts = []
+                for label, folder in sources.items():
+                    parquet_path = folder / f"{table_name}.parquet"
+                    if not parquet_path.exists():
+                        continue
+
+                    part = pq.read_table(parquet_path)
+                    labels = pa.array([label] * part.num_rows, type=pa.string())
+                    parts.append(part.add_column(0, source_column, labels))
+
+                # Runs may disagree on types (e.g. an all-null column); widen them
+                table = pa.concat_tables(parts, promote_options="permissive")
+                parquet_path = self.processed_folder / f"{table_name}.parquet"
+                self._write_parquet(table_name, table.to_pandas(), parquet_path)
+
+                artifacts.append(
+                    ArtifactInfo(
+                        name=f"{table_name}.parquet",
+                        path=str(parquet_path),
+                        format="Parquet",
+                        size_bytes=parquet_path.stat().st_size,
+                        row_count=table.num_rows,
+                    )
+                )
+
+            except Exception as e:
+                self.logger.error(f"Failed to consolidate {table_name}: {e}")
+
+        self.logger.info(
+            "Consolidated Parquet outputs",
+            sources=len(sources),
+            tables=len(artifacts),
+        )
+
+        return artifacts
+
+    def load_table(self, table_name: str) -> pa.Table:
+        """
+        Load a processed table, preferring the memory-mapped Arrow IPC file.
+
+        Args:
+            table_name: Name of the processed table (without extension)
+
+        Returns:
+            Arrow table; uncompressed Arrow files are read zero-copy
+        """
+        arrow_path = self.processed_folder / f"{table_name}.arrow"
+        if arrow_path.exists():
+            source = pa.memory_map(str(arrow_path), "r")
+            return pa.ipc.open_file(source).read_all()
+
+        parquet_path = self.processed_folder / f"{table_name}.parquet"
+        if parquet_path.exists():
+            return pq.read_table(parquet_path, memory_map=True)
+
+        raise FileNotFoundError(f"No processed output found for table '{table_name}'")
+
+    def _get_parquet_profile(self) -> Dict:
+        """Resolve the active Parquet writer profile including overrides."""
+        profile_name = settings.parquet_profile.lower()
+        if profile_name not in PARQUET_PROFILES:
+            self.logger.warning(
+                f"Unknown Parquet profile '{profile_name}', using 'optimized'"
+            )
+            profile_name = "optimized"
+
+        profile = dict(PARQUET_PROFILES[profile_name])
+        profile["name"] = profile_name
+
+        if settings.parquet_compression:
+            profile["compression"] = settings.parquet_compression.lower()
+            profile["compression_level"] = None
+        if settings.parquet_row_group_size:
+            profile["row_group_size"] = settings.parquet_row_group_size
+
+        return profile
+
+    def _get_dictionary_columns(self, df: pd.DataFrame) -> List[str]:
+        """Find low-cardinality text columns that should be dictionary encoded."""
+        if df.empty:
+            return []
+
+        dictionary_columns = []
+        for col in df.columns:
+            series = df[col]
+            if not (
+                pd.api.types.is_object_dtype(series)
+                or pd.api.types.is_string_dtype(series)
+                or isinstance(series.dtype, pd.CategoricalDtype)
+            ):
+                continue
+
+            if series.nunique(dropna=True) <= len(df) * DICTIONARY_CARDINALITY_RATIO:
+                dictionary_columns.append(str(col))
+
+        return dictionary_columns
+
+    def _encode_dictionary_columns(
+        self, table: pa.Table, columns: List[str]
+    ) -> pa.Table:
+        """
+        Cast columns to Arrow dictionary type ahead of a Parquet write.
+
+        The writer dictionary-encodes every column anyway; the dictionary type
+        is stored in the file schema, so readers get categorical columns.
+        """
+        for col in columns:
+            index = table.schema.get_field_index(col)
+            if index < 0 or pa.types.is_dictionary(table.schema.field(index).type):
+                continue
+            table = table.set_column(index, col, pc.dictionary_encode(table[col]))
+
+        return table
+
+    def _write_parquet(
+        self, table_name: str, df: pd.DataFrame, parquet_path: Path
+    ) -> None:
+        """Write a prepared DataFrame using the configured Parquet profile."""
+        profile = self._get_parquet_profile()
+
+        # Sort on the table's key columns so min/max statistics prune row groups
+        sort_keys = []
+        if profile["sort"]:
+            sort_keys = [
+                col for col in PARQUET_SORT_KEYS.get(table_name, []) if col in df
+            ]
+            if sort_keys:
+                df = df.sort_values(sort_keys, kind="stable", ignore_index=True)
+
+        dictionary_columns = []
+        if profile["dictionary_columns"]:
+            dictionary_columns = self._get_dictionary_columns(df)
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = self._encode_dictionary_columns(table, dictionary_columns)
+
+        pq.write_table(
+            table,
+            parquet_path,
+            compression=profile["compression"],
+            compression_level=profile["compression_level"],
+            row_group_size=profile["row_group_size"],
+            use_dictionary=True,
+            write_statistics=True,
+            use_deprecated_int96_timestamps=False,
+        )
+
+        self.logger.info(
+            f"Parquet layout for {table_name}",
+            profile=profile["name"],
+            compression=profile["compression"],
+            row_group_size=profile["row_group_size"],
+            sort_keys=sort_keys,
+            dictionary_columns=dictionary_columns,
+        )
+
     def _save_sqlite(self, dataframes: Dict[str, pd.DataFrame]) -> List[ArtifactInfo]:
         """Save all DataFrames to SQLite database."""
         try:
@@ -264,7 +713,7 @@ class DataStorage:
                     continue
 
                 # Prepare DataFrame for SQLite
-                df_sqlite = df.copy()
+                df_sqlite = lazy_copy(df)
 
                 # Handle data types for SQLite
                 for col in df_sqlite.columns:
@@ -396,11 +845,14 @@ class DataStorage:
         """Clear all processed files to ensure fresh ETL run."""
         try:
             files_removed = 0
-            # Remove all files except .gitkeep
+            # Remove all files except .gitkeep, plus partitioned dataset folders
             for file_path in self.processed_folder.iterdir():
                 if file_path.is_file() and file_path.name != ".gitkeep":
                     file_path.unlink()
                     files_removed += 1
+                elif file_path.is_dir():
+                    shutil.rmtree(file_path)
+                    files_removed += 1
 
             self.logger.info("Cleared processed folder", files_removed=files_removed)
 
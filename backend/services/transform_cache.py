@@ -0,0 +1,234 @@
+"""Cache of transform results keyed by workbook content, sheets and options."""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from backend.core.config import settings
+from backend.core.logging import logger
+from backend.models.schemas import TransformOptions, TransformResponse
+
+# Module the transform runs from; it and every backend module it imports,
+# directly or indirectly, decide the outputs, so editing any of them changes
+# the pipeline version and invalidates every cached result
+PIPELINE_ENTRY_MODULE = "backend.api.routes_transform"
+
+# Settings that change the artifact set written by DataStorage
+OUTPUT_SETTINGS = [
+    "parquet_profile",
+    "parquet_compression",
+    "parquet_row_group_size",
+    "parquet_partition_by_plant",
+    "csv_compression",
+    "arrow_output",
+    "arrow_compression",
+    "chunk_size",
+]
+
+
+def pipeline_modules(entry_module: str = PIPELINE_ENTRY_MODULE) -> List[str]:
+    """
+    Source files of the backend modules the transform imports.
+
+    Follows the import statements from the entry module through every backend
+    module it reaches, so new pipeline stages are covered without a
+    hand-maintained list.
+
+    Args:
+        entry_module: Dotted name of the module to start from
+
+    Returns:
+        Sorted paths relative to the project root
+    """
+    root = Path(__file__).resolve().parents[2]
+    modules = set()
+    pending = [entry_module]
+
+    while pending:
+        name = pending.pop()
+        base = root.joinpath(*name.split("."))
+        # "from package import name" may name a module or an attribute
+        path = next(
+            (
+                candidate
+                for candidate in (base.with_suffix(".py"), base / "__init__.py")
+                if candidate.is_file()
+            ),
+            None,
+        )
+        if path is None:
+            continue
+
+        relative = path.relative_to(root).as_posix()
+        if relative in modules:
+            continue
+        modules.add(relative)
+
+        for node in ast.walk(ast.parse(path.read_bytes())):
+            if isinstance(node, ast.Import):
+                imported = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                imported = [node.module]
+                imported += [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            pending.extend(
+                module for module in imported if module.split(".")[0] == "backend"
+            )
+
+    return sorted(modules)
+
+
+def pipeline_version() -> str:
+    """SHA-256 over the transform pipeline sources and output settings."""
+    digest = hashlib.sha256()
+    root = Path(__file__).resolve().parents[2]
+
+    for module in pipeline_modules():
+        digest.update(module.encode("utf-8"))
+        digest.update((root / module).read_bytes())
+
+    output_settings = {name: getattr(settings, name) for name in OUTPUT_SETTINGS}
+    digest.update(json.dumps(output_settings, sort_keys=True).encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+class TransformCache:
+    """On-disk transform results (response plus artifacts), LRU under a byte budget."""
+
+    def __init__(self, cache_folder: Optional[Path] = None, max_bytes: int = 0):
+        """Initialize with the cache folder and its disk budget in bytes."""
+        self.cache_folder = cache_folder or settings.transform_cache_folder_path
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._pipeline_version = pipeline_version()
+        self._lock = threading.Lock()
+
+    def make_key(
+        self,
+        content_hash: str,
+        master_sheet: str,
+        status_sheet: str,
+        options: TransformOptions,
+    ) -> str:
+        """Build the key for a (workbook, sheets, options, pipeline version) run."""
+        canonical_options = options.model_dump()
+        # Exclusions are a set; their order has no effect on the outputs
+        canonical_options["excluded_date_cols"] = sorted(
+            set(canonical_options["excluded_date_cols"])
+        )
+
+        raw = json.dumps(
+            [
+                content_hash,
+                master_sheet,
+                status_sheet,
+                canonical_options,
+                self._pipeline_version,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, destination: Path) -> Optional[TransformResponse]:
+        """
+        Restore a cached result's artifacts into destination and return its response.
+
+        Args:
+            key: Cache key from make_key
+            destination: Folder the artifacts were originally written to
+
+        Returns:
+            The stored TransformResponse, or None on a miss
+        """
+        entry = self.cache_folder / key
+        response_path = entry / "response.json"
+
+        with self._lock:
+            if not response_path.exists():
+                return None
+
+            try:
+                response = TransformResponse.model_validate_json(
+                    response_path.read_text(encoding="utf-8")
+                )
+                shutil.copytree(entry / "artifacts", destination, dirs_exist_ok=True)
+            except Exception as e:
+                logger.warning(f"Discarding unreadable transform cache entry: {e}")
+                shutil.rmtree(entry, ignore_errors=True)
+                return None
+
+            # The response file's mtime records the last use for LRU eviction
+            os.utime(response_path)
+
+        return response
+
+    def put(self, key: str, response: TransformResponse, source: Path) -> None:
+        """
+        Store a successful response together with the artifacts in source.
+
+        Args:
+            key: Cache key from make_key
+            response: Response returned for the run
+            source: Folder holding the run's artifacts
+        """
+        if not response.success:
+            return
+
+        entry = self.cache_folder / key
+        staging = self.cache_folder / f".{key}.{uuid.uuid4().hex}.tmp"
+
+        try:
+            shutil.copytree(
+                source, staging / "artifacts", ignore=shutil.ignore_patterns(".gitkeep")
+            )
+            (staging / "response.json").write_text(
+                response.model_dump_json(), encoding="utf-8"
+            )
+
+            with self._lock:
+                shutil.rmtree(entry, ignore_errors=True)
+                staging.rename(entry)
+                self._evict()
+
+        except Exception as e:
+            logger.warning(f"Failed to persist transform cache entry: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its budget."""
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+
+        for entry, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            logger.info("Evicted transform cache entry", key=entry.name, bytes=size)
+
+    def _entries(self) -> List[Tuple[Path, float, int]]:
+        """Cached entries as (folder, last used, size in bytes), oldest first."""
+        entries = []
+        for entry in self.cache_folder.iterdir():
+            # Dot-prefixed folders are entries still being staged by put
+            response_path = entry / "response.json"
+            if entry.name.startswith(".") or not response_path.exists():
+                continue
+
+            size = sum(f.stat().st_size for f in entry.rglob("*") if f.is_file())
+            entries.append((entry, response_path.stat().st_mtime, size))
+
+        entries.sort(key=lambda item: item[1])
+        return entries
+
+
+# Global transform cache instance
+transform_cache = TransformCache(max_bytes=settings.transform_cache_max_bytes)
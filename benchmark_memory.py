@@ -0,0 +1,172 @@
+"""
+Transform Pipeline Memory Benchmark
+Measures the peak RSS of the MasterBOM, Status and storage stages on a
+synthetic workbook, optionally against a baseline git revision
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Project root whose backend is benchmarked (overridden by --source)
+project_root = Path(__file__).parent
+
+
+def build_frames(rows: int, plants: int):
+    """Synthetic MasterBOM and Status sheets as read from Excel."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    master = {"YAZAKI PN": [f"7{i:07d}" for i in rng.integers(0, rows * 3 // 4, rows)]}
+    for plant in range(plants):
+        master[f"P{plant} Plant"] = rng.choice(["X", "D", "0", None], rows)
+    master.update(
+        {
+            "Item Description": rng.choice(["wire", "clip", "terminal"], rows),
+            "Supplier Name": rng.choice(["ACME MA", "Foo GmbH", None], rows),
+            "FAR Status": rng.choice(["OK", "NOK", None], rows),
+            "Approved Date": rng.choice(["2024-01-05", "2024-03-17", None], rows),
+        }
+    )
+
+    status = pd.DataFrame(
+        {
+            "Project": [f"P{plant} Plant" for plant in range(plants)],
+            "OEM": rng.choice(["OEM A", "OEM B"], plants),
+            "Total Part Numbers": rng.integers(10, 500, plants),
+            "PSW Available": rng.integers(0, 10, plants),
+            "% PSW": [f"{value}%" for value in rng.integers(0, 100, plants)],
+        }
+    )
+
+    return pd.DataFrame(master).astype(object), status
+
+
+def run_benchmark(rows: int, plants: int) -> dict:
+    """Run each stage under a PeakRssSampler and report megabytes."""
+    sys.path.insert(0, str(project_root))
+
+    from backend.core.logging import ETLLogger
+    from backend.services.masterbom_rules import MasterBOMProcessor
+    from backend.services.stage_pipeline import PeakRssSampler
+    from backend.services.status_processor_v2 import StatusProcessorV2
+    from backend.services.storage import DataStorage
+
+    etl_logger = ETLLogger()
+    master_df, status_df = build_frames(rows, plants)
+    results = {"source": str(project_root), "rows": rows, "plants": plants}
+
+    def measure(name, func):
+        with PeakRssSampler() as sampler:
+            output = func()
+        results[name] = {
+            "start_mb": round(sampler.start / 2**20, 1),
+            "peak_mb": round(sampler.peak / 2**20, 1),
+            "growth_mb": round((sampler.peak - sampler.start) / 2**20, 1),
+        }
+        return output
+
+    tables = measure(
+        "masterbom", lambda: MasterBOMProcessor(master_df, etl_logger).process()
+    )
+    tables.update(
+        measure("status", lambda: StatusProcessorV2(status_df, etl_logger).process())
+    )
+
+    with tempfile.TemporaryDirectory() as output_folder:
+        storage = DataStorage(etl_logger, Path(output_folder))
+        measure("storage", lambda: storage.save_all_formats(tables))
+
+    return results
+
+
+def run_in_subprocess(source: Path, rows: int, plants: int) -> dict:
+    """Benchmark a source tree in a fresh interpreter so peaks don't mix."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "--source",
+            str(source),
+            "--rows",
+            str(rows),
+            "--plants",
+            str(plants),
+            "--json",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_report(reports: list):
+    """Print the per-stage growth and peak of each benchmarked tree."""
+    print("=" * 60)
+    print("TRANSFORM MEMORY BENCHMARK")
+    print("=" * 60)
+    for label, report in reports:
+        print(f"\n{label} ({report['rows']} rows, {report['plants']} plants):")
+        for stage in ("masterbom", "status", "storage"):
+            stats = report[stage]
+            print(
+                f"   {stage:<10} peak {stats['peak_mb']:>8} MB"
+                f"   growth {stats['growth_mb']:>8} MB"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    global project_root
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000, help="MasterBOM rows")
+    parser.add_argument("--plants", type=int, default=40, help="Plant columns")
+    parser.add_argument(
+        "--baseline",
+        help="Git revision to compare against, e.g. HEAD~1 (checked out to a "
+        "temporary worktree)",
+    )
+    parser.add_argument("--source", help=argparse.SUPPRESS)
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args()
+
+    if args.source:
+        project_root = Path(args.source)
+
+    if args.json:
+        # Logs go to stdout too, so the report is the last line
+        print(json.dumps(run_benchmark(args.rows, args.plants)))
+        return
+
+    if not args.baseline:
+        print_report([("current", run_benchmark(args.rows, args.plants))])
+        return
+
+    with tempfile.TemporaryDirectory() as worktree:
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", worktree, args.baseline],
+            cwd=project_root,
+            check=True,
+            capture_output=True,
+        )
+        try:
+            baseline = run_in_subprocess(Path(worktree), args.rows, args.plants)
+        finally:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", worktree],
+                cwd=project_root,
+                capture_output=True,
+            )
+
+    current = run_in_subprocess(project_root, args.rows, args.plants)
+    print_report([(args.baseline, baseline), ("current", current)])
+
+
+if __name__ == "__main__":
+    main()
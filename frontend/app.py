@@ -5,7 +5,16 @@ from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
-from flask import Flask, jsonify, render_template, request, send_file, session
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    render_template,
+    request,
+    send_file,
+    session,
+    stream_with_context,
+)
 
 # Load environment variables
 load_dotenv()
@@ -261,7 +270,9 @@ def get_backend_logs():
 def get_progress_status():
     """Get current ETL progress status via API proxy."""
     try:
-        response = requests.get(f"{FASTAPI_BASE_URL}/api/progress/status", timeout=10)
+        response = requests.get(
+            f"{FASTAPI_BASE_URL}/api/progress/status", params=request.args, timeout=10
+        )
         return jsonify(response.json())
     except requests.exceptions.RequestException as e:
         return jsonify({"error": f"Failed to fetch progress status: {str(e)}"}), 500
@@ -498,7 +509,9 @@ def download_csv_package(file_id):
 
         if PROCESSED_FOLDER.exists():
             for file_path in PROCESSED_FOLDER.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() == ".csv":
+                if file_path.is_file() and file_path.name.lower().endswith(
+                    (".csv", ".csv.gz", ".csv.zst")
+                ):
                     csv_files.append(file_path)
 
         if not csv_files:
@@ -798,7 +811,7 @@ def api_progress_status():
     """Proxy progress status request to FastAPI backend."""
     try:
         response = requests.get(
-            f"{FASTAPI_BASE_URL}/api/progress/status", timeout=10
+            f"{FASTAPI_BASE_URL}/api/progress/status", params=request.args, timeout=10
         )
         return jsonify(response.json()), response.status_code
     except requests.exceptions.Timeout:
@@ -809,6 +822,31 @@ def api_progress_status():
         return jsonify({"error": f"Failed to fetch status: {str(e)}", "status": "error"}), 500
 
 
+@app.route("/api/progress/<job_id>/events", methods=["GET"])
+def api_progress_events(job_id):
+    """Proxy a job's Server-Sent Events progress stream from FastAPI backend."""
+    headers = {}
+    if request.headers.get("Last-Event-ID"):
+        headers["Last-Event-ID"] = request.headers["Last-Event-ID"]
+
+    try:
+        upstream = requests.get(
+            f"{FASTAPI_BASE_URL}/api/progress/{job_id}/events",
+            headers=headers,
+            stream=True,
+            timeout=(10, None),
+        )
+    except requests.exceptions.RequestException as e:
+        return jsonify({"error": f"Network error: {str(e)}"}), 502
+
+    return Response(
+        stream_with_context(upstream.iter_content(chunk_size=None)),
+        status=upstream.status_code,
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.route("/api/transform", methods=["POST"])
 def api_transform():
     """Proxy ETL transform to FastAPI backend with debugging."""
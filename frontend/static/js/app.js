@@ -1766,6 +1766,7 @@ function completeProgress() {
 
 // Enhanced Progress Monitoring for Results Page
 let progressPollingInterval = null;
+let progressEventSource = null;
 
 function initializeDetailedProgress() {
     const progressSteps = document.getElementById('progress-steps');
@@ -1776,13 +1777,41 @@ function initializeDetailedProgress() {
 }
 
 function startProgressPolling() {
-    if (progressPollingInterval) {
-        clearInterval(progressPollingInterval);
+    stopProgressPolling();
+
+    // Prefer the pushed event stream; poll only where it is unavailable
+    const fileId = getCurrentFileId();
+    if (fileId && window.EventSource) {
+        progressEventSource = new EventSource(`/api/progress/${fileId}/events`);
+
+        progressEventSource.addEventListener('progress', (event) => {
+            const progressData = JSON.parse(event.data);
+            updateDetailedProgressDisplay(progressData);
+
+            if (['complete', 'error', 'cancelled'].includes(progressData.status)) {
+                stopProgressPolling();
+            }
+        });
+
+        progressEventSource.onerror = () => {
+            console.warn('Progress stream unavailable, falling back to polling');
+            stopProgressPolling();
+            startStatusPolling(fileId);
+        };
+        return;
     }
 
+    startStatusPolling(fileId);
+}
+
+function startStatusPolling(fileId) {
+    const statusUrl = fileId
+        ? `/api/progress/status?job_id=${encodeURIComponent(fileId)}`
+        : '/api/progress/status';
+
     progressPollingInterval = setInterval(async () => {
         try {
-            const response = await fetch('/api/progress/status');
+            const response = await fetch(statusUrl);
             const progressData = await response.json();
 
             if (progressData && progressData.status) {
@@ -1870,6 +1899,10 @@ function stopProgressPolling() {
         clearInterval(progressPollingInterval);
         progressPollingInterval = null;
     }
+    if (progressEventSource) {
+        progressEventSource.close();
+        progressEventSource = null;
+    }
 }
 
 // Download Functions for Organized Files
@@ -0,0 +1,132 @@
+"""Shared fixtures for the backend test suite."""
+
+import sys
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Make the backend package importable when pytest runs from any folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.core.config import settings  # noqa: E402
+from backend.core.logging import ETLLogger  # noqa: E402
+
+
+@pytest.fixture
+def etl_logger() -> ETLLogger:
+    """A fresh ETL logger."""
+    return ETLLogger()
+
+
+def build_masterbom_sheet(rows: int = 400, plants: int = 6, seed: int = 0):
+    """
+    Raw MasterBOM sheet as read from Excel, with repeated part numbers.
+
+    Args:
+        rows: Number of part rows
+        plants: Number of "P<n> Plant" project columns
+        seed: Random seed for the cell values
+
+    Returns:
+        DataFrame of object columns
+    """
+    rng = np.random.default_rng(seed)
+    sheet = {"YAZAKI PN": [f"7{i:07d}" for i in rng.integers(0, rows * 3 // 4, rows)]}
+    for plant in range(plants):
+        sheet[f"P{plant} Plant"] = rng.choice(["X", "D", "0", None], rows)
+    sheet.update(
+        {
+            "Item Description": rng.choice(["wire", "clip", "terminal"], rows),
+            "Supplier Name": rng.choice(["ACME MA", "Foo GmbH", None], rows),
+            "FAR Status": rng.choice(["OK", "NOK", None], rows),
+            "Approved Date": rng.choice(["2024-01-05", "2024-03-17", None], rows),
+        }
+    )
+    return pd.DataFrame(sheet).astype(object)
+
+
+@pytest.fixture
+def masterbom_sheet() -> pd.DataFrame:
+    """A small raw MasterBOM sheet with duplicate part rows."""
+    return build_masterbom_sheet()
+
+
+def build_status_sheet() -> pd.DataFrame:
+    """Raw Status sheet with a few projects and their completion percentages."""
+    return pd.DataFrame(
+        {
+            "Project": ["EV_YMOK", "Plant A1 & Plant B2", "SOLO"],
+            "OEM": ["OEM A", "OEM B", "OEM C"],
+            "1st PPAP Milestone": ["2024-05-01", "2024-06-15", None],
+            "Total Part Numbers": ["100", "40", "12"],
+            "% PSW": ["50%", "100%", "0.25"],
+        }
+    )
+
+
+def write_workbook(path: Path, sheets: dict) -> Path:
+    """
+    Write sheets to an .xlsx workbook the way users upload them.
+
+    Args:
+        path: Workbook path
+        sheets: Sheet name to DataFrame, written with a header row and no index
+
+    Returns:
+        The workbook path
+    """
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+    return path
+
+
+@pytest.fixture
+def upload_folder(tmp_path, monkeypatch) -> Path:
+    """Upload folder holding test workbooks, also seen by worker processes."""
+    folder = tmp_path / "uploads"
+    folder.mkdir()
+    monkeypatch.setattr(settings, "upload_folder", str(folder))
+    monkeypatch.setenv("UPLOAD_FOLDER", str(folder))
+    return folder
+
+
+@pytest.fixture
+def upload_workbook(upload_folder):
+    """Function uploading a workbook of {sheet name: DataFrame}, giving its ID."""
+
+    def upload(sheets: dict) -> str:
+        file_id = str(uuid.uuid4())
+        write_workbook(upload_folder / f"{file_id}.xlsx", sheets)
+        return file_id
+
+    return upload
+
+
+@pytest.fixture
+def workbook_id(upload_workbook, masterbom_sheet) -> str:
+    """File ID of an uploaded workbook with MasterBOM and Status sheets."""
+    return upload_workbook(
+        {"MasterBOM": masterbom_sheet, "Status": build_status_sheet()}
+    )
+
+
+@pytest.fixture
+def processed_folder(tmp_path, monkeypatch) -> Path:
+    """Processed folder the transform writes its artifacts to."""
+    folder = tmp_path / "processed"
+    folder.mkdir()
+    monkeypatch.setattr(settings, "processed_folder", str(folder))
+    return folder
+
+
+def read_folder(folder: Path) -> dict:
+    """Contents of every file below a folder, by relative path."""
+    return {
+        path.relative_to(folder).as_posix(): path.read_bytes()
+        for path in sorted(folder.rglob("*"))
+        if path.is_file()
+    }
@@ -0,0 +1,59 @@
+"""Tests for the batch transform endpoint."""
+
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from backend.api.routes_batch import transform_batch
+from backend.core.config import settings
+from backend.models.schemas import BatchTransformRequest, TransformRequest
+
+
+@pytest.fixture
+def batch_folder(tmp_path, monkeypatch):
+    """Batch output folder of the test."""
+    folder = tmp_path / "batches"
+    monkeypatch.setattr(settings, "batch_output_folder", str(folder))
+    monkeypatch.setenv("BATCH_OUTPUT_FOLDER", str(folder))
+    monkeypatch.setattr(settings, "batch_workers", 2)
+    return folder
+
+
+def test_failing_job_is_isolated_from_the_batch(
+    workbook_id, upload_workbook, masterbom_sheet, batch_folder
+):
+    # A second workbook without the Status sheet the job asks for
+    broken_id = upload_workbook({"MasterBOM": masterbom_sheet})
+    request = BatchTransformRequest(
+        jobs=[
+            TransformRequest(
+                file_id=file_id, master_sheet="MasterBOM", status_sheet="Status"
+            )
+            for file_id in (workbook_id, broken_id)
+        ],
+        consolidate=True,
+    )
+
+    response = asyncio.run(transform_batch(request))
+
+    good, bad = response.jobs
+    assert not response.success
+    assert good.success and good.artifacts and good.error is None
+    assert not bad.success and "Status" in bad.error
+
+    # The manifest on disk is the response
+    manifest = json.loads(
+        (batch_folder / response.batch_id / "manifest.json").read_text()
+    )
+    assert manifest == json.loads(response.model_dump_json())
+
+    # Only the successful job is consolidated, tagged with its batch source
+    consolidated = {
+        artifact.name: artifact for artifact in response.consolidated_artifacts
+    }
+    fact_parts = pd.read_parquet(consolidated["fact_parts.parquet"].path)
+    own = pd.read_parquet(f"{good.output_folder}/fact_parts.parquet")
+    assert (fact_parts["source_file_id"] == f"000_{workbook_id}").all()
+    pd.testing.assert_frame_equal(fact_parts.drop(columns="source_file_id"), own)
@@ -0,0 +1,97 @@
+"""Tests for the shared cleaning helpers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.cleaning import create_row_hash
+
+
+@pytest.fixture
+def parts() -> pd.DataFrame:
+    """Rows of mixed text, numbers, dates and missing cells."""
+    return pd.DataFrame(
+        {
+            "part": ["7000123", "7000456", "7000789", "7000123"],
+            "qty": [1, 2, 3, 1],
+            "supplier": ["ACME MA", None, "Foo GmbH", "ACME MA"],
+            "approved": pd.to_datetime(
+                ["2024-01-05", None, "2024-03-17", "2024-01-05"]
+            ),
+        }
+    )
+
+
+def test_row_hash_ignores_column_order(parts):
+    reordered = parts[["approved", "supplier", "qty", "part"]]
+
+    pd.testing.assert_series_equal(create_row_hash(parts), create_row_hash(reordered))
+
+
+def test_row_hash_depends_on_column_names(parts):
+    renamed = parts.rename(columns={"qty": "quantity"})
+
+    assert (create_row_hash(parts) != create_row_hash(renamed)).all()
+
+
+def test_row_hash_treats_missing_values_alike():
+    missing = [None, np.nan, pd.NaT, pd.NA]
+    frame = pd.DataFrame({"cell": pd.Series(missing, dtype=object)})
+
+    assert create_row_hash(frame).nunique() == 1
+
+
+def test_row_hash_is_independent_of_dtype():
+    frames = [
+        pd.DataFrame({"id": [1, 2, 30]}),
+        pd.DataFrame({"id": [1.0, 2.0, 30.0]}),
+        pd.DataFrame({"id": ["1", "2", "30"]}),
+        pd.DataFrame({"id": pd.Series(["1", "2.0", "30"], dtype=object)}),
+        pd.DataFrame({"id": pd.Series([1, "2", 30.0], dtype=object)}),
+        pd.DataFrame({"id": pd.Series(["1", "2", "30"], dtype="category")}),
+    ]
+
+    hashes = [create_row_hash(frame).tolist() for frame in frames]
+
+    assert all(row_hashes == hashes[0] for row_hashes in hashes)
+
+
+def test_row_hash_keeps_text_that_only_looks_numeric():
+    frame = pd.DataFrame({"id": ["007", "7", "1e3", " 7", "7.", "1000"]})
+
+    assert create_row_hash(frame).nunique() == len(frame)
+
+
+def test_row_hash_separates_dates_numbers_and_text():
+    stamp = pd.Timestamp("2024-01-05")
+    frame = pd.DataFrame(
+        {"cell": pd.Series([stamp, stamp.value, str(stamp)], dtype=object)}
+    )
+
+    assert create_row_hash(frame).nunique() == 3
+
+
+def test_row_hash_widths_and_digest(parts):
+    fast = create_row_hash(parts)
+    wide = create_row_hash(parts, bits=128)
+    digest = create_row_hash(parts, digest="sha256")
+
+    assert fast.dtype == np.uint64
+    assert wide.str.fullmatch("[0-9a-f]{32}").all()
+    assert digest.str.fullmatch("[0-9a-f]{64}").all()
+    # The first lane of a 128-bit fingerprint is the 64-bit one
+    assert (wide.str[:16].map(lambda text: int(text, 16)) == fast).all()
+
+    # Every width finds the same duplicate rows
+    for hashes in (fast, wide, digest):
+        assert hashes.duplicated().tolist() == [False, False, False, True]
+
+    # Digests are stable across runs and dtypes
+    assert digest.equals(create_row_hash(parts.astype(object), digest="sha256"))
+
+
+def test_row_hash_rejects_bad_options(parts):
+    with pytest.raises(ValueError):
+        create_row_hash(parts, bits=32)
+    with pytest.raises(ValueError):
+        create_row_hash(parts, digest="not-a-hash")
@@ -0,0 +1,105 @@
+"""Tests for the incremental MasterBOM transform."""
+
+import pandas as pd
+import pytest
+
+from backend.core.config import settings
+from backend.services.incremental import MASTERBOM_TABLES, IncrementalTransform
+from backend.services.masterbom_rules import MasterBOMProcessor
+from tests.conftest import build_masterbom_sheet
+
+
+@pytest.fixture(autouse=True)
+def always_merge(monkeypatch):
+    """Merge changed parts however many there are."""
+    monkeypatch.setattr(settings, "incremental_max_changed_ratio", 1.0)
+
+
+def edit_sheet(sheet: pd.DataFrame) -> pd.DataFrame:
+    """Change, add and remove part rows, including rows of repeated parts."""
+    edited = sheet.copy()
+    part_ids = edited["YAZAKI PN"]
+    repeated = part_ids[part_ids.duplicated()].iloc[0]
+    single = part_ids[~part_ids.duplicated(keep=False)].iloc[0]
+    removed = part_ids[~part_ids.duplicated(keep=False)].iloc[1]
+
+    edited.loc[part_ids == repeated, "P0 Plant"] = "D"
+    edited.loc[part_ids == single, "Supplier Name"] = "New Supplier MA"
+    edited = edited[edited["YAZAKI PN"] != removed]
+
+    added = sheet.iloc[[3, 7]].assign(**{"YAZAKI PN": ["79999998", "79999999"]})
+    return pd.concat([edited.iloc[:50], added, edited.iloc[50:]], ignore_index=True)
+
+
+def test_incremental_run_matches_full_run(masterbom_sheet, etl_logger, tmp_path):
+    transform = IncrementalTransform(
+        etl_logger, "workbook", "MasterBOM", state_root=tmp_path
+    )
+    _, first_stats = transform.process(MasterBOMProcessor(masterbom_sheet, etl_logger))
+    assert first_stats["mode"] == "full"
+
+    edited = edit_sheet(masterbom_sheet)
+    merged, stats = transform.process(MasterBOMProcessor(edited, etl_logger))
+    full = MasterBOMProcessor(edited, etl_logger).process()
+
+    assert stats["mode"] == "incremental"
+    assert 0 < stats["parts_recomputed"] < len(full["fact_parts"])
+    for table in MASTERBOM_TABLES:
+        pd.testing.assert_frame_equal(merged[table], full[table])
+
+
+def test_unchanged_sheet_recomputes_nothing(masterbom_sheet, etl_logger, tmp_path):
+    transform = IncrementalTransform(
+        etl_logger, "workbook", "MasterBOM", state_root=tmp_path
+    )
+    transform.process(MasterBOMProcessor(masterbom_sheet, etl_logger))
+
+    merged, stats = transform.process(MasterBOMProcessor(masterbom_sheet, etl_logger))
+    full = MasterBOMProcessor(masterbom_sheet, etl_logger).process()
+
+    assert stats == {"mode": "incremental", "parts_recomputed": 0}
+    for table in MASTERBOM_TABLES:
+        pd.testing.assert_frame_equal(merged[table], full[table])
+
+
+def test_workbooks_keep_separate_state(etl_logger, tmp_path):
+    sheets = {key: build_masterbom_sheet(seed=seed) for seed, key in enumerate("ab")}
+
+    def run(key: str) -> dict:
+        transform = IncrementalTransform(etl_logger, key, "MasterBOM", tmp_path)
+        return transform.process(MasterBOMProcessor(sheets[key], etl_logger))[1]
+
+    assert run("a")["mode"] == "full"
+    assert run("b")["mode"] == "full"
+    # Alternating between the workbooks still reuses each one's own state
+    assert run("a") == {"mode": "incremental", "parts_recomputed": 0}
+    assert run("b") == {"mode": "incremental", "parts_recomputed": 0}
+    assert not list(tmp_path.rglob("*.pkl"))
+
+
+def test_least_recently_used_state_is_evicted(masterbom_sheet, etl_logger, tmp_path):
+    def transform(key: str) -> IncrementalTransform:
+        return IncrementalTransform(
+            etl_logger, key, "MasterBOM", tmp_path, max_entries=2
+        )
+
+    for key in ("a", "b", "c"):
+        transform(key).process(MasterBOMProcessor(masterbom_sheet, etl_logger))
+
+    assert not transform("a").state_folder.exists()
+    assert transform("b").state_folder.exists()
+    assert transform("c").state_folder.exists()
+
+
+def test_changed_parts_follow_row_occurrence():
+    previous = pd.DataFrame(
+        {"part_id_std": ["A", "A", "B", "C"], "row_hash": [1, 2, 3, 4]}
+    )
+    # A's rows swap places, B is unchanged, C is gone and D is new
+    current = pd.DataFrame(
+        {"part_id_std": ["A", "B", "A", "D"], "row_hash": [2, 3, 1, 5]}
+    )
+
+    changed = IncrementalTransform._find_changed_parts(previous, current)
+
+    assert changed == {"A", "C", "D"}
@@ -0,0 +1,28 @@
+"""Tests for the MasterBOM processor."""
+
+import pandas as pd
+import pytest
+
+from backend.services.masterbom_rules import MasterBOMProcessor
+
+
+# One project column per chunk, and two columns per chunk for the test sheet
+@pytest.mark.parametrize("memory_budget", [1, 512 * 1024])
+def test_chunked_plant_item_status_matches_single_melt(
+    masterbom_sheet, etl_logger, memory_budget
+):
+    expected = MasterBOMProcessor(
+        masterbom_sheet, etl_logger, memory_budget=0
+    ).process()
+    result = MasterBOMProcessor(
+        masterbom_sheet, etl_logger, memory_budget=memory_budget
+    ).process()
+
+    spills = [
+        message["data"]
+        for message in etl_logger.messages
+        if message["message"] == "Spilled plant-item-status chunks to Parquet"
+    ]
+    assert len(spills) == 1 and spills[0]["chunks"] > 1
+    for table in ("plant_item_status", "fact_parts", "masterbom_clean"):
+        pd.testing.assert_frame_equal(result[table], expected[table])
@@ -0,0 +1,81 @@
+"""Tests for the sheet profile cache."""
+
+import os
+import threading
+
+import pytest
+
+from backend.models.schemas import ProfileResponse
+from backend.services.profile_cache import ProfileCache
+
+
+def make_profile(sheet_name: str) -> ProfileResponse:
+    """A minimal profile that identifies its sheet."""
+    return ProfileResponse(
+        sheet_name=sheet_name,
+        total_rows=1,
+        total_cols=0,
+        duplicate_rows=0,
+        columns=[],
+    )
+
+
+def age(path, seconds: int) -> None:
+    """Move a file's last use into the past."""
+    stat = path.stat()
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+@pytest.fixture
+def cache_folder(tmp_path):
+    return tmp_path / "profile_cache"
+
+
+def test_hit_miss_and_disk_reload(cache_folder):
+    cache = ProfileCache(cache_folder, max_entries=4)
+    key = cache.make_key("content", "Sheet")
+
+    assert cache.get(key) is None
+
+    cache.put(key, make_profile("Sheet"))
+    assert cache.get(key).sheet_name == "Sheet"
+
+    # A fresh instance has an empty memory LRU and reads the JSON store
+    reloaded = ProfileCache(cache_folder, max_entries=4)
+    assert reloaded.get(key) == make_profile("Sheet")
+    assert reloaded.get(cache.make_key("content", "Other")) is None
+
+
+def test_disk_store_evicts_least_recently_used(cache_folder):
+    cache = ProfileCache(cache_folder, max_entries=1, max_disk_entries=2)
+
+    cache.put("a", make_profile("a"))
+    age(cache_folder / "a.json", 300)
+    cache.put("b", make_profile("b"))
+    age(cache_folder / "b.json", 200)
+
+    # A disk hit refreshes "a", so "b" is now the least recently used
+    cache._entries.clear()
+    assert cache.get("a") is not None
+
+    cache.put("c", make_profile("c"))
+
+    assert sorted(p.name for p in cache_folder.iterdir()) == ["a.json", "c.json"]
+    cache._entries.clear()
+    assert cache.get("b") is None
+
+
+def test_concurrent_puts_of_one_key_leave_one_entry(cache_folder):
+    cache = ProfileCache(cache_folder)
+    threads = [
+        threading.Thread(target=cache.put, args=("key", make_profile(f"s{i}")))
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [p.name for p in cache_folder.iterdir()] == ["key.json"]
+    cache._entries.clear()
+    assert cache.get("key").sheet_name.startswith("s")
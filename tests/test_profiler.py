@@ -0,0 +1,100 @@
+"""Tests for the sheet profiler."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.profiler import DataProfiler
+
+
+@pytest.fixture
+def mixed_sheet() -> pd.DataFrame:
+    """Columns of every dtype the profiler meets, with missing values."""
+    rows = 60
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "int_with_nulls": pd.Series([1, None, 3, 4, 5] * 12, dtype=object),
+            "ints": np.arange(rows),
+            "floats": rng.random(rows),
+            "float_with_nulls": [1.0, np.nan] * (rows // 2),
+            "text": pd.Series(["a", None, "b", "c", "d"] * 12, dtype=object),
+            "str": pd.Series(["a", None, "b", "c", "d"] * 12, dtype="str"),
+            "bools": [True, False] * (rows // 2),
+            "bool_with_nulls": pd.Series([True, None] * (rows // 2), dtype=object),
+            "dates": pd.to_datetime(["2024-01-05", None] * (rows // 2)),
+            "date_text": pd.Series(["2024-01-05", None] * (rows // 2), dtype=object),
+            "date_objects": pd.Series(
+                [pd.Timestamp("2024-01-01"), None] * (rows // 2), dtype=object
+            ),
+            "category": pd.Series(["x", "y"] * (rows // 2)).astype("category"),
+            "nullable_ints": pd.Series([1, None] * (rows // 2), dtype="Int64"),
+            "ints_and_floats": pd.Series([1, 2.5, None, 3, 4] * 12, dtype=object),
+            "ints_and_text": pd.Series([1, "a", None, 3, "b"] * 12, dtype=object),
+            "empty": pd.Series([None] * rows, dtype=object),
+        }
+    )
+
+
+def test_columnar_pass_matches_per_column_profiles(mixed_sheet):
+    profiler = DataProfiler(mixed_sheet, "Sheet", workers=1)
+
+    profile = profiler.profile_sheet()
+
+    # One profile per column, in column order, as profiling each one alone
+    expected = [profiler.profile_column(col) for col in mixed_sheet.columns]
+    assert [p.model_dump_json() for p in profile.columns] == [
+        p.model_dump_json() for p in expected
+    ]
+    assert profile.total_rows == len(mixed_sheet)
+    assert profile.total_cols == len(mixed_sheet.columns)
+
+
+@pytest.mark.parametrize("approximate", [False, True])
+def test_parallel_profiles_match_in_process(mixed_sheet, approximate):
+    names = [str(col) for col in mixed_sheet.columns]
+
+    in_process = DataProfiler(mixed_sheet, "Sheet", approximate, workers=1)
+    parallel = DataProfiler(mixed_sheet, "Sheet", approximate, workers=2)
+
+    expected = [p.model_dump_json() for p in in_process._profile_columns(names)]
+    actual = [p.model_dump_json() for p in parallel._profile_columns_parallel()]
+    assert actual == expected
+
+
+def test_duplicate_rows_match_brute_force():
+    rng = np.random.default_rng(1)
+    sheet = pd.DataFrame(
+        {
+            "part": rng.integers(0, 40, 500).astype(str),
+            "plant": rng.choice(["X", "D", None], 500),
+            "qty": rng.integers(0, 3, 500),
+            "blank": None,
+        },
+        # Repeated index labels must not matter
+        index=np.repeat(np.arange(250), 2),
+    )
+
+    count, groups = DataProfiler(sheet, "Sheet").find_duplicate_rows(top_n=1000)
+
+    compared = sheet.drop(columns="blank").reset_index(drop=True)
+    assert count == compared.duplicated().sum()
+
+    # Every duplicate group, with its size and the position of its first row
+    is_duplicate = compared.duplicated(keep=False)
+    expected = (
+        compared[is_duplicate]
+        .groupby(list(compared.columns), dropna=False, sort=False)
+        .apply(lambda group: (group.index[0], len(group)), include_groups=False)
+    )
+    assert sorted((g.first_row, g.count) for g in groups) == sorted(expected)
+    assert [g.count for g in groups] == sorted((g.count for g in groups), reverse=True)
+
+    first = groups[0]
+    assert first.values == compared.iloc[first.first_row].dropna().to_dict()
+
+
+def test_duplicate_rows_survive_unhashable_cells():
+    sheet = pd.DataFrame({"cell": pd.Series([[1], [1], [2]], dtype=object)})
+
+    assert DataProfiler(sheet, "Sheet").find_duplicate_rows() == (0, [])
@@ -0,0 +1,71 @@
+"""Tests for progressive sheet profiles refined in the background."""
+
+import time
+
+import pandas as pd
+import pytest
+
+from backend.api import routes_profile
+from backend.services.profile_cache import ProfileCache
+from backend.services.profile_refiner import ProfileRefiner
+
+
+@pytest.fixture
+def progressive(tmp_path, monkeypatch, upload_workbook):
+    """Request a progressive profile of a sheet too large to profile at once."""
+    monkeypatch.setattr(routes_profile, "profile_refiner", ProfileRefiner())
+    monkeypatch.setattr(
+        routes_profile, "profile_cache", ProfileCache(tmp_path / "profile_cache")
+    )
+    for name in ("SAMPLE_HEAD_ROWS", "SAMPLE_TAIL_ROWS", "SAMPLE_BLOCK_COUNT"):
+        monkeypatch.setattr(routes_profile, name, 2)
+    monkeypatch.setattr(routes_profile, "SAMPLE_BLOCK_SIZE", 2)
+
+    sheet = pd.DataFrame({"Part": [f"P{i}" for i in range(40)], "Qty": range(40)})
+    file_id = upload_workbook({"Parts": sheet})
+
+    def request():
+        return routes_profile.profile_sheet(
+            file_id=file_id, sheet="Parts", mode="progressive"
+        )
+
+    return request
+
+
+def wait_for_refinement(request):
+    """Repeat the request until the refinement is no longer running."""
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        profile = request()
+        if profile.refinement_status != "running":
+            return profile
+        time.sleep(0.05)
+    raise AssertionError("refinement did not finish")
+
+
+def test_refined_profile_replaces_the_estimate(progressive):
+    estimate = progressive()
+    assert estimate.is_estimate
+    assert estimate.refinement_status == "running"
+
+    profile = wait_for_refinement(progressive)
+    assert not profile.is_estimate
+    assert profile.refinement_status is None
+    assert profile.total_rows == 40
+
+
+def test_failed_refinement_is_reported_then_retried(progressive, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("profiling failed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(routes_profile, "_profile_frame", fail)
+        assert progressive().refinement_status == "running"
+
+        failed = wait_for_refinement(progressive)
+        assert failed.is_estimate
+        assert failed.refinement_status == "failed"
+
+    # The failure was reported once; the next request starts a new refinement
+    assert progressive().refinement_status == "running"
+    assert not wait_for_refinement(progressive).is_estimate
@@ -0,0 +1,97 @@
+"""Tests for the read-only SQL engine over processed outputs."""
+
+import pandas as pd
+import pytest
+
+from backend.services.query_engine import QueryEngine, QueryError, QueryTimeoutError
+
+# Statement timeout for queries that are expected to finish
+TIMEOUT_SECONDS = 10
+
+
+@pytest.fixture
+def engine(tmp_path) -> QueryEngine:
+    """An engine over a processed folder holding one small Parquet table."""
+    pd.DataFrame({"part": [f"P{i}" for i in range(10)], "qty": range(10)}).to_parquet(
+        tmp_path / "parts.parquet"
+    )
+    return QueryEngine(tmp_path)
+
+
+def test_select_returns_rows(engine):
+    result, truncated, _ = engine.execute(
+        "SELECT part FROM parts WHERE qty >= 8 ORDER BY qty",
+        limit=5,
+        timeout_seconds=TIMEOUT_SECONDS,
+    )
+
+    assert result.column("part").to_pylist() == ["P8", "P9"]
+    assert not truncated
+
+
+def test_limit_truncates(engine):
+    result, truncated, _ = engine.execute(
+        "SELECT * FROM parts", limit=3, timeout_seconds=TIMEOUT_SECONDS
+    )
+
+    assert result.num_rows == 3
+    assert truncated
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT count(*) AS n FROM parts -- trailing comment",
+        "SELECT count(*) AS n FROM parts;",
+        "SELECT count(*) AS n FROM parts\n-- comment\n;",
+    ],
+)
+def test_trailing_comments_and_semicolons(engine, sql):
+    result, _, _ = engine.execute(sql, limit=5, timeout_seconds=TIMEOUT_SECONDS)
+
+    assert result.column("n").to_pylist() == [10]
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "",
+        "DELETE FROM parts",
+        "CREATE TABLE t AS SELECT 1",
+        "COPY parts TO 'out.csv'",
+        "SELECT 1; SELECT 2",
+        "SET threads = 1",
+        "ATTACH 'other.db'",
+    ],
+)
+def test_rejects_anything_but_one_select(engine, sql):
+    with pytest.raises(QueryError):
+        engine.execute(sql, limit=5, timeout_seconds=TIMEOUT_SECONDS)
+
+
+def test_cannot_read_files_outside_processed_folder(engine, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside") / "secret.csv"
+    outside.write_text("secret\n42\n")
+
+    with pytest.raises(QueryError):
+        engine.execute(
+            f"SELECT * FROM read_csv('{outside.as_posix()}')",
+            limit=5,
+            timeout_seconds=TIMEOUT_SECONDS,
+        )
+
+
+def test_timeout_interrupts_query(engine):
+    with pytest.raises(QueryTimeoutError):
+        engine.execute(
+            "SELECT count(*) FROM range(100000000) a, range(100000000) b",
+            limit=1,
+            timeout_seconds=0.2,
+        )
+
+
+def test_no_tables_is_an_error(tmp_path):
+    with pytest.raises(QueryError):
+        QueryEngine(tmp_path / "missing").execute(
+            "SELECT 1", limit=1, timeout_seconds=TIMEOUT_SECONDS
+        )
@@ -0,0 +1,67 @@
+"""Accuracy tests for the profiling sketches."""
+
+import numpy as np
+import pytest
+
+from backend.services.sketches import HyperLogLog, KLLSketch
+
+
+@pytest.mark.parametrize("precision", [4, 10, 14, 18])
+@pytest.mark.parametrize("distinct", [1_000, 200_000])
+def test_hyperloglog_estimate_within_error(precision, distinct):
+    rng = np.random.default_rng(precision)
+    hashes = rng.integers(0, 2**64, distinct, dtype=np.uint64)
+
+    sketch = HyperLogLog(precision)
+    # Repeats and batch boundaries do not change the estimate
+    for batch in np.array_split(np.concatenate([hashes, hashes[::3]]), 7):
+        sketch.update(batch)
+
+    error = abs(sketch.count() - distinct) / distinct
+    assert error <= 3 * sketch.relative_error
+
+
+@pytest.mark.parametrize("precision", [4, 11, 18])
+def test_hyperloglog_rank_of_long_remainders(precision):
+    value_bits = 64 - precision
+    sketch = HyperLogLog(precision)
+
+    # All remaining bits set: the leftmost 1-bit is the first one
+    sketch.update(np.array([2**value_bits - 1], dtype=np.uint64))
+    assert sketch.registers[0] == 1
+
+    # One bit short of that must not be rounded up into the same rank
+    sketch = HyperLogLog(precision)
+    sketch.update(np.array([2 ** (value_bits - 1) - 1], dtype=np.uint64))
+    assert sketch.registers[0] == 2
+
+
+def test_hyperloglog_rejects_bad_precision():
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_kll_quantiles_within_rank_error(seed):
+    rng = np.random.default_rng(seed)
+    values = rng.permutation(200_000).astype(np.float64)
+    fractions = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+    sketch = KLLSketch(seed=seed)
+    for batch in np.array_split(values, 50):
+        sketch.update(batch)
+
+    estimates = sketch.quantiles(fractions)
+    for fraction in fractions:
+        # Values are 0..n-1, so a value's rank is value / n
+        rank = estimates[fraction] / len(values)
+        assert abs(rank - fraction) <= sketch.rank_error
+
+
+def test_kll_ignores_nan_and_keeps_small_inputs_exact():
+    sketch = KLLSketch()
+    sketch.update([3.0, np.nan, 1.0, 2.0])
+
+    assert sketch.count == 3
+    assert sketch.quantiles([0.0, 0.5, 1.0]) == {0.0: 1.0, 0.5: 2.0, 1.0: 3.0}
+    assert KLLSketch().quantiles([0.5]) == {0.5: None}
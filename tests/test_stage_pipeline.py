@@ -0,0 +1,197 @@
+"""Tests for the declarative stage pipeline."""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from backend.services.stage_pipeline import (
+    PipelineCancelled,
+    StageError,
+    StageMemo,
+    StagePipeline,
+)
+
+
+@pytest.fixture
+def events():
+    """(stage, state) events in the order the pipeline reported them."""
+    return []
+
+
+def make_pipeline(etl_logger, events, memo=None, max_workers=4):
+    """A pipeline recording its stage events."""
+    lock = threading.Lock()
+
+    def on_event(stage, state, share):
+        with lock:
+            events.append((stage, state))
+
+    return StagePipeline(
+        etl_logger, max_workers=max_workers, memo=memo, on_event=on_event
+    )
+
+
+def add_diamond(pipeline, calls):
+    """Stages a -> (b, c) -> d, counting how often each one runs."""
+
+    def stage(name, result):
+        def run(**inputs):
+            calls[name] = calls.get(name, 0) + 1
+            return result(**inputs)
+
+        return run
+
+    # Registered out of order; the pipeline orders them by their inputs
+    pipeline.add_stage(
+        "d", stage("d", lambda b, c: {"d": b + c}), ["b", "c"], ["d"], memoize=True
+    )
+    pipeline.add_stage(
+        "b", stage("b", lambda a: {"b": a * 2}), ["a"], ["b"], memoize=True
+    )
+    pipeline.add_stage(
+        "c", stage("c", lambda a: {"c": a + 1}), ["a"], ["c"], memoize=True
+    )
+    pipeline.add_stage(
+        "a", stage("a", lambda x: {"a": x * 10}), ["x"], ["a"], memoize=True
+    )
+
+
+def test_stages_run_after_their_inputs(etl_logger, events):
+    pipeline = make_pipeline(etl_logger, events)
+    add_diamond(pipeline, {})
+
+    results = pipeline.run({"x": 1})
+
+    assert results["d"] == (10 * 2) + (10 + 1)
+    completed = [stage for stage, state in events if state == "completed"]
+    started = [stage for stage, state in events if state == "started"]
+    for stage, inputs in {"b": ["a"], "c": ["a"], "d": ["b", "c"]}.items():
+        for upstream in inputs:
+            assert completed.index(upstream) < started.index(stage)
+    assert sorted(m.name for m in pipeline.metrics) == ["a", "b", "c", "d"]
+
+
+def test_invalid_graphs_are_rejected(etl_logger, events):
+    pipeline = make_pipeline(etl_logger, events)
+    pipeline.add_stage("a", lambda b: {"a": b}, ["b"], ["a"])
+    pipeline.add_stage("b", lambda a: {"b": a}, ["a"], ["b"])
+    with pytest.raises(StageError, match="cycle"):
+        pipeline.run({})
+
+    pipeline = make_pipeline(etl_logger, events)
+    pipeline.add_stage("a", lambda x: {"a": x}, ["x"], ["a"])
+    with pytest.raises(StageError, match="produced more than once"):
+        pipeline.run({"x": 1, "a": 2})
+
+    pipeline = make_pipeline(etl_logger, events)
+    pipeline.add_stage("a", lambda y: {"a": y}, ["y"], ["a"])
+    with pytest.raises(StageError, match="no producer"):
+        pipeline.run({"x": 1})
+
+    with pytest.raises(StageError, match="already registered"):
+        pipeline.add_stage("a", lambda y: {"a": y}, ["y"], ["a"])
+    assert events == []
+
+
+def test_failing_stage_stops_the_pipeline(etl_logger, events):
+    pipeline = make_pipeline(etl_logger, events, max_workers=1)
+
+    def fail(x):
+        raise ValueError("bad sheet")
+
+    pipeline.add_stage("a", fail, ["x"], ["a"])
+    pipeline.add_stage("b", lambda a: {"b": a}, ["a"], ["b"])
+
+    with pytest.raises(StageError, match="Stage 'a' failed: bad sheet"):
+        pipeline.run({"x": 1})
+    assert ("a", "failed") in events
+    assert ("b", "started") not in events
+
+
+def test_memo_reuses_stages_with_the_same_input_lineage(etl_logger, events):
+    memo = StageMemo(max_entries=16)
+    calls = {}
+
+    def run(x, fingerprints=None):
+        pipeline = make_pipeline(etl_logger, events, memo=memo)
+        add_diamond(pipeline, calls)
+        results = pipeline.run({"x": x}, fingerprints=fingerprints)
+        return results["d"], {m.name: m.memoized for m in pipeline.metrics}
+
+    assert run(1) == (31, {"a": False, "b": False, "c": False, "d": False})
+    assert run(1) == (31, {"a": True, "b": True, "c": True, "d": True})
+    assert calls == {"a": 1, "b": 1, "c": 1, "d": 1}
+
+    # A different input misses the memo all the way down
+    assert run(2)[1] == {"a": False, "b": False, "c": False, "d": False}
+
+    # Given fingerprints replace the value's own, e.g. a workbook content hash
+    assert run(3, fingerprints={"x": "workbook"})[0] == 91
+    assert run(1, fingerprints={"x": "workbook"})[0] == 91
+
+
+def test_unmemoized_upstream_stage_disables_the_memo(etl_logger, events):
+    memo = StageMemo(max_entries=16)
+    calls = {}
+
+    for _ in range(2):
+        pipeline = make_pipeline(etl_logger, events, memo=memo)
+        pipeline.add_stage("a", lambda x: {"a": x}, ["x"], ["a"])
+
+        def b(a):
+            calls["b"] = calls.get("b", 0) + 1
+            return {"b": a}
+
+        pipeline.add_stage("b", b, ["a"], ["b"], memoize=True)
+        pipeline.run({"x": 1})
+
+    # Outputs of "a" have no fingerprint, so "b" cannot be looked up
+    assert calls == {"b": 2}
+
+
+def test_tables_are_never_fingerprinted(etl_logger, events):
+    memo = StageMemo(max_entries=16)
+    pipeline = make_pipeline(etl_logger, events, memo=memo)
+    pipeline.add_stage("rows", lambda df: {"rows": len(df)}, ["df"], ["rows"], True)
+
+    pipeline.run({"df": pd.DataFrame({"a": [1]})})
+
+    assert not pipeline.metrics[0].memoized
+    assert memo.get("anything") is None and not memo._entries
+
+
+def test_memo_is_bounded(etl_logger):
+    memo = StageMemo(max_entries=2)
+    for key in ("a", "b", "c"):
+        memo.put(key, {"value": key})
+    assert memo.get("a") is None and memo.get("c") == {"value": "c"}
+
+    frame = pd.DataFrame({"a": range(1000)})
+    memo = StageMemo(max_entries=8, max_bytes=10)
+    memo.put("frame", {"df": frame})
+    assert memo.get("frame") is None
+
+    assert StageMemo().get("a") is None and not StageMemo().enabled
+
+
+def test_checkpoint_cancels_before_the_next_stage(etl_logger, events):
+    cancel = threading.Event()
+
+    def checkpoint():
+        if cancel.is_set():
+            raise PipelineCancelled("stopped")
+
+    pipeline = make_pipeline(etl_logger, events, max_workers=1)
+    pipeline.checkpoint = checkpoint
+
+    def a(x):
+        cancel.set()
+        return {"a": x}
+
+    pipeline.add_stage("a", a, ["x"], ["a"])
+    pipeline.add_stage("b", lambda a: {"b": a}, ["a"], ["b"])
+
+    with pytest.raises(PipelineCancelled):
+        pipeline.run({"x": 1})
+    assert ("b", "started") not in events
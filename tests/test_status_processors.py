@@ -0,0 +1,236 @@
+"""Tests for the Status sheet processors."""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.status_processor_v2 import StatusProcessorV2
+from backend.services.status_rules import COMPLETION_RECORD_COLUMNS, StatusProcessor
+
+
+@pytest.fixture
+def status_sheet() -> pd.DataFrame:
+    """Raw Status sheet covering plant patterns, separators and a blank row."""
+    return pd.DataFrame(
+        {
+            "Project": [
+                "EV_YMOK",
+                "Plant A1 & Plant B2",
+                "ALPHA-BETA",
+                "SOLO",
+                None,
+                "EV_YMOK",
+            ],
+            "OEM": ["OEM A", "OEM B", "OEM C", None, None, "OEM A"],
+            "1st PPAP Milestone": [
+                "2024-05-01",
+                "2024-06-15",
+                None,
+                "not set",
+                None,
+                "2024-07-01",
+            ],
+            "Total Part Numbers": ["100", "40", "12.0", None, None, "5"],
+            "% PSW": ["50%", "100%", "0.25", "done", None, "10"],
+            "% Drawing": ["80", "n/a", None, "in progress", None, None],
+        }
+    )
+
+
+def test_completion_by_plant_records(status_sheet, etl_logger):
+    completion = StatusProcessor(status_sheet, etl_logger).process()[
+        "project_completion_by_plant"
+    ]
+
+    # Same records as the row-by-row implementation the extraction replaced
+    assert completion.columns.tolist() == COMPLETION_RECORD_COLUMNS
+    assert completion["project_name"].tolist() == [
+        "Ev_Ymok",
+        "Plant A1 & Plant B2",
+        "Plant A1 & Plant B2",
+        "Alpha-Beta",
+        "Alpha-Beta",
+        "Solo",
+    ]
+    assert completion["plant_id"].tolist() == [
+        "YMOK",
+        "A1",
+        "B2",
+        "ALPHA",
+        "BETA",
+        "Solo",
+    ]
+    assert completion["plant_name"].tolist() == [
+        "Plant_YMOK",
+        "Plant_A1",
+        "Plant_B2",
+        "Plant_ALPHA",
+        "Plant_BETA",
+        "Solo",
+    ]
+    assert completion["completion_status"].tolist() == [
+        "Near Complete",
+        "Not Started",
+        "Not Started",
+        "Unknown",
+        "Unknown",
+        "Unknown",
+    ]
+    assert completion["milestone_date"].tolist() == [
+        date(2024, 5, 1),
+        date(2024, 6, 15),
+        date(2024, 6, 15),
+        None,
+        None,
+        None,
+    ]
+    np.testing.assert_array_equal(
+        completion["total_parts"].to_numpy(dtype=float),
+        [100.0, 40.0, 40.0, 12.0, 12.0, np.nan],
+    )
+    np.testing.assert_array_equal(
+        completion["drawing_completion_pct"].to_numpy(dtype=float),
+        [0.8, 0.0, 0.0, np.nan, np.nan, np.nan],
+    )
+
+
+def test_completion_without_project_column(status_sheet, etl_logger):
+    sheet = status_sheet.drop(columns="Project").rename(columns={"OEM": "Maker"})
+
+    completion = StatusProcessor(sheet, etl_logger).process()[
+        "project_completion_by_plant"
+    ]
+
+    assert completion["project_name"].tolist() == [
+        "Project_0",
+        "Project_1",
+        "Project_2",
+        "Project_3",
+        "Project_5",
+    ]
+    assert completion["oem"].tolist() == ["Unknown"] * 5
+
+
+# Percentage cells in the formats found in Status sheets
+PERCENTAGE_CELLS = [
+    "85%",
+    " 42 % ",
+    "0.5",
+    "1",
+    "100",
+    "150",
+    "-5",
+    "12,5%",
+    "0,75",
+    "Complete",
+    "done",
+    "N/A",
+    "none",
+    "abc",
+    "",
+    None,
+    np.nan,
+    85,
+    0.25,
+    1.5,
+]
+
+
+def percentage_cells(dtype) -> pd.Series:
+    """PERCENTAGE_CELLS as mixed objects, or as text like read_sheet returns."""
+    if dtype == "str":
+        return pd.Series(
+            [None if pd.isna(value) else str(value) for value in PERCENTAGE_CELLS],
+            dtype="str",
+        )
+    return pd.Series(PERCENTAGE_CELLS, dtype=object)
+
+
+def reference_v1_percentage(value):
+    """StatusProcessor's former per-cell percentage rule."""
+    if pd.isna(value):
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    text = text.replace("%", "")
+    try:
+        number = float(text)
+        return number / 100.0 if number > 1 else number
+    except ValueError:
+        if text.lower() in ["complete", "done", "finished", "100"]:
+            return 1.0
+        if text.lower() in ["none", "n/a", "na", "not available", "0"]:
+            return 0.0
+        return None
+
+
+def reference_v2_percentage(value):
+    """StatusProcessorV2's former per-cell percentage rule."""
+    if pd.isna(value):
+        return np.nan
+    text = str(value).strip()
+    if not text:
+        return np.nan
+    text = text.replace(",", ".").replace("%", "")
+    try:
+        number = float(text)
+        if 1 < number <= 100:
+            number = number / 100.0
+        return max(0.0, min(1.0, number))
+    except ValueError:
+        return np.nan
+
+
+@pytest.mark.parametrize("dtype", [object, "str"])
+def test_v1_percentages_match_per_cell_rule(etl_logger, dtype):
+    cells = percentage_cells(dtype)
+
+    parsed = StatusProcessor(pd.DataFrame(), etl_logger)._parse_percentage_values(
+        cells
+    )
+
+    expected = [reference_v1_percentage(value) for value in cells]
+    np.testing.assert_array_equal(
+        parsed.to_numpy(dtype=float), np.array(expected, dtype=float)
+    )
+
+
+@pytest.mark.parametrize("dtype", [object, "str"])
+def test_v2_percentages_match_per_cell_rule(etl_logger, dtype):
+    cells = percentage_cells(dtype)
+
+    parsed = StatusProcessorV2(pd.DataFrame(), etl_logger)._parse_percentage_column(
+        cells
+    )
+
+    expected = [reference_v2_percentage(value) for value in cells]
+    np.testing.assert_array_equal(
+        parsed.to_numpy(dtype=float), np.array(expected, dtype=float)
+    )
+
+
+def test_processors_agree_on_plain_percentages(etl_logger):
+    cells = pd.Series(["0%", "12%", "50%", "99.5%", "100%", "0.3", "1"])
+
+    v1 = StatusProcessor(pd.DataFrame(), etl_logger)._parse_percentage_values(cells)
+    v2 = StatusProcessorV2(pd.DataFrame(), etl_logger)._parse_percentage_column(cells)
+
+    np.testing.assert_allclose(v1.to_numpy(dtype=float), v2.to_numpy(dtype=float))
+
+
+def test_v2_whitespace_row_does_not_truncate_sheet(etl_logger):
+    sheet = pd.DataFrame(
+        {
+            "Project": ["EV_YMOK", "  ", "SOLO", "ALPHA", None, "AFTER"],
+            "OEM": ["OEM A", "  ", "OEM B", "OEM C", None, "OEM D"],
+        }
+    )
+    processor = StatusProcessorV2(sheet, etl_logger)
+
+    processor._clean_and_prepare_data()
+
+    # The spacer row is dropped, the all-NaN row still ends the table
+    assert processor.df["Project"].tolist() == ["EV_YMOK", "SOLO", "ALPHA"]
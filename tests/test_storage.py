@@ -0,0 +1,204 @@
+"""Round-trip tests for the processed output formats."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from backend.core.config import settings
+from backend.services.storage import PARQUET_SORT_KEYS, DataStorage
+
+
+@pytest.fixture
+def storage(tmp_path, etl_logger) -> DataStorage:
+    """Storage writing to a folder of the test."""
+    return DataStorage(etl_logger, tmp_path / "processed")
+
+
+@pytest.fixture
+def plant_item_status() -> pd.DataFrame:
+    """A plant_item_status table in sheet order, with missing values."""
+    rows = 3000
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "part_id_std": [f"7{i:07d}" for i in rng.integers(0, 900, rows)],
+            "project_plant": rng.choice(["P0", "P1", "P2"], rows),
+            "raw_status": rng.choice(["X", "D", None], rows),
+            "description": [f"part {i}" for i in range(rows)],
+            "quantity": rng.integers(0, 50, rows),
+            "completion_pct": rng.choice(["50", "75.5", None], rows),
+            "approved_date": rng.choice(["2024-01-05", "2024-03-17", None], rows),
+        }
+    ).astype({"raw_status": object, "completion_pct": object, "approved_date": object})
+
+
+def as_written(df: pd.DataFrame, read: pd.DataFrame) -> pd.DataFrame:
+    """A table read back, with categorical columns cast to the written dtypes."""
+    return read.astype(
+        {
+            col: df[col].dtype
+            for col in read.columns
+            if isinstance(read[col].dtype, pd.CategoricalDtype)
+        }
+    )
+
+
+@pytest.mark.parametrize("profile", ["default", "optimized", "compact"])
+def test_parquet_profiles_round_trip(storage, plant_item_status, profile, monkeypatch):
+    monkeypatch.setattr(settings, "parquet_profile", profile)
+    monkeypatch.setattr(settings, "parquet_row_group_size", 1000)
+    prepared = storage._prepare_columnar_frame("plant_item_status", plant_item_status)
+
+    (artifact,) = storage._save_parquet("plant_item_status", prepared)
+
+    expected = prepared
+    if profile != "default":
+        expected = prepared.sort_values(
+            PARQUET_SORT_KEYS["plant_item_status"], kind="stable", ignore_index=True
+        )
+    read = pd.read_parquet(artifact.path)
+    pd.testing.assert_frame_equal(as_written(prepared, read), expected)
+    assert artifact.row_count == len(plant_item_status)
+
+    parquet_file = pq.ParquetFile(artifact.path)
+    assert parquet_file.metadata.num_row_groups == 3
+    column = parquet_file.metadata.row_group(0).column(0)
+    assert column.compression == ("ZSTD" if profile == "compact" else "SNAPPY")
+    assert column.statistics.has_min_max
+
+    # Low-cardinality text is stored as dictionary columns in the optimized layouts
+    dictionary = pa.types.is_dictionary(
+        parquet_file.schema_arrow.field("raw_status").type
+    )
+    assert dictionary == (profile != "default")
+
+
+def test_columnar_types_are_prepared_once(storage, plant_item_status):
+    prepared = storage._prepare_columnar_frame("plant_item_status", plant_item_status)
+
+    assert pd.api.types.is_datetime64_any_dtype(prepared["approved_date"])
+    assert pd.api.types.is_float_dtype(prepared["completion_pct"])
+    assert pd.api.types.is_string_dtype(prepared["raw_status"])
+    # The source table is left as it was
+    assert plant_item_status["approved_date"].dtype == object
+
+
+def test_plant_partitioned_dataset_round_trip(storage, plant_item_status, monkeypatch):
+    monkeypatch.setattr(settings, "parquet_partition_by_plant", True)
+    prepared = storage._prepare_columnar_frame("plant_item_status", plant_item_status)
+
+    artifacts = storage._save_parquet("plant_item_status", prepared)
+
+    dataset = {a.format: a for a in artifacts}["Parquet Dataset"]
+    folder = storage.processed_folder / "plant_item_status"
+    assert dataset.path == str(folder)
+    assert sorted(p.name for p in folder.iterdir()) == [
+        "project_plant=P0",
+        "project_plant=P1",
+        "project_plant=P2",
+    ]
+
+    # Each partition holds its plant's rows; the plant comes back from the path
+    read = pq.read_table(folder, partitioning="hive").to_pandas()
+    assert isinstance(read["project_plant"].dtype, pd.CategoricalDtype)
+    keys = ["project_plant", "part_id_std", "description"]
+    pd.testing.assert_frame_equal(
+        as_written(prepared, read)[prepared.columns]
+        .sort_values(keys)
+        .reset_index(drop=True),
+        prepared.sort_values(keys).reset_index(drop=True),
+    )
+
+    # Rewriting replaces the dataset instead of adding files to it
+    storage._save_parquet("plant_item_status", prepared.head(10))
+    assert pq.read_table(folder, partitioning="hive").num_rows == 10
+
+
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4"])
+def test_arrow_ipc_round_trip(storage, plant_item_status, compression, monkeypatch):
+    monkeypatch.setattr(settings, "arrow_compression", compression)
+    monkeypatch.setattr(settings, "chunk_size", 100)
+    prepared = storage._prepare_columnar_frame("plant_item_status", plant_item_status)
+
+    (artifact,) = storage._save_arrow("plant_item_status", prepared)
+
+    table = storage.load_table("plant_item_status")
+    pd.testing.assert_frame_equal(table.to_pandas(), prepared)
+    assert artifact.row_count == table.num_rows == len(prepared)
+
+    # Written in record batches of CHUNK_SIZE * 10 rows
+    reader = pa.ipc.open_file(artifact.path)
+    assert reader.num_record_batches == 3
+
+
+def test_load_table_falls_back_to_parquet(storage, plant_item_status):
+    prepared = storage._prepare_columnar_frame("plant_item_status", plant_item_status)
+    storage._save_parquet("status_clean", prepared)
+
+    assert storage.load_table("status_clean").num_rows == len(prepared)
+    with pytest.raises(FileNotFoundError):
+        storage.load_table("fact_parts")
+
+
+def baseline_csv(df: pd.DataFrame) -> str:
+    """CSV text as written before streaming: datetimes as dates, one to_csv call."""
+    df = df.copy()
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].dt.strftime("%Y-%m-%d")
+    return df.to_csv(index=False)
+
+
+@pytest.fixture
+def dated_table(plant_item_status) -> pd.DataFrame:
+    """A table with datetime columns, one of them carrying times of day."""
+    return plant_item_status.assign(
+        approved_date=pd.to_datetime(plant_item_status["approved_date"]),
+        updated_at=pd.Timestamp("2024-05-01 13:45:10")
+        + pd.to_timedelta(np.arange(len(plant_item_status)), unit="min"),
+    )
+
+
+@pytest.mark.parametrize(
+    "compression, suffix",
+    [("none", ".csv"), ("gzip", ".csv.gz"), ("zstd", ".csv.zst")],
+)
+def test_streamed_csv_round_trip(
+    storage, dated_table, compression, suffix, monkeypatch
+):
+    monkeypatch.setattr(settings, "csv_compression", compression)
+    # Several batches, the last one short
+    monkeypatch.setattr(settings, "chunk_size", 700)
+
+    (artifact,) = storage._save_csv("plant_item_status", dated_table)
+
+    assert artifact.path.endswith(f"plant_item_status{suffix}")
+    assert artifact.compression == (None if compression == "none" else compression)
+    text = pd.read_csv(artifact.path, dtype=str, keep_default_na=False).to_csv(
+        index=False
+    )
+    assert text == baseline_csv(dated_table)
+    assert artifact.uncompressed_size_bytes == len(text.encode("utf-8"))
+    assert artifact.row_count == len(dated_table)
+
+
+def test_csv_dates_are_written_without_times(storage, dated_table):
+    (artifact,) = storage._save_csv("plant_item_status", dated_table)
+
+    read = pd.read_csv(artifact.path)
+    assert read["updated_at"].iloc[0] == "2024-05-01"
+    assert set(read["approved_date"].dropna()) == {"2024-01-05", "2024-03-17"}
+
+
+def test_csv_falls_back_to_gzip_without_zstandard(storage, dated_table, monkeypatch):
+    monkeypatch.setattr(settings, "csv_compression", "zstd")
+    monkeypatch.setattr("backend.services.storage.zstandard", None)
+
+    (artifact,) = storage._save_csv("plant_item_status", dated_table)
+
+    assert artifact.compression == "gzip"
+    assert artifact.path.endswith(".csv.gz")
+    read = pd.read_csv(artifact.path, dtype=str, keep_default_na=False)
+    assert read.to_csv(index=False) == baseline_csv(dated_table)
@@ -0,0 +1,167 @@
+"""Tests for the transform endpoint."""
+
+import asyncio
+import threading
+
+import pandas as pd
+import pytest
+
+from backend.api import routes_transform
+from backend.core.config import settings
+from backend.models.schemas import TransformOptions, TransformRequest
+from backend.services.progress import progress_bus
+from backend.services.storage import DataStorage
+from backend.services.transform_cache import TransformCache
+from tests.conftest import build_status_sheet, read_folder
+
+
+@pytest.fixture
+def transform(workbook_id, processed_folder, monkeypatch):
+    """Function running a transform of the test workbook with given options."""
+    monkeypatch.setattr(settings, "transform_cache_enabled", False)
+
+    def run(job_id=None, **options):
+        request = TransformRequest(
+            file_id=workbook_id,
+            master_sheet="MasterBOM",
+            status_sheet="Status",
+            options=TransformOptions(**options),
+            job_id=job_id,
+        )
+        return routes_transform.transform_data(request)
+
+    return run
+
+
+def test_progress_events_follow_the_stages(transform, workbook_id):
+    response = transform(job_id="progress-job")
+    assert response.success
+
+    events = progress_bus.history("progress-job")
+    assert [e.sequence for e in events] == sorted(e.sequence for e in events)
+    assert events[-1].status == "complete" and events[-1].progress == 100
+
+    started = {e.stage: e.status for e in events if e.stage is not None}
+    assert started == routes_transform.STAGE_STATUS
+    assert all(0 <= e.progress <= 100 for e in events)
+
+    # The file scope follows the same job
+    assert progress_bus.history(workbook_id) == events
+    assert progress_bus.latest(workbook_id) == events[-1]
+
+
+def test_failed_transform_publishes_an_error(transform, monkeypatch):
+    def fail(*args, **kwargs):
+        raise ValueError("unreadable status sheet")
+
+    monkeypatch.setattr(routes_transform, "_process_status", fail)
+    response = transform(job_id="failing-job")
+
+    assert not response.success
+    latest = progress_bus.latest("failing-job")
+    assert latest.status == "error"
+    assert latest.description == response.error
+
+
+def test_cancelled_job_leaves_no_partial_outputs(
+    transform, processed_folder, monkeypatch
+):
+    (processed_folder / "fact_parts.csv").write_text("left by an earlier run")
+    cancelled = threading.Event()
+    save_all_formats = DataStorage.save_all_formats
+
+    def save_then_cancel(self, tables):
+        artifacts = save_all_formats(self, tables)
+        asyncio.run(routes_transform.cancel_transform("cancelled-job"))
+        cancelled.set()
+        return artifacts
+
+    def dictionary_after_cancel(storage, tables):
+        # Still running when the pipeline reaches its next checkpoint
+        cancelled.wait(timeout=30)
+        return []
+
+    monkeypatch.setattr(DataStorage, "save_all_formats", save_then_cancel)
+    monkeypatch.setattr(routes_transform, "_create_dictionary", dictionary_after_cancel)
+
+    response = transform(job_id="cancelled-job")
+
+    assert not response.success
+    assert "cancelled by request" in response.error
+    assert progress_bus.latest("cancelled-job").status == "cancelled"
+    assert list(processed_folder.iterdir()) == []
+    assert "cancelled-job" not in routes_transform.job_registry.running()
+
+
+def test_job_over_its_time_budget_is_stopped(transform, processed_folder, monkeypatch):
+    monkeypatch.setattr(settings, "transform_timeout_seconds", 1e-9)
+
+    response = transform(job_id="slow-job")
+
+    assert not response.success
+    assert "time budget" in response.error
+    assert list(processed_folder.iterdir()) == []
+
+
+def test_dry_run_writes_nothing(transform, processed_folder, tmp_path, monkeypatch):
+    assert transform().success
+    outputs = read_folder(processed_folder)
+
+    state_folder = tmp_path / "incremental_state"
+    monkeypatch.setattr(settings, "incremental_state_folder", str(state_folder))
+    monkeypatch.setattr(settings, "transform_cache_enabled", True)
+    cache = TransformCache(tmp_path / "transform_cache", 10**9)
+    monkeypatch.setattr(routes_transform, "transform_cache", cache)
+
+    response = transform(dry_run=True, sample_rows=50, incremental=True)
+
+    assert response.success and response.dry_run
+    assert response.artifacts == []
+    assert set(response.previews) == set(routes_transform.OUTPUT_TABLES)
+    assert response.previews["masterbom_clean"].row_count <= 50
+    assert response.summary.masterbom_mode == "full"
+
+    # The earlier outputs, incremental state and result cache are untouched
+    assert read_folder(processed_folder) == outputs
+    assert not state_folder.exists() or not any(state_folder.iterdir())
+    assert list(cache.cache_folder.iterdir()) == []
+
+
+def test_column_projection_matches_the_full_read(
+    upload_workbook, masterbom_sheet, processed_folder, monkeypatch
+):
+    monkeypatch.setattr(settings, "transform_cache_enabled", False)
+    # Columns the rules never read, only passed through to masterbom_clean
+    remarks = {f"Remark {i}": f"note {i}" for i in range(5)}
+    file_id = upload_workbook(
+        {"MasterBOM": masterbom_sheet.assign(**remarks), "Status": build_status_sheet()}
+    )
+
+    def run(column_projection):
+        request = TransformRequest(
+            file_id=file_id,
+            master_sheet="MasterBOM",
+            status_sheet="Status",
+            options=TransformOptions(column_projection=column_projection),
+        )
+        assert routes_transform.transform_data(request).success
+        return {
+            table: pd.read_parquet(processed_folder / f"{table}.parquet")
+            for table in routes_transform.OUTPUT_TABLES
+        }
+
+    full = run(False)
+    projected = run(True)
+
+    for table in routes_transform.OUTPUT_TABLES:
+        if table != "masterbom_clean":
+            pd.testing.assert_frame_equal(projected[table], full[table])
+
+    # masterbom_clean keeps the columns the rules read; duplicates are judged
+    # over those columns only
+    kept = projected["masterbom_clean"].columns.drop("is_duplicate_entry")
+    assert not any(str(col).startswith("Remark") for col in kept)
+    assert set(remarks) <= set(full["masterbom_clean"].columns)
+    pd.testing.assert_frame_equal(
+        projected["masterbom_clean"][kept], full["masterbom_clean"][kept]
+    )
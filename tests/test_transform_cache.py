@@ -0,0 +1,130 @@
+"""Tests for the transform result cache."""
+
+import os
+
+import pytest
+
+from backend.api import routes_transform
+from backend.models.schemas import (
+    ArtifactInfo,
+    TransformOptions,
+    TransformRequest,
+    TransformResponse,
+    TransformSummary,
+)
+from backend.services.transform_cache import TransformCache
+from tests.conftest import read_folder
+
+
+def make_response(success: bool = True) -> TransformResponse:
+    """A transform response listing one artifact."""
+    return TransformResponse(
+        success=success,
+        artifacts=[
+            ArtifactInfo(
+                name="fact_parts.csv", path="fact_parts.csv", format="csv", size_bytes=4
+            )
+        ],
+        summary=TransformSummary(
+            total_parts=1,
+            active_parts=1,
+            inactive_parts=0,
+            new_parts=0,
+            duplicate_parts=0,
+            plants_detected=1,
+            duplicates_removed=0,
+            date_columns_processed=[],
+            processing_time_seconds=0.1,
+        ),
+        messages=[],
+    )
+
+
+def make_run(folder, content: str):
+    """A processed folder holding the artifacts of one run."""
+    folder.mkdir()
+    (folder / "fact_parts.csv").write_text(content)
+    (folder / "plants").mkdir()
+    (folder / "plants" / "part-0.parquet").write_bytes(content.encode() * 10)
+    return folder
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TransformCache(tmp_path / "cache", max_bytes=1024 * 1024)
+
+
+def test_hit_restores_the_artifacts(cache, tmp_path):
+    source = make_run(tmp_path / "run", "a,b\n")
+    destination = tmp_path / "processed"
+
+    assert cache.get("key", destination) is None
+    assert not destination.exists()
+
+    cache.put("key", make_response(), source)
+    restored = cache.get("key", destination)
+
+    assert restored == make_response()
+    assert read_folder(destination) == read_folder(source)
+
+
+def test_failed_runs_are_not_cached(cache, tmp_path):
+    source = make_run(tmp_path / "run", "a,b\n")
+
+    cache.put("key", make_response(success=False), source)
+
+    assert cache.get("key", tmp_path / "processed") is None
+
+
+def test_least_recently_used_entries_are_evicted(cache, tmp_path):
+    for name in ("a", "b"):
+        cache.put(name, make_response(), make_run(tmp_path / name, name * 100))
+        # Make the last use of each entry distinct and in put order
+        response_path = cache.cache_folder / name / "response.json"
+        mtime = response_path.stat().st_mtime - (300 if name == "a" else 200)
+        os.utime(response_path, (mtime, mtime))
+
+    entry_bytes = sum(size for _, _, size in cache._entries()) // 2
+    cache.max_bytes = 2 * entry_bytes
+
+    # A hit refreshes "a", so adding "c" evicts "b"
+    assert cache.get("a", tmp_path / "restored") is not None
+    cache.put("c", make_response(), make_run(tmp_path / "c", "c" * 100))
+
+    assert cache.get("b", tmp_path / "restored") is None
+    assert sorted(p.name for p in cache.cache_folder.iterdir()) == ["a", "c"]
+
+
+def test_key_covers_workbook_sheets_and_options(cache):
+    options = TransformOptions(excluded_date_cols=["B", "A"])
+    key = cache.make_key("content", "MasterBOM", "Status", options)
+
+    # Exclusions are a set
+    reordered = TransformOptions(excluded_date_cols=["A", "B", "A"])
+    assert cache.make_key("content", "MasterBOM", "Status", reordered) == key
+
+    assert cache.make_key("other", "MasterBOM", "Status", options) != key
+    assert cache.make_key("content", "Master", "Status", options) != key
+    changed = TransformOptions(excluded_date_cols=["A", "B"], id_col="PN")
+    assert cache.make_key("content", "MasterBOM", "Status", changed) != key
+
+
+def test_repeated_transform_is_served_from_the_cache(
+    workbook_id, processed_folder, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        routes_transform, "transform_cache", TransformCache(tmp_path / "cache", 10**9)
+    )
+    request = TransformRequest(
+        file_id=workbook_id, master_sheet="MasterBOM", status_sheet="Status"
+    )
+
+    first = routes_transform.transform_data(request)
+    outputs = read_folder(processed_folder)
+    second = routes_transform.transform_data(request)
+
+    assert first.success and not first.cached
+    assert second.cached
+    assert second.artifacts == first.artifacts
+    assert second.summary == first.summary
+    assert read_folder(processed_folder) == outputs